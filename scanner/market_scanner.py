@@ -40,6 +40,7 @@ from enum import Enum
 
 # Import shared StructureAnalysis from v6
 from trader.structure import StructureAnalysis
+from trader.indicators.technical import TechnicalAnalysis
 from trader.infrastructure.data_provider import MarketDataProvider
 
 # 標記模組可用
@@ -368,12 +369,6 @@ class MarketScanner:
             df['rsi'] = ta.rsi(df['close'], length=14)
             df['atr'] = ta.atr(df['high'], df['low'], df['close'], length=14)
             df['vol_ma'] = ta.sma(df['volume'], length=20)
-            adx_data = ta.adx(df['high'], df['low'], df['close'], length=14)
-            if adx_data is not None and not adx_data.empty:
-                if isinstance(adx_data, pd.DataFrame):
-                    adx_cols = [col for col in adx_data.columns if col.startswith('ADX')]
-                    if adx_cols:
-                        df['adx'] = adx_data[adx_cols[0]]
         else:
             # 純 pandas 備用計算
             df['ema_20'] = df['close'].ewm(span=20, adjust=False).mean()
@@ -393,17 +388,10 @@ class MarketScanner:
                 (df['low'] - df['close'].shift()).abs()
             ], axis=1).max(axis=1)
             df['atr'] = tr.rolling(window=14).mean()
-            # ADX
-            plus_dm = df['high'].diff()
-            minus_dm = -df['low'].diff()
-            plus_dm = plus_dm.where((plus_dm > minus_dm) & (plus_dm > 0), 0.0)
-            minus_dm = minus_dm.where((minus_dm > plus_dm) & (minus_dm > 0), 0.0)
-            atr14 = tr.rolling(window=14).mean()
-            plus_di = 100 * (plus_dm.rolling(window=14).mean() / atr14.replace(0, np.nan))
-            minus_di = 100 * (minus_dm.rolling(window=14).mean() / atr14.replace(0, np.nan))
-            dx = (plus_di - minus_di).abs() / (plus_di + minus_di).replace(0, np.nan) * 100
-            df['adx'] = dx.rolling(window=14).mean()
-        
+
+        # ADX：兩條路徑共用 Numba Wilder kernel
+        df['adx'] = TechnicalAnalysis.extract_adx_series(df, length=14)
+
         # ATR 百分比
         df['atr_percent'] = (df['atr'] / df['close']) * 100
         
@@ -11,13 +11,15 @@ V6.0 主引擎 — 終極滾倉版
 import sys
 import os
 import time
-import json
 import signal
+import threading
 import logging
 import logging.handlers
+import random
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 # 確保從專案根目錄 import v6 package
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -26,14 +28,19 @@ import ccxt
 import pandas as pd
 
 # 基礎設施層
-from trader.infrastructure.api_client import BinanceFuturesClient
+from trader.infrastructure.api_client import (
+    BinanceFuturesClient, exchange_symbol_id, get_futures_session, json_loads, response_json,
+)
 from trader.infrastructure.notifier import TelegramNotifier
 from trader.infrastructure.telegram_handler import TelegramCommandHandler
 from trader.infrastructure.data_provider import MarketDataProvider
 from trader.infrastructure.performance_db import PerformanceDB
+from trader.infrastructure.user_stream import UserDataStream
+from trader.infrastructure.market_stream import MarketDataCache, timeframe_to_ms
 # 技術指標層
 from trader.indicators.technical import (
     TechnicalAnalysis,
+    IndicatorCache,
     DynamicThresholdManager,
     MTFConfirmation,
     MarketFilter,
@@ -45,11 +52,15 @@ from trader.execution.order_engine import OrderExecutionEngine
 from trader.config import ConfigV6 as Config
 from trader.positions import PositionManager
 from trader.persistence import PositionPersistence
-from trader.signals import detect_2b_with_pivots, detect_ema_pullback, detect_volume_breakout
+from trader.signals import detect_2b_with_pivots, scan_fast_signals
 from trader.strategies.base import Action
+from trader.strategies.v7_structure import V7StructureStrategy
+from trader.structure import StructureAnalysis
 
 logger = logging.getLogger(__name__)
 
+_UNSET = object()  # 惰性計算哨兵（None 是合法結果時用）
+
 
 def _trade_log(fields: dict):
     """Emit structured [TRADE] log line for log_summarizer.py"""
@@ -60,7 +71,23 @@ def _trade_log(fields: dict):
 class TradingBotV6:
     """V6.0 終極滾倉版交易機器人"""
 
+    # BTC 趨勢過濾用的 K 線 (symbol, timeframe, limit)
+    _BTC_TREND_KEY = ("BTC/USDT", "1d", 60)
+
+    # 同一標的多個信號時的優先級（數字小者優先）與 Tier 排名
+    _SIGNAL_PRIORITY = {'2B': 1, 'VOLUME_BREAKOUT': 2, 'EMA_PULLBACK': 3}
+    _TIER_RANK = {'A': 3, 'B': 2, 'C': 1}
+
+    # 循環間等待的分段長度：SIGUSR1 只設旗標，主執行緒每段醒來檢查一次（最多延遲這麼久）
+    _REFRESH_POLL_SECONDS = 0.5
+
+    @classmethod
+    def _signal_rank(cls, found: Tuple[str, Dict]) -> int:
+        """(signal_type, details) 的排序鍵；未知類型排最後"""
+        return cls._SIGNAL_PRIORITY.get(found[0], 99)
+
     def __init__(self):
+        self._leveraged_symbols: set = set()  # _init_exchange 成功設定槓桿的交易對
         self.exchange = self._init_exchange()
         self.data_provider = MarketDataProvider(
             self.exchange,
@@ -71,12 +98,11 @@ class TradingBotV6:
         )
         self.precision_handler = PrecisionHandler(self.exchange)
         self.futures_client = BinanceFuturesClient(Config.API_KEY, Config.API_SECRET, Config.SANDBOX_MODE)
-        self.risk_manager = RiskManager(self.exchange, self.precision_handler)
-        # RiskManager 內部用 V5.3 Config 建的 futures_client 拿不到新 key，覆蓋掉
-        self.risk_manager.futures_client = self.futures_client
+        self.risk_manager = RiskManager(self.exchange, self.precision_handler, self.futures_client)
         # 訂單執行引擎（Phase 3: 剝離下單邏輯）
         self.execution_engine = OrderExecutionEngine(
-            self.exchange, self.futures_client, self.precision_handler
+            self.exchange, self.futures_client, self.precision_handler,
+            leveraged_symbols=self._leveraged_symbols,
         )
 
         # V6.0: PositionManager 取代 TradeManager
@@ -90,6 +116,36 @@ class TradingBotV6:
         # 帳戶初始餘額（用於 net_pnl_pct 計算）
         self.initial_balance: float = 0.0
 
+        # Scanner JSON 解析快取：(st_mtime_ns, scan_time, symbols)，檔案未變更時不重讀
+        self._scanner_cache: Optional[Tuple[int, Optional[datetime], List[str]]] = None
+
+        # 行情串流快取（run() 啟動成功後才設定，同時掛到 data_provider）
+        self.market_cache: Optional[MarketDataCache] = None
+
+        # 指標增量快取：{(symbol, timeframe, 筆數): 上次 OHLCV + 指標}
+        self.indicator_cache = IndicatorCache()
+
+        # 趨勢 / MTF 判斷快取：{(種類, symbol): (K 線鍵, 過期 ms, 結果)}，同一根 K 線快照不重算
+        self._trend_context: Dict[tuple, tuple] = {}
+
+        # 本輪 monitor 待送出的硬止損更新：{symbol: (pm, new_sl)}，每輪結束統一送出
+        self._pending_sl: Dict[str, Tuple[PositionManager, float]] = {}
+
+        # 背景預抓（交易所持倉）：與本輪掃描重疊，惰性建立
+        self._prefetch_pool: Optional[ThreadPoolExecutor] = None
+        # 多個持倉的硬止損更新並行送出：惰性建立、跨輪重用（上限為建立時的 ORDER_IO_CONCURRENCY）
+        self._stop_pool: Optional[ThreadPoolExecutor] = None
+
+        # 本輪開始的 monotonic 時間（_wait_next_cycle 以此排定下一輪截止時間）
+        self._cycle_started_at: Optional[float] = None
+
+        # SIGHUP 熱重載請求的配置檔路徑：signal handler 只記錄，於兩輪之間實際重載
+        self._config_reload_path: Optional[str] = None
+
+        # 無行情串流時循環間等待在此 Event 上；立即開始下一輪的請求（SIGUSR1）只設 _refresh_requested
+        self._wake = threading.Event()
+        self._refresh_requested = False
+
         # V6.0: 持久化層（路徑在 Config，指向專案根目錄）
         pos_path = os.path.expanduser(Config.POSITIONS_JSON_PATH)
         if not os.path.isabs(pos_path):
@@ -122,6 +178,8 @@ class TradingBotV6:
                 'options': {'defaultType': Config.TRADING_MODE}
             }
             exchange = exchange_class(exchange_config)
+            # ccxt 同步版底層用 requests.Session，改用共用連線池
+            exchange.session = get_futures_session()
 
             if Config.SANDBOX_MODE:
                 if Config.TRADING_MODE == 'future':
@@ -155,6 +213,7 @@ class TradingBotV6:
                 for symbol in Config.SYMBOLS:
                     try:
                         exchange.set_leverage(Config.LEVERAGE, symbol)
+                        self._leveraged_symbols.add(symbol)
                     except Exception:
                         pass
 
@@ -165,21 +224,29 @@ class TradingBotV6:
             raise
 
     def _log_startup(self):
-        """啟動日誌"""
-        logger.info("=" * 60)
-        logger.info("交易機器人 V6.0 已啟動")
-        logger.info("=" * 60)
-        logger.info(f"模式: {Config.TRADING_MODE} ({Config.TRADING_DIRECTION})")
-        logger.info(f"槓桿: {Config.LEVERAGE}x")
-        logger.info(f"風險: 每筆 {Config.RISK_PER_TRADE*100:.1f}%")
-        logger.info(f"滾倉: {'開啟' if Config.PYRAMID_ENABLED else '關閉'}")
+        """啟動日誌（整段組成一筆 record，一次寫入）"""
+        rule = "=" * 60
+        lines = [
+            rule,
+            "交易機器人 V6.0 已啟動",
+            rule,
+            f"模式: {Config.TRADING_MODE} ({Config.TRADING_DIRECTION})",
+            f"槓桿: {Config.LEVERAGE}x",
+            f"風險: 每筆 {Config.RISK_PER_TRADE*100:.1f}%",
+            f"滾倉: {'開啟' if Config.PYRAMID_ENABLED else '關閉'}",
+        ]
         if Config.PYRAMID_ENABLED:
-            logger.info(f"  資金上限: {Config.EQUITY_CAP_PERCENT*100:.0f}%")
-            logger.info(f"  三段比例: {Config.STAGE1_RATIO}/{Config.STAGE2_RATIO}/{Config.STAGE3_RATIO}")
-        logger.info(f"模擬模式: {'開啟' if Config.V6_DRY_RUN else '關閉'}")
-        logger.info(f"已恢復持倉: {len(self.active_trades)}")
-        logger.info(f"監控標的: {', '.join(Config.SYMBOLS)}")
-        logger.info("=" * 60)
+            lines += [
+                f"  資金上限: {Config.EQUITY_CAP_PERCENT*100:.0f}%",
+                f"  三段比例: {Config.STAGE1_RATIO}/{Config.STAGE2_RATIO}/{Config.STAGE3_RATIO}",
+            ]
+        lines += [
+            f"模擬模式: {'開啟' if Config.V6_DRY_RUN else '關閉'}",
+            f"已恢復持倉: {len(self.active_trades)}",
+            f"監控標的: {', '.join(Config.SYMBOLS)}",
+            rule,
+        ]
+        logger.info("\n".join(lines))
 
     def _restore_positions(self):
         """從 positions.json 恢復 positions"""
@@ -212,23 +279,91 @@ class TradingBotV6:
         """獲取 OHLCV 數據（委託 MarketDataProvider 統一處理重試與沙盒 fallback）"""
         return self.data_provider.fetch_ohlcv(symbol, timeframe, limit)
 
+    def _indicators(self, symbol: str, timeframe: str, df: pd.DataFrame) -> pd.DataFrame:
+        """計算指標（同一根 K 線形成期間只增量更新最後一列）"""
+        return self.indicator_cache.calculate((symbol, timeframe, len(df)), df)
+
+    def _cached_context(self, kind: tuple, symbol: str, timeframe: str, df: pd.DataFrame, compute):
+        """
+        趨勢類判斷的快取（市場過濾、MTF 排列）
+
+        趨勢框架最後一根是形成中 K 線，鍵除了開盤時間也含其 OHLC：
+        同一根 K 線、價格未變的快照直接沿用上次結果，任一值變動就重算。
+        """
+        if 'timestamp' not in df.columns or df.empty:
+            return compute()
+        cols = df[['close', 'high', 'low']].to_numpy()[-1]
+        bar_ms = df['timestamp'].iat[-1].value // 1_000_000
+        bar_key = (bar_ms, len(df), float(cols[0]), float(cols[1]), float(cols[2]))
+
+        key = (kind, symbol)
+        hit = self._trend_context.get(key)
+        if hit is not None and hit[0] == bar_key:
+            return hit[2]
+        result = compute()
+        tf_ms = timeframe_to_ms(timeframe) or 0
+        self._trend_context[key] = (bar_key, bar_ms + 2 * tf_ms, result)
+        return result
+
+    def _prune_trend_context(self):
+        """移除 K 線開盤已超過 2 個週期的快取（標的不再被掃描時不會留著）"""
+        now_ms = int(time.time() * 1000)
+        stale = [key for key, entry in self._trend_context.items() if entry[1] < now_ms]
+        for key in stale:
+            del self._trend_context[key]
+
+    def fetch_tickers(self, symbols: List[str]) -> Dict[str, dict]:
+        """
+        批次取得多個標的 ticker（monitor 每輪一次，取代逐一 fetch_ticker）
+
+        行情串流有新鮮推播價者直接使用，其餘合併成一次 fetch_tickers；
+        批次失敗或缺漏的標的不在結果中，由呼叫端改用 fetch_ticker（含 Demo Trading fallback）。
+        """
+        tickers: Dict[str, dict] = {}
+        missing = []
+        cache = self.market_cache
+        for symbol in symbols:
+            price = cache.last_price(symbol) if cache is not None else None
+            if price is not None:
+                tickers[symbol] = {'symbol': symbol, 'last': price, 'bid': price, 'ask': price}
+            else:
+                missing.append(symbol)
+        if not missing:
+            return tickers
+
+        try:
+            fetched = self.exchange.fetch_tickers(missing)
+        except Exception as e:
+            logger.debug("批次 ticker 查詢失敗，改逐一查詢: %s", e)
+            return tickers
+        # 合約市場的 unified symbol 帶結算幣後綴（BTC/USDT:USDT），以現貨寫法對回
+        by_symbol = {key.split(':')[0]: ticker for key, ticker in fetched.items()}
+        for symbol in missing:
+            ticker = by_symbol.get(symbol)
+            if ticker and ticker.get('last'):
+                tickers[symbol] = ticker
+        return tickers
+
     def fetch_ticker(self, symbol: str) -> dict:
-        """獲取 ticker（含 Demo Trading fallback）"""
+        """獲取 ticker（行情串流有新鮮推播價時直接使用；否則 REST，含 Demo Trading fallback）"""
+        cache = self.market_cache
+        if cache is not None:
+            price = cache.last_price(symbol)
+            if price is not None:
+                return {'symbol': symbol, 'last': price, 'bid': price, 'ask': price}
         try:
             return self.exchange.fetch_ticker(symbol)
         except Exception:
             if Config.TRADING_MODE == 'future' and Config.SANDBOX_MODE:
-                import requests as req
-                symbol_id = symbol.replace('/', '')
+                symbol_id = exchange_symbol_id(symbol)
                 base_url = 'https://demo-fapi.binance.com'
-                resp = req.get(
+                resp = get_futures_session().get(
                     f'{base_url}/fapi/v1/ticker/price',
                     params={'symbol': symbol_id},
                     timeout=30
                 )
                 if resp.status_code == 200:
-                    data = resp.json()
-                    price = float(data['price'])
+                    price = float(response_json(resp)['price'])
                     return {'symbol': symbol, 'last': price, 'bid': price, 'ask': price}
             raise
 
@@ -239,41 +374,53 @@ class TradingBotV6:
             # 相對路徑 → 基於專案根目錄
             if not os.path.isabs(scanner_path):
                 scanner_path = str(Path(__file__).parent.parent / scanner_path)
-            if not os.path.exists(scanner_path):
-                logger.warning(f"Scanner JSON 不存在: {scanner_path}，使用預設 symbols")
+            try:
+                mtime_ns = os.stat(scanner_path).st_mtime_ns
+            except FileNotFoundError:
+                logger.warning("Scanner JSON 不存在: %s，使用預設 symbols", scanner_path)
                 return Config.SYMBOLS
 
-            with open(scanner_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            scan_time_str = data.get('scan_time', '')
-            if scan_time_str:
-                try:
-                    scan_time = datetime.fromisoformat(scan_time_str.replace('Z', '+00:00'))
-                    age_minutes = (datetime.now(timezone.utc) - scan_time).total_seconds() / 60
-                    if age_minutes > Config.SCANNER_MAX_AGE_MINUTES:
-                        logger.warning(f"Scanner 資料已過期 ({age_minutes:.0f} 分鐘 > {Config.SCANNER_MAX_AGE_MINUTES} 分鐘上限)，使用預設 symbols")
-                        return Config.SYMBOLS
-                except Exception:
-                    pass
+            if self._scanner_cache is None or self._scanner_cache[0] != mtime_ns:
+                self._scanner_cache = (mtime_ns, *self._parse_scanner_file(scanner_path))
+            _, scan_time, scanner_symbols = self._scanner_cache
 
-            hot_symbols = data.get('hot_symbols', [])
-            if not hot_symbols:
-                logger.warning("Scanner JSON 中 hot_symbols 為空，使用預設 symbols")
-                return Config.SYMBOLS
+            # 檔案內容可快取，但新鮮度隨時間變化，每次都要檢查
+            if scan_time is not None:
+                age_minutes = (datetime.now(timezone.utc) - scan_time).total_seconds() / 60
+                if age_minutes > Config.SCANNER_MAX_AGE_MINUTES:
+                    logger.warning("Scanner 資料已過期 (%.0f 分鐘 > %s 分鐘上限)，使用預設 symbols", age_minutes, Config.SCANNER_MAX_AGE_MINUTES)
+                    return Config.SYMBOLS
 
-            scanner_symbols = [item['symbol'] for item in hot_symbols if item.get('symbol')]
             if scanner_symbols:
-                logger.debug(f"Scanner 載入 {len(scanner_symbols)} 個標的: {', '.join(scanner_symbols)}")  # 降噪
+                logger.debug("Scanner 載入 %d 個標的: %s", len(scanner_symbols), ', '.join(scanner_symbols))  # 降噪
                 return scanner_symbols
             else:
-                logger.warning("Scanner JSON 解析後無有效 symbol，使用預設 symbols")
+                logger.warning("Scanner JSON 中無有效 symbol，使用預設 symbols")
                 return Config.SYMBOLS
 
         except Exception as e:
-            logger.warning(f"Scanner JSON 載入失敗: {e}，使用預設 symbols")
+            logger.warning("Scanner JSON 載入失敗: %s，使用預設 symbols", e)
             return Config.SYMBOLS
 
+    @staticmethod
+    def _parse_scanner_file(scanner_path: str) -> Tuple[Optional[datetime], List[str]]:
+        """讀取並解析 Scanner JSON，返回 (scan_time, symbols)"""
+        with open(scanner_path, 'rb') as f:
+            data = json_loads(f.read())
+
+        scan_time = None
+        scan_time_str = data.get('scan_time', '')
+        if scan_time_str:
+            try:
+                scan_time = datetime.fromisoformat(scan_time_str.replace('Z', '+00:00'))
+            except ValueError:
+                pass
+            if scan_time is not None and scan_time.tzinfo is None:
+                scan_time = None  # 無時區資訊無法比較，視同未提供（不做過期檢查）
+
+        hot_symbols = data.get('hot_symbols', [])
+        return scan_time, [item['symbol'] for item in hot_symbols if item.get('symbol')]
+
     # ==================== 訂單執行（委託 OrderExecutionEngine）====================
 
     def _futures_set_leverage(self, symbol: str) -> bool:
@@ -281,8 +428,11 @@ class TradingBotV6:
         return self.execution_engine.set_leverage(symbol)
 
     def _futures_create_order(self, symbol: str, side: str, quantity: float) -> dict:
-        """下市價單"""
-        return self.execution_engine.create_order(symbol, side, quantity)
+        """下市價單（成交後帳戶快取失效）"""
+        try:
+            return self.execution_engine.create_order(symbol, side, quantity)
+        finally:
+            self.risk_manager.invalidate()
 
     @staticmethod
     def _extract_fill_price(order_result: dict, fallback_price: float) -> float:
@@ -304,8 +454,11 @@ class TradingBotV6:
         return fallback_price
 
     def _futures_close_position(self, symbol: str, side: str, quantity: float) -> dict:
-        """平倉"""
-        return self.execution_engine.close_position(symbol, side, quantity)
+        """平倉（成交後帳戶快取失效）"""
+        try:
+            return self.execution_engine.close_position(symbol, side, quantity)
+        finally:
+            self.risk_manager.invalidate()
 
     def _place_hard_stop_loss(self, symbol: str, side: str, size: float, stop_price: float) -> Optional[str]:
         """設置硬止損單，回傳 order ID"""
@@ -319,99 +472,195 @@ class TradingBotV6:
         """更新硬止損單"""
         self.execution_engine.update_hard_stop_loss(pm, new_stop)
 
+    def _flush_stop_loss_updates(self):
+        """
+        送出本輪累積的硬止損更新，每個持倉最多一組 cancel + place。
+
+        多個持倉時送到常駐的 _stop_pool 並行（各自只改自己的 pm.stop_order_id，共用 keep-alive 連線池）。
+        """
+        pending, self._pending_sl = self._pending_sl, {}
+        updates = [(symbol, pm, new_sl) for symbol, (pm, new_sl) in pending.items() if not pm.is_closed]
+
+        def _update(item: Tuple[str, PositionManager, float]):
+            symbol, pm, new_sl = item
+            try:
+                self._update_hard_stop_loss(pm, new_sl)
+            except Exception as e:
+                logger.error(f"{symbol} 硬止損更新失敗: {e}")
+
+        workers = max(1, min(Config.ORDER_IO_CONCURRENCY, len(updates)))
+        if workers == 1:
+            for item in updates:
+                _update(item)
+            return
+        if self._stop_pool is None:
+            self._stop_pool = ThreadPoolExecutor(
+                max_workers=max(1, Config.ORDER_IO_CONCURRENCY), thread_name_prefix='stop',
+            )
+        list(self._stop_pool.map(_update, updates))
+
     # ==================== 信號掃描 ====================
 
+    def _is_symbol_blocked(self, symbol: str, loss_cooldowns: Optional[List[str]] = None) -> bool:
+        """
+        持倉中 / 冷卻中 / 黑名單 → True（跳過此標的，不抓資料）
+
+        loss_cooldowns: 傳入時，同幣虧損冷卻改為收集到此 list（由呼叫端合併成一行 log）
+        """
+        # 跳過已有持倉
+        if symbol in self.active_trades:
+            t = self.active_trades[symbol]
+            logger.debug("%s: 跳過（已有持倉 %s/階段%s）", symbol, t.side, t.stage)
+            return True
+
+        # 冷卻檢查
+        if symbol in self.recently_exited:
+            hours = (datetime.now(timezone.utc) - self.recently_exited[symbol]).total_seconds() / 3600
+            if hours < 2:
+                logger.debug("%s: 跳過（冷卻中 %.1fh）", symbol, hours)
+                return True
+            else:
+                del self.recently_exited[symbol]
+
+        # 下單失敗黑名單
+        if symbol in self.order_failed_symbols:
+            hours = (datetime.now(timezone.utc) - self.order_failed_symbols[symbol]).total_seconds() / 3600
+            if hours < 1:
+                logger.debug("%s: 跳過（下單失敗黑名單）", symbol)
+                return True
+            else:
+                del self.order_failed_symbols[symbol]
+
+        # 12h 冷卻（快速止損/超時退出）
+        if symbol in self.early_exit_cooldown:
+            hours = (datetime.now(timezone.utc) - self.early_exit_cooldown[symbol]).total_seconds() / 3600
+            if hours < Config.EARLY_EXIT_COOLDOWN_HOURS:
+                logger.debug("%s: 跳過（早期退出冷卻中 %.1fh/%sh）", symbol, hours, Config.EARLY_EXIT_COOLDOWN_HOURS)
+                return True
+            else:
+                del self.early_exit_cooldown[symbol]
+
+        # === Risk Guard: 同幣虧損冷卻（persistent，基於 perf_db）===
+        if Config.SYMBOL_LOSS_COOLDOWN_HOURS > 0:
+            last_loss_exit = self.perf_db.get_last_loss_exit_time(symbol)
+            if last_loss_exit:
+                try:
+                    exit_dt = datetime.fromisoformat(last_loss_exit)
+                    if exit_dt.tzinfo is None:
+                        exit_dt = exit_dt.replace(tzinfo=timezone.utc)
+                    hours_since = (datetime.now(timezone.utc) - exit_dt).total_seconds() / 3600
+                    if hours_since < Config.SYMBOL_LOSS_COOLDOWN_HOURS:
+                        if loss_cooldowns is not None:
+                            loss_cooldowns.append(f"{symbol}({hours_since:.1f}h)")
+                        else:
+                            logger.info(
+                                f"{symbol}: 跳過（上次虧損 {hours_since:.1f}h 前，"
+                                f"冷卻 {Config.SYMBOL_LOSS_COOLDOWN_HOURS}h）"
+                            )
+                        return True
+                except (ValueError, TypeError):
+                    pass  # 解析失敗不阻塞
+
+        return False
+
+    def _prefetch_scan_data(
+        self, symbols: List[str]
+    ) -> Tuple[Dict[str, Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]], Optional[pd.DataFrame]]:
+        """
+        並行抓取所有候選標的的 trend / signal / mtf K 線（network-bound，一次批次取完）
+
+        BTC 趨勢過濾開啟時，BTC 1D 也併入同一批，避免掃描迴圈中再序列打一次 REST。
+
+        Returns:
+            ({symbol: (df_trend, df_signal, df_mtf)}, btc_1d_df 或 None)
+        """
+        keys = {
+            symbol: (
+                (symbol, Config.TIMEFRAME_TREND, 250),
+                (symbol, Config.TIMEFRAME_SIGNAL, 100),
+                (symbol, Config.TIMEFRAME_MTF, 100) if Config.ENABLE_MTF_CONFIRMATION else None,
+            )
+            for symbol in symbols
+        }
+        btc_key = self._BTC_TREND_KEY if Config.BTC_TREND_FILTER_ENABLED else None
+        batch = [key for trio in keys.values() for key in trio if key is not None]
+        if btc_key is not None:
+            batch.append(btc_key)
+        fetched = self.data_provider.fetch_ohlcv_batch(
+            batch, max_concurrency=Config.OHLCV_FETCH_CONCURRENCY,
+        )
+        frames = {
+            symbol: tuple(fetched[key] if key is not None else pd.DataFrame() for key in trio)
+            for symbol, trio in keys.items()
+        }
+        return frames, (fetched.get(btc_key) if btc_key is not None else None)
+
     def scan_for_signals(self):
         """掃描交易信號"""
         symbols = self.load_scanner_results() if Config.USE_SCANNER_SYMBOLS else Config.SYMBOLS
-        logger.debug(f"開始掃描 {len(symbols)} 個標的...")  # 降噪
+        logger.debug("開始掃描 %d 個標的...", len(symbols))  # 降噪
 
+        candidates = []
+        loss_cooldowns: List[str] = []
         for symbol in symbols:
             try:
-                # 跳過已有持倉
-                if symbol in self.active_trades:
-                    t = self.active_trades[symbol]
-                    logger.debug(f"{symbol}: 跳過（已有持倉 {t.side}/階段{t.stage}）")
-                    continue
+                if not self._is_symbol_blocked(symbol, loss_cooldowns):
+                    candidates.append(symbol)
+            except Exception as e:
+                logger.error("%s 掃描錯誤: %s", symbol, e)
+        if loss_cooldowns:
+            # 每個標的一行 → 每輪一行
+            logger.info(
+                "跳過 %d 個虧損冷卻標的（冷卻 %sh）: %s",
+                len(loss_cooldowns), Config.SYMBOL_LOSS_COOLDOWN_HOURS, ', '.join(loss_cooldowns),
+            )
 
-                # 冷卻檢查
-                if symbol in self.recently_exited:
-                    hours = (datetime.now(timezone.utc) - self.recently_exited[symbol]).total_seconds() / 3600
-                    if hours < 2:
-                        logger.debug(f"{symbol}: 跳過（冷卻中 {hours:.1f}h）")
-                        continue
-                    else:
-                        del self.recently_exited[symbol]
+        # 總風險已滿就不必抓任何資料
+        if candidates and not self._check_total_risk(list(self.active_trades.values())):
+            logger.debug("總風險已達上限，停止掃描")  # 降噪
+            candidates = []
+        # 掃描期間總風險只會因本輪開新倉而改變：持倉數變動時才重算
+        risk_checked_count = len(self.active_trades)
 
-                # 下單失敗黑名單
-                if symbol in self.order_failed_symbols:
-                    hours = (datetime.now(timezone.utc) - self.order_failed_symbols[symbol]).total_seconds() / 3600
-                    if hours < 1:
-                        logger.debug(f"{symbol}: 跳過（下單失敗黑名單）")
-                        continue
-                    else:
-                        del self.order_failed_symbols[symbol]
+        # 獲取數據（批次並行）
+        frames, btc_df = self._prefetch_scan_data(candidates) if candidates else ({}, None)
+        btc_trend = _UNSET  # 本輪第一個需要時才計算，之後共用
+        self._prune_trend_context()
 
-                # 12h 冷卻（快速止損/超時退出）
-                if symbol in self.early_exit_cooldown:
-                    hours = (datetime.now(timezone.utc) - self.early_exit_cooldown[symbol]).total_seconds() / 3600
-                    if hours < Config.EARLY_EXIT_COOLDOWN_HOURS:
-                        logger.debug(f"{symbol}: 跳過（早期退出冷卻中 {hours:.1f}h/{Config.EARLY_EXIT_COOLDOWN_HOURS}h）")
-                        continue
-                    else:
-                        del self.early_exit_cooldown[symbol]
-
-                # === Risk Guard: 同幣虧損冷卻（persistent，基於 perf_db）===
-                if Config.SYMBOL_LOSS_COOLDOWN_HOURS > 0:
-                    last_loss_exit = self.perf_db.get_last_loss_exit_time(symbol)
-                    if last_loss_exit:
-                        try:
-                            exit_dt = datetime.fromisoformat(last_loss_exit)
-                            if exit_dt.tzinfo is None:
-                                exit_dt = exit_dt.replace(tzinfo=timezone.utc)
-                            hours_since = (datetime.now(timezone.utc) - exit_dt).total_seconds() / 3600
-                            if hours_since < Config.SYMBOL_LOSS_COOLDOWN_HOURS:
-                                logger.info(
-                                    f"{symbol}: 跳過（上次虧損 {hours_since:.1f}h 前，"
-                                    f"冷卻 {Config.SYMBOL_LOSS_COOLDOWN_HOURS}h）"
-                                )
-                                continue
-                        except (ValueError, TypeError):
-                            pass  # 解析失敗不阻塞
-
-                # 總風險檢查
-                active_list = list(self.active_trades.values())
-                if not self._check_total_risk(active_list):
-                    logger.debug("總風險已達上限，停止掃描")  # 降噪
-                    break
-
-                # 獲取數據
-                df_trend = self.fetch_ohlcv(symbol, Config.TIMEFRAME_TREND, limit=250)
-                df_signal = self.fetch_ohlcv(symbol, Config.TIMEFRAME_SIGNAL, limit=100)
-                df_mtf = pd.DataFrame()
-                if Config.ENABLE_MTF_CONFIRMATION:
-                    df_mtf = self.fetch_ohlcv(symbol, Config.TIMEFRAME_MTF, limit=100)
+        for symbol in candidates:
+            try:
+                # 總風險檢查（本輪已開新倉時）
+                if len(self.active_trades) != risk_checked_count:
+                    risk_checked_count = len(self.active_trades)
+                    if not self._check_total_risk(list(self.active_trades.values())):
+                        logger.debug("總風險已達上限，停止掃描")  # 降噪
+                        break
+
+                df_trend, df_signal, df_mtf = frames[symbol]
 
                 if df_trend.empty or len(df_trend) < 100:
-                    logger.debug(f"{symbol}: 跳過（趨勢數據不足: {len(df_trend) if not df_trend.empty else 0}根）")
+                    logger.debug("%s: 跳過（趨勢數據不足: %d根）", symbol, len(df_trend))
                     continue
                 if df_signal.empty or len(df_signal) < 50:
-                    logger.debug(f"{symbol}: 跳過（信號數據不足: {len(df_signal) if not df_signal.empty else 0}根）")
+                    logger.debug("%s: 跳過（信號數據不足: %d根）", symbol, len(df_signal))
                     continue
 
-                df_trend = TechnicalAnalysis.calculate_indicators(df_trend)
-                df_signal = TechnicalAnalysis.calculate_indicators(df_signal)
+                df_trend = self._indicators(symbol, Config.TIMEFRAME_TREND, df_trend)
+                df_signal = self._indicators(symbol, Config.TIMEFRAME_SIGNAL, df_signal)
                 if not df_mtf.empty:
-                    df_mtf = TechnicalAnalysis.calculate_indicators(df_mtf)
+                    df_mtf = self._indicators(symbol, Config.TIMEFRAME_MTF, df_mtf)
 
                 # 移除當前未關閉 K 線，確保信號偵測基於已確認數據
                 # Binance API 回傳的最後一根 K 線是正在形成中的，用中間值做判斷會產生假信號
                 df_signal = df_signal.iloc[:-1]
 
                 # 市場過濾
-                market_ok, market_reason, is_strong_market = MarketFilter.check_market_condition(df_trend, symbol)
+                market_ok, market_reason, is_strong_market = self._cached_context(
+                    ('market',), symbol, Config.TIMEFRAME_TREND, df_trend,
+                    lambda: MarketFilter.check_market_condition(df_trend, symbol),
+                )
                 if not market_ok:
-                    logger.info(f"{symbol}: 跳過（市場過濾: {market_reason}）")
+                    logger.info("%s: 跳過（市場過濾: %s）", symbol, market_reason)
                     continue
 
                 # === 多策略信號掃描 ===
@@ -434,64 +683,65 @@ class TradingBotV6:
                     details_2b['signal_type'] = '2B'
                     signals_found.append(('2B', details_2b))
 
-                # EMA 回撤信號
-                if Config.ENABLE_EMA_PULLBACK:
-                    has_pb, details_pb = detect_ema_pullback(
+                # EMA 回撤 + 量能突破（單次 kernel 評估）
+                fast_types = tuple(
+                    sig_type for sig_type, enabled in (
+                        ('EMA_PULLBACK', Config.ENABLE_EMA_PULLBACK),
+                        ('VOLUME_BREAKOUT', Config.ENABLE_VOLUME_BREAKOUT),
+                    ) if enabled
+                )
+                if fast_types:
+                    fast_signals = scan_fast_signals(
                         df_signal,
                         ema_pullback_threshold=Config.EMA_PULLBACK_THRESHOLD,
-                    )
-                    if has_pb and details_pb is not None:
-                        details_pb['signal_type'] = 'EMA_PULLBACK'
-                        signals_found.append(('EMA_PULLBACK', details_pb))
-
-                # 量能突破信號
-                if Config.ENABLE_VOLUME_BREAKOUT:
-                    has_bo, details_bo = detect_volume_breakout(
-                        df_signal,
                         volume_breakout_mult=Config.VOLUME_BREAKOUT_MULT,
+                        include=fast_types,
                     )
-                    if has_bo and details_bo is not None:
-                        details_bo['signal_type'] = 'VOLUME_BREAKOUT'
-                        signals_found.append(('VOLUME_BREAKOUT', details_bo))
+                    for sig_type in fast_types:
+                        has_sig, sig_details = fast_signals[sig_type]
+                        if has_sig and sig_details is not None:
+                            signals_found.append((sig_type, sig_details))
 
                 if not signals_found:
-                    logger.debug(f"{symbol}: 無信號（市場OK: {market_reason}）")
+                    logger.debug("%s: 無信號（市場OK: %s）", symbol, market_reason)
                     continue
 
-                # 優先級排序：2B > VOLUME_BREAKOUT > EMA_PULLBACK
-                _signal_priority = {'2B': 1, 'VOLUME_BREAKOUT': 2, 'EMA_PULLBACK': 3}
-                signals_found.sort(key=lambda x: _signal_priority.get(x[0], 99))
+                # 優先級：2B > VOLUME_BREAKOUT > EMA_PULLBACK（只取最優先者，不必整串排序）
+                best_type, signal_details = min(signals_found, key=self._signal_rank)
 
                 # 列出所有偵測到的信號
-                all_sigs = ', '.join(
-                    f"{t} {d['side']} 量能={d.get('vol_ratio',0):.2f}x"
-                    for t, d in signals_found
-                )
-                best_type, signal_details = signals_found[0]
-                logger.info(f"{symbol}: 偵測到信號 [{all_sigs}]")
+                if logger.isEnabledFor(logging.INFO):
+                    all_sigs = ', '.join(
+                        f"{t} {d['side']} 量能={d.get('vol_ratio',0):.2f}x"
+                        for t, d in signals_found
+                    )
+                    logger.info("%s: 偵測到信號 [%s]", symbol, all_sigs)
                 signal_side = signal_details['side']
 
                 # 交易方向過濾
                 trading_dir = Config.TRADING_DIRECTION.lower()
                 if trading_dir == 'long' and signal_side != 'LONG':
-                    logger.debug(f"{symbol}: 跳過（{best_type} {signal_side} 不符合方向=做多）")
+                    logger.debug("%s: 跳過（%s %s 不符合方向=做多）", symbol, best_type, signal_side)
                     continue
                 if trading_dir == 'short' and signal_side != 'SHORT':
-                    logger.debug(f"{symbol}: 跳過（{best_type} {signal_side} 不符合方向=做空）")
+                    logger.debug("%s: 跳過（%s %s 不符合方向=做空）", symbol, best_type, signal_side)
                     continue
 
                 # 趨勢檢查
                 trend_ok, trend_desc = TechnicalAnalysis.check_trend(df_trend, signal_side)
                 if not trend_ok:
-                    logger.info(f"{symbol}: 跳過（趨勢={trend_desc}，信號={signal_side} 方向不符）")
+                    logger.info("%s: 跳過（趨勢=%s，信號=%s 方向不符）", symbol, trend_desc, signal_side)
                     continue
 
                 # MTF 確認
                 mtf_aligned = True
                 mtf_reason = "MTF 未啟用"
                 if Config.ENABLE_MTF_CONFIRMATION and not df_mtf.empty:
-                    mtf_aligned, mtf_reason = MTFConfirmation.check_mtf_alignment(df_mtf, signal_side)
-                    logger.info(f"{symbol}: MTF {mtf_reason}")
+                    mtf_aligned, mtf_reason = self._cached_context(
+                        ('mtf', signal_side), symbol, Config.TIMEFRAME_MTF, df_mtf,
+                        lambda: MTFConfirmation.check_mtf_alignment(df_mtf, signal_side),
+                    )
+                    logger.info("%s: MTF %s", symbol, mtf_reason)
 
                 # 信號等級
                 signal_tier, tier_multiplier, tier_score = SignalTierSystem.calculate_signal_tier(
@@ -521,59 +771,56 @@ class TradingBotV6:
                 )
 
                 # === Risk Guard: Tier 過濾 ===
-                _tier_rank = {'A': 3, 'B': 2, 'C': 1}
                 _min_tier = getattr(Config, 'V7_MIN_SIGNAL_TIER', 'C')
-                if _tier_rank.get(signal_tier, 0) < _tier_rank.get(_min_tier, 0):
+                if self._TIER_RANK.get(signal_tier, 0) < self._TIER_RANK.get(_min_tier, 0):
                     logger.info(
-                        f"{symbol}: 跳過（Tier {signal_tier} < 最低要求 {_min_tier}，score={tier_score}）"
+                        "%s: 跳過（Tier %s < 最低要求 %s，score=%s）", symbol, signal_tier, _min_tier, tier_score
                     )
                     continue
 
                 # === Risk Guard: BTC Trend Filter ===
                 if Config.BTC_TREND_FILTER_ENABLED and "BTC" not in symbol:
-                    btc_trend = self._check_btc_trend()
+                    if btc_trend is _UNSET:
+                        btc_trend = self._check_btc_trend(btc_df)
                     signal_details['btc_trend'] = btc_trend or "UNKNOWN"
 
                     if btc_trend in ("RANGING", None):
                         # BTC 橫盤或數據失敗 → 完全停止趨勢進場
                         ranging_label = "RANGING" if btc_trend == "RANGING" else "UNKNOWN"
-                        logger.info(
-                            f"{symbol}: 跳過（BTC {ranging_label}，"
-                            f"趨勢策略暫停，等待網格策略接手）"
-                        )
+                        logger.info("%s: 跳過（BTC %s，趨勢策略暫停，等待網格策略接手）", symbol, ranging_label)
                         continue
 
                     elif signal_side != btc_trend:
                         if Config.BTC_COUNTER_TREND_MULT <= 0:
                             logger.info(
-                                f"{symbol}: 跳過（BTC 趨勢={btc_trend}，信號={signal_side} 逆勢，"
-                                f"BTC_COUNTER_TREND_MULT=0）"
+                                "%s: 跳過（BTC 趨勢=%s，信號=%s 逆勢，BTC_COUNTER_TREND_MULT=0）",
+                                symbol, btc_trend, signal_side,
                             )
                             continue
                         else:
                             tier_multiplier *= Config.BTC_COUNTER_TREND_MULT
                             logger.info(
-                                f"{symbol}: BTC 逆勢（BTC={btc_trend}，信號={signal_side}），"
-                                f"倉位乘數 ×{Config.BTC_COUNTER_TREND_MULT}"
+                                "%s: BTC 逆勢（BTC=%s，信號=%s），倉位乘數 ×%s",
+                                symbol, btc_trend, signal_side, Config.BTC_COUNTER_TREND_MULT,
                             )
 
                 logger.info(
-                    f"準備進場: {symbol} {best_type} {signal_side} | "
-                    f"等級={signal_tier} 量能={signal_details.get('vol_ratio', 0):.2f}x | "
-                    f"市場={market_reason} 趨勢={trend_desc} MTF={'通過' if mtf_aligned else '未通過'}"
+                    "準備進場: %s %s %s | 等級=%s 量能=%.2fx | 市場=%s 趨勢=%s MTF=%s",
+                    symbol, best_type, signal_side, signal_tier, signal_details.get('vol_ratio', 0),
+                    market_reason, trend_desc, '通過' if mtf_aligned else '未通過',
                 )
 
                 # 執行開倉
                 self._execute_trade(symbol, signal_details, best_type, tier_multiplier, df_signal)
 
             except Exception as e:
-                logger.error(f"{symbol} 掃描錯誤: {e}")
+                logger.error("%s 掃描錯誤: %s", symbol, e)
 
         active_str = ', '.join(
             f'{s}({t.side}/階段{t.stage}/${t.total_size * t.avg_entry:.0f})'
             for s, t in self.active_trades.items()
         ) or "無"
-        logger.debug(f"掃描完成 | 活躍持倉: {active_str}")  # 降噪
+        logger.debug("掃描完成 | 活躍持倉: %s", active_str)  # 降噪
 
         # Structured scan summary (will be supplemented by monitor CYCLE_SUMMARY)
         _trade_log({
@@ -588,10 +835,11 @@ class TradingBotV6:
 
     # ==================== Private Helpers ====================
 
-    def _check_btc_trend(self) -> Optional[str]:
-        """Fetch BTC 1D EMA20/50 trend. Returns 'LONG', 'SHORT', 'RANGING', or None on failure."""
+    def _check_btc_trend(self, btc_df: Optional[pd.DataFrame] = None) -> Optional[str]:
+        """BTC 1D EMA20/50 trend（btc_df 未預先抓取時自行 fetch）. Returns 'LONG', 'SHORT', 'RANGING', or None on failure."""
         try:
-            btc_df = self.data_provider.fetch_ohlcv("BTC/USDT", "1d", limit=60)
+            if btc_df is None:
+                btc_df = self.data_provider.fetch_ohlcv(*self._BTC_TREND_KEY)
             if btc_df is not None and len(btc_df) >= 50:
                 btc_ema20 = btc_df['close'].ewm(span=20, adjust=False).mean().iloc[-1]
                 btc_ema50 = btc_df['close'].ewm(span=50, adjust=False).mean().iloc[-1]
@@ -606,6 +854,7 @@ class TradingBotV6:
 
     def _refresh_stop_loss(self, pm: PositionManager, new_sl: float):
         """Cancel existing SL order, place new one, update pm.stop_order_id."""
+        self._pending_sl.pop(pm.symbol, None)
         self._cancel_stop_loss_order(pm.symbol, pm.stop_order_id)
         pm.stop_order_id = self._place_hard_stop_loss(
             pm.symbol, pm.side, pm.total_size, new_sl
@@ -662,17 +911,7 @@ class TradingBotV6:
         if not active_positions:
             return True
 
-        total_risk = 0.0
-        for pm in active_positions:
-            if pm.is_closed:
-                continue
-            if pm.side == 'LONG':
-                risk_per_unit = pm.avg_entry - pm.current_sl
-            else:
-                risk_per_unit = pm.current_sl - pm.avg_entry
-            if risk_per_unit <= 0:
-                continue
-            total_risk += pm.total_size * risk_per_unit
+        total_risk = RiskManager.total_open_risk(active_positions)
 
         if Config.V6_DRY_RUN:
             balance = 10000.0
@@ -803,10 +1042,11 @@ class TradingBotV6:
 
             # 捕捉實際成交均價（market order 可能有 slippage）
             fill_price = self._extract_fill_price(order_result, entry_price)
-            if fill_price != entry_price:
-                logger.info(
-                    f"{symbol} 成交均價修正: 信號${entry_price:.4f} → 實際${fill_price:.4f}"
-                )
+            # 成交均價修正併入開倉 log（下單路徑上只寫一筆 record）
+            fill_note = (
+                f" | 成交均價修正: 信號${entry_price:.4f} → 實際${fill_price:.4f}"
+                if fill_price != entry_price else ""
+            )
             entry_price = fill_price
 
             logger.info(
@@ -814,7 +1054,7 @@ class TradingBotV6:
                 f"止損=${stop_loss:.2f} 策略={signal_type} 等級={signal_details.get('signal_tier','?')} "
                 f"量能={signal_details.get('vol_ratio',0):.2f}x 滾倉={use_v6} | "
                 f"市場={signal_details.get('_market_reason','')} 趨勢={signal_details.get('_trend_desc','')} "
-                f"MTF={signal_details.get('_mtf_reason','')}"
+                f"MTF={signal_details.get('_mtf_reason','')}{fill_note}"
             )
 
             # 建立 PositionManager（strategy_name 由 SIGNAL_STRATEGY_MAP 決定）
@@ -876,7 +1116,7 @@ class TradingBotV6:
             self._save_positions()
 
             # Telegram 通知
-            TelegramNotifier.notify_signal(symbol, {
+            TelegramNotifier.dispatch(TelegramNotifier.notify_signal, symbol, {
                 **signal_details,
                 'position_size': position_size,
                 'stop_loss': stop_loss,
@@ -895,11 +1135,16 @@ class TradingBotV6:
         if not self.active_trades:
             return
 
-        logger.debug(f"監控 {len(self.active_trades)} 個持倉中...")
+        logger.debug("監控 %d 個持倉中...", len(self.active_trades))
 
         closed_symbols = []
         state_changed = False
 
+        # 所有持倉的 ticker 一次批次取得；缺漏者迴圈內逐一補查
+        tickers = self.fetch_tickers([s for s, pm in self.active_trades.items() if not pm.is_closed])
+        # 各持倉的價格 / PnL 行彙整成一筆 debug record（未開 debug 時不組字串）
+        position_lines: Optional[List[str]] = [] if logger.isEnabledFor(logging.DEBUG) else None
+
         for symbol, pm in self.active_trades.items():
             try:
                 if pm.is_closed:
@@ -907,35 +1152,38 @@ class TradingBotV6:
                     continue
 
                 # 取得 ticker
-                ticker = self.fetch_ticker(symbol)
+                ticker = tickers.get(symbol) or self.fetch_ticker(symbol)
                 current_price = ticker['last']
 
                 # 取得 1H 數據
                 df_1h = self.fetch_ohlcv(symbol, Config.TIMEFRAME_SIGNAL, limit=50)
+                latest_atr = None
                 if not df_1h.empty:
-                    df_1h = TechnicalAnalysis.calculate_indicators(df_1h)
+                    df_1h = self._indicators(symbol, Config.TIMEFRAME_SIGNAL, df_1h)
+                    if 'atr' in df_1h.columns:
+                        latest_atr = float(df_1h['atr'].to_numpy()[-1])
 
                 # V6 / V7: 額外取得 4H 數據
                 df_4h = None
                 if pm.strategy_name in ("v6_pyramid", "v7_structure"):
                     df_4h = self.fetch_ohlcv(symbol, '4h', limit=50)
                     if df_4h is not None and not df_4h.empty:
-                        df_4h = TechnicalAnalysis.calculate_indicators(df_4h)
+                        df_4h = self._indicators(symbol, '4h', df_4h)
 
                 # Monitor（V7 P2 起回傳 Dict）
-                decision = pm.monitor(current_price, df_1h, df_4h)
+                decision = pm.monitor(current_price, df_1h, df_4h, latest_atr=latest_atr)
                 action = decision.get('action', Action.HOLD)
                 new_sl = decision.get('new_sl')
 
-                # SL 變化 → 更新硬止損
+                # SL 變化 → 登記硬止損更新（本輪結束統一送出；加倉/減倉重掛時會被取代）
                 if new_sl is not None:
                     old_sl = pm.current_sl
-                    self._update_hard_stop_loss(pm, new_sl)
+                    self._pending_sl[symbol] = (pm, new_sl)
                     state_changed = True
                     # 只通知顯著移損（變化 > 1%），避免 trailing 微調洗版
                     if old_sl > 0 and abs(new_sl - old_sl) / old_sl > 0.01:
-                        TelegramNotifier.notify_action(
-                            symbol, '1.5R移損',
+                        TelegramNotifier.dispatch(
+                            TelegramNotifier.notify_action, symbol, '1.5R移損',
                             current_price,
                             f"SL ${old_sl:.2f} → ${new_sl:.2f}"
                         )
@@ -975,10 +1223,11 @@ class TradingBotV6:
                     mode = f"V6/S{pm.stage}"
                 else:
                     mode = "V53"
-                logger.debug(
-                    f"{symbol} [{mode}]: ${current_price:.2f} | "
-                    f"PnL={profit_pct:+.2f}% | SL=${pm.current_sl:.2f}"
-                )
+                if position_lines is not None:
+                    position_lines.append(
+                        f"{symbol} [{mode}]: ${current_price:.2f} | "
+                        f"PnL={profit_pct:+.2f}% | SL=${pm.current_sl:.2f}"
+                    )
 
                 # Structured position update
                 _trade_log({
@@ -991,7 +1240,7 @@ class TradingBotV6:
                 })
 
             except Exception as e:
-                logger.error(f"{symbol} 監控錯誤: {e}")
+                logger.error("%s 監控錯誤: %s", symbol, e)
 
             # 背景清理待取消止損單
             if pm.pending_stop_cancels:
@@ -1000,11 +1249,17 @@ class TradingBotV6:
                     success = self.execution_engine.cancel_stop_loss_order(pm.symbol, order_id)
                     if success:
                         pm.pending_stop_cancels.pop(0)
-                        logger.info(f"[{pm.symbol}] pending stop cancel cleared: {order_id}")
+                        logger.info("[%s] pending stop cancel cleared: %s", pm.symbol, order_id)
                 except Exception as e:
-                    logger.warning(f"[{pm.symbol}] pending stop cancel retry failed: {e}")
+                    logger.warning("[%s] pending stop cancel retry failed: %s", pm.symbol, e)
                     # 保留在清單，下次迴圈繼續重試
 
+        if position_lines:
+            logger.debug("持倉概況:\n%s", "\n".join(position_lines))
+
+        # 本輪 SL 更新統一送出（須在儲存前，positions.json 才會記錄新的 stop_order_id）
+        self._flush_stop_loss_updates()
+
         # 清理已關閉的
         for symbol in closed_symbols:
             pm = self.active_trades.get(symbol)
@@ -1013,9 +1268,9 @@ class TradingBotV6:
                 for order_id in pm.pending_stop_cancels:
                     try:
                         self.execution_engine.cancel_stop_loss_order(pm.symbol, order_id)
-                        logger.info(f"[{pm.symbol}] 平倉清理殘留止損: {order_id}")
+                        logger.info("[%s] 平倉清理殘留止損: %s", pm.symbol, order_id)
                     except Exception as e:
-                        logger.warning(f"[{pm.symbol}] 清理殘留止損失敗（可能已觸發）: {order_id} — {e}")
+                        logger.warning("[%s] 清理殘留止損失敗（可能已觸發）: %s — %s", pm.symbol, order_id, e)
 
                 if pm.exit_reason in ('early_stop_r', 'stage1_timeout'):
                     self.early_exit_cooldown[symbol] = datetime.now(timezone.utc)
@@ -1028,7 +1283,7 @@ class TradingBotV6:
         if state_changed or closed_symbols:
             self._save_positions()
 
-        logger.debug(f"監控完成 | 剩餘持倉: {len(self.active_trades)}")  # 降噪
+        logger.debug("監控完成 | 剩餘持倉: %d", len(self.active_trades))  # 降噪
 
         # Structured cycle summary
         active_summary = ','.join(
@@ -1041,7 +1296,7 @@ class TradingBotV6:
         cycle_unrealized_pnl = 0.0
         for pos in self.active_trades.values():
             try:
-                current_price = self.fetch_ticker(pos.symbol)['last']
+                current_price = (tickers.get(pos.symbol) or self.fetch_ticker(pos.symbol))['last']
                 if current_price and pos.avg_entry and pos.total_size:
                     if pos.side == 'LONG':
                         pnl = (current_price - pos.avg_entry) * pos.total_size
@@ -1089,7 +1344,7 @@ class TradingBotV6:
                 'GET', '/fapi/v1/algoOrder/openOrders'
             )
             if response.status_code == 200:
-                for o in response.json().get('orders', []):
+                for o in response_json(response).get('orders', []):
                     sym = o.get('symbol', '')
                     trigger = o.get('triggerPrice') or o.get('stopPrice')
                     if sym and trigger:
@@ -1106,7 +1361,7 @@ class TradingBotV6:
                 'GET', '/fapi/v1/openOrders'
             )
             if response.status_code == 200:
-                for o in response.json():
+                for o in response_json(response):
                     if o.get('type') in ('STOP_MARKET', 'STOP'):
                         sym = o.get('symbol', '')
                         trigger = o.get('stopPrice') or o.get('triggerPrice')
@@ -1212,6 +1467,23 @@ class TradingBotV6:
             self._save_positions()
             logger.warning(f"[ADOPT] 共接管 {adopted} 個幽靈倉位，已存入 positions.json")
 
+    def _prefetch_exchange_positions(self):
+        """
+        掃描期間在背景先查交易所持倉，讓之後的 _sync_exchange_positions 不必再等一次 RTT
+
+        結果寫進 RiskManager 帳戶快取；查詢未完成時 sync 經 single-flight 共用同一次請求，
+        掃描中若開倉，invalidate() 會讓這次結果不寫入快取，sync 改抓成交後狀態。
+        """
+        if Config.V6_DRY_RUN:
+            return None
+        return self._submit_prefetch(self.risk_manager.get_positions)
+
+    def _submit_prefetch(self, fn) -> Future:
+        """送到背景預抓執行緒（帳戶類 REST 查詢，與主執行緒的 K 線抓取 / 掃描重疊）"""
+        if self._prefetch_pool is None:
+            self._prefetch_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='prefetch')
+        return self._prefetch_pool.submit(fn)
+
     def _sync_exchange_positions(self):
         """
         交易所倉位 reconciliation（每次 monitor_positions 都執行）。
@@ -1246,7 +1518,7 @@ class TradingBotV6:
 
             # === 防護 2：正向檢查 — bot 有、exchange 無 → hard_stop_hit ===
             for symbol, pm in list(self.active_trades.items()):
-                symbol_id = symbol.replace('/', '')
+                symbol_id = exchange_symbol_id(symbol)
                 ex_amt = exchange_map.get(symbol_id, exchange_map.get(symbol))
 
                 if ex_amt is None or ex_amt == 0:
@@ -1256,8 +1528,8 @@ class TradingBotV6:
                     pm.exit_reason = 'hard_stop_hit'
                     pm.is_closed = True
                     hard_stop_detected = True
-                    TelegramNotifier.notify_action(
-                        symbol, '硬止損觸發',
+                    TelegramNotifier.dispatch(
+                        TelegramNotifier.notify_action, symbol, '硬止損觸發',
                         pm.current_sl,
                         f"交易所已無持倉，推測硬止損已觸發"
                     )
@@ -1272,7 +1544,7 @@ class TradingBotV6:
                         )
 
             # === 防護 4：反向檢查 — exchange 有、bot 沒有 → 幽靈倉位 ===
-            bot_symbol_ids = {s.replace('/', '') for s in self.active_trades}
+            bot_symbol_ids = {exchange_symbol_id(s) for s in self.active_trades}
             for sym, ex_amt in exchange_map.items():
                 if sym not in bot_symbol_ids and ex_amt > 0:
                     ccxt_sym = sym[:-4] + '/' + sym[-4:] if sym.endswith('USDT') else sym
@@ -1356,6 +1628,7 @@ class TradingBotV6:
                 return True
 
             # --- 止損單 → 放入 pending_stop_cancels（非阻塞），平倉優先 ---
+            self._pending_sl.pop(pm.symbol, None)
             if pm.stop_order_id:
                 pm.pending_stop_cancels.append(pm.stop_order_id)
                 pm.stop_order_id = None
@@ -1431,7 +1704,7 @@ class TradingBotV6:
             })
 
             # Telegram
-            TelegramNotifier.notify_exit(pm.symbol, {
+            TelegramNotifier.dispatch(TelegramNotifier.notify_exit, pm.symbol, {
                 'side': pm.side,
                 'entry_price': pm.avg_entry,
                 'exit_reason': exit_reason,
@@ -1452,7 +1725,6 @@ class TradingBotV6:
 
             # V7: 用策略的 calculate_add_size + decision 中的 new_sl
             if pm.strategy_name == 'v7_structure':
-                from trader.strategies.v7_structure import V7StructureStrategy
                 new_sl = decision.get('new_sl') if decision else None
                 if new_sl is None:
                     logger.error(f"{pm.symbol} V7 Stage 2: decision 缺少 new_sl")
@@ -1520,8 +1792,8 @@ class TradingBotV6:
                 f"{pm.symbol} 階段2 加倉完成: +{add_size:.6f} @ ${fill_price:.2f} | "
                 f"總倉位={pm.total_size:.6f} | 止損=${pm.current_sl:.2f}（保本）"
             )
-            TelegramNotifier.notify_action(
-                pm.symbol,
+            TelegramNotifier.dispatch(
+                TelegramNotifier.notify_action, pm.symbol,
                 'V7加倉' if pm.strategy_name == 'v7_structure' else '1.5R移損',
                 fill_price,
                 f"Stage2 加倉 +{add_size:.6f} 總={pm.total_size:.6f} SL=${pm.current_sl:.2f}"
@@ -1537,7 +1809,6 @@ class TradingBotV6:
 
             # V7: 用策略的 calculate_add_size + decision 中的 new_sl
             if pm.strategy_name == 'v7_structure':
-                from trader.strategies.v7_structure import V7StructureStrategy
                 new_sl = decision.get('new_sl') if decision else None
                 if new_sl is None:
                     logger.error(f"{pm.symbol} V7 Stage 3: decision 缺少 new_sl")
@@ -1561,8 +1832,6 @@ class TradingBotV6:
                 )
                 swing_stop = new_sl  # V7: new_sl 就是 swing-based SL
             else:
-                from trader.structure import StructureAnalysis
-
                 if df_1h is not None and not df_1h.empty:
                     if pm.side == 'LONG':
                         swing_price = StructureAnalysis.find_latest_confirmed_swing(
@@ -1646,8 +1915,8 @@ class TradingBotV6:
                     f"[模擬] {pm.symbol} {label} 減倉: -{reduce_size:.6f} "
                     f"@ ${current_price:.2f} PnL=${partial_pnl:+.2f}"
                 )
-                TelegramNotifier.notify_action(
-                    pm.symbol, '目標減倉',
+                TelegramNotifier.dispatch(
+                    TelegramNotifier.notify_action, pm.symbol, '目標減倉',
                     current_price,
                     f"{label} -{reduce_size:.6f} PnL=${partial_pnl:+.2f}"
                 )
@@ -1687,8 +1956,8 @@ class TradingBotV6:
                 f"PnL=${partial_pnl:+.2f} 累積=${pm.realized_partial_pnl:+.2f} | "
                 f"剩餘={pm.total_size:.6f} | 止損=${pm.current_sl:.2f}"
             )
-            TelegramNotifier.notify_action(
-                pm.symbol, '目標減倉',
+            TelegramNotifier.dispatch(
+                TelegramNotifier.notify_action, pm.symbol, '目標減倉',
                 fill_price,
                 f"{label} -{reduce_size:.6f} PnL=${partial_pnl:+.2f} 剩餘={pm.total_size:.6f}"
             )
@@ -1712,38 +1981,48 @@ class TradingBotV6:
         """啟動診斷"""
         logger.info("執行啟動診斷...")
 
+        # 帳戶查詢與 K 線抓取互不相依：餘額 / 持倉先送到背景，與下方 K 線批次重疊；
+        # 持倉結果留在帳戶快取，診斷後的 _adopt_ghost_positions 不必再等一次 RTT
+        balance_future = None if Config.V6_DRY_RUN else self._submit_prefetch(self.risk_manager.get_balance)
+        self._prefetch_exchange_positions()
+
+        test_symbol = Config.SYMBOLS[0] if Config.SYMBOLS else 'BTC/USDT'
+        # 信號框架與 4H 一次並行抓取，診斷耗時為最慢的一次請求而非總和
+        diag_requests = [(test_symbol, tf, limit) for tf, limit in Config.DIAGNOSTIC_TIMEFRAMES]
+        fetched = self.data_provider.fetch_ohlcv_batch(diag_requests)
+
         try:
-            if Config.V6_DRY_RUN:
+            if balance_future is None:
                 balance = 10000.0
-                logger.info(f"[模擬] 餘額: ${balance:.2f} USDT")
+                logger.info("[模擬] 餘額: $%.2f USDT", balance)
             else:
-                balance = self.risk_manager.get_balance()
-                logger.info(f"API 正常 | 餘額: ${balance:.2f} USDT")
+                balance = balance_future.result()
+                logger.info("API 正常 | 餘額: $%.2f USDT", balance)
             self.initial_balance = balance
         except Exception as e:
-            logger.error(f"API 連線失敗: {e}")
+            logger.error("API 連線失敗: %s", e)
             return False
 
-        test_symbol = Config.SYMBOLS[0] if Config.SYMBOLS else 'BTC/USDT'
-        df = self.fetch_ohlcv(test_symbol, Config.TIMEFRAME_SIGNAL, limit=50)
+        df = fetched.get(diag_requests[0], pd.DataFrame())
         if df.empty:
-            logger.error(f"數據獲取失敗: {test_symbol}")
+            logger.error("數據獲取失敗: %s", test_symbol)
             return False
-        logger.info(f"數據正常 | {test_symbol}: {len(df)} 根K線")
+        logger.info("數據正常 | %s: %d 根K線", test_symbol, len(df))
 
-        # V6.0: 4H 數據測試
-        df_4h = self.fetch_ohlcv(test_symbol, '4h', limit=20)
-        if df_4h.empty:
-            logger.warning("4H 數據獲取失敗（非關鍵）")
-        else:
-            logger.info(f"4H 數據正常 | {len(df_4h)} 根K線")
+        # V6.0: 其餘時間框架（4H）測試，非關鍵
+        for req in diag_requests[1:]:
+            df_tf = fetched.get(req, pd.DataFrame())
+            if df_tf.empty:
+                logger.warning("%s 數據獲取失敗（非關鍵）", req[1].upper())
+            else:
+                logger.info("%s 數據正常 | %d 根K線", req[1].upper(), len(df_tf))
 
         # V6.0: Config 驗證
         try:
             Config.validate()
             logger.info("Config 驗證通過")
         except ValueError as e:
-            logger.error(f"Config 驗證失敗: {e}")
+            logger.error("Config 驗證失敗: %s", e)
             return False
 
         logger.info("啟動診斷通過")
@@ -1751,6 +2030,120 @@ class TradingBotV6:
 
     # ==================== 主循環 ====================
 
+    @staticmethod
+    def _run_phase(cycle: int, name: str, phase) -> bool:
+        """執行主循環的單一階段；例外只記錄（型別在前）並回傳 False，不中斷其餘階段"""
+        try:
+            phase()
+            return True
+        except Exception as e:
+            logger.error("循環 #%d %s階段錯誤 %s: %s", cycle, name, type(e).__name__, e)
+            return False
+
+    @staticmethod
+    def _error_backoff(fail_streak: int) -> float:
+        """
+        主循環出錯後的等待秒數：CHECK_INTERVAL × 2^連續失敗次數，上限 LOOP_ERROR_MAX_BACKOFF_SECONDS，±20% jitter
+
+        交易所限流 / 斷線時不以固定頻率持續重打；jitter 避免多個實例同步重試。
+        """
+        base = min(Config.LOOP_ERROR_MAX_BACKOFF_SECONDS, Config.CHECK_INTERVAL * 2 ** min(fail_streak, 16))
+        return base * random.uniform(0.8, 1.2)
+
+    @staticmethod
+    def _scan_skip_cycles(fail_streak: int) -> int:
+        """
+        掃描連續失敗後要跳過的輪數：1, 2, 4…，上限為 LOOP_ERROR_MAX_BACKOFF_SECONDS 內的輪數
+
+        只退避掃描本身：同步與持倉監控仍按 CHECK_INTERVAL 每輪執行，止損管理不被拖慢。
+        """
+        cap = max(1, int(Config.LOOP_ERROR_MAX_BACKOFF_SECONDS // Config.CHECK_INTERVAL))
+        return min(cap, 2 ** min(fail_streak, 16))
+
+    def request_config_reload(self, config_path: str):
+        """登記配置熱重載（供 SIGHUP handler 呼叫）：不在 signal handler 裡改 Config，以免掃描途中參數變動"""
+        self._config_reload_path = config_path
+
+    def _apply_config_reload(self):
+        """
+        處理待辦的配置熱重載：Config.load_from_json 檔案未變更時不重新解析
+
+        dry-run 只能由重載開啟、不能關閉：--dry-run 啟動的實例不會因改配置檔而轉為真實下單，
+        切到實盤需要重啟。重載失敗（JSON 錯誤 / 驗證不過）時 Config 維持重載前的值，只記錄，
+        機器人照常運行。secrets.json 不重載：API client / ccxt 已用啟動時的金鑰建立，換金鑰需重啟。
+        """
+        config_path = self._config_reload_path
+        if config_path is None:
+            return
+        self._config_reload_path = None
+        dry_run = Config.V6_DRY_RUN
+        try:
+            Config.load_from_json(config_path, include_secrets=False)
+            logger.info("已重新加載配置: %s（secrets.json 不重載，換金鑰需重啟）", config_path)
+        except Exception as e:
+            logger.error("配置熱重載失敗，沿用原配置: %s", e)
+        if dry_run:
+            Config.V6_DRY_RUN = True  # type: ignore[assignment]
+
+    def request_refresh(self):
+        """
+        請求立即開始下一輪（供 SIGUSR1 handler 呼叫）
+
+        只設旗標、不碰任何 Event：handler 在主執行緒的位元組碼之間執行，主執行緒可能正持有
+        Event 內部的 Condition 鎖（wait / clear 途中），此時 Event.set() 會在同一執行緒上
+        自我死鎖。循環間等待以 _REFRESH_POLL_SECONDS 分段檢查旗標；正在跑的一輪照常完成。
+        """
+        self._refresh_requested = True
+
+    def _wait_event(self, event: threading.Event, timeout: float) -> bool:
+        """分段等待 event 至多 timeout 秒；event 觸發或收到刷新請求時回傳 True"""
+        remaining = timeout
+        while not self._refresh_requested:
+            step = min(remaining, self._REFRESH_POLL_SECONDS)
+            if event.wait(step):
+                return True
+            remaining -= step
+            if remaining <= 0:
+                return self._refresh_requested
+        return True
+
+    def _wait_next_cycle(self):
+        """
+        等待下一輪：信號框架 K 線收盤推播到達時立即開始，否則等到本輪開始後滿 CHECK_INTERVAL
+
+        以 monotonic 截止時間排程：週期固定為 CHECK_INTERVAL，不會因每輪工作耗時而漂移成
+        工作時間 + CHECK_INTERVAL，也不受系統時鐘調整影響。落後超過一個週期時不補跑，
+        從現在重新對齊。收盤後才有新的已確認 K 線可判斷，不必等滿間隔；CHECK_INTERVAL
+        保留為監控持倉與串流斷線時的輪詢上限。request_refresh（SIGUSR1）同樣提前喚醒。
+        """
+        now = time.monotonic()
+        started = self._cycle_started_at if self._cycle_started_at is not None else now
+        # 以經過時間計算剩餘秒數：(started + 間隔) - now 的浮點誤差會讓剛開始的一輪不是整整 CHECK_INTERVAL
+        remaining = max(Config.CHECK_INTERVAL - (now - started), 0.0)
+        deadline = now + remaining
+        logger.debug("休息 %.1f 秒...\n", remaining)
+
+        cache = self.market_cache
+        wake = cache.bar_closed if cache is not None and cache.connected else self._wake
+        if self._wait_event(wake, remaining):
+            # 掃描期間其他標的的收盤推播會再 set，下一次等待立即返回（至多多掃一輪）
+            wake.clear()
+            deadline = time.monotonic()
+            if self._refresh_requested:
+                self._refresh_requested = False
+                logger.info("收到刷新請求，立即開始下一輪")
+            else:
+                logger.debug("%s K 線收盤，提前開始下一輪", Config.TIMEFRAME_SIGNAL)
+        self._cycle_started_at = deadline
+
+    def _backoff_wait(self, delay: float):
+        """出錯後的退避等待；request_refresh（SIGUSR1）同樣提前結束，立即重試"""
+        if self._wait_event(self._wake, delay):
+            self._wake.clear()
+            self._refresh_requested = False
+            logger.info("收到刷新請求，結束退避立即重試")
+        self._cycle_started_at = time.monotonic()
+
     def run(self):
         """主運行循環"""
         if not self.startup_diagnostics():
@@ -1762,40 +2155,99 @@ class TradingBotV6:
         # 接管交易所有但 positions.json 未記錄的倉位（幽靈倉位恢復）
         self._adopt_ghost_positions()
 
+        # 帳戶推播：成交 / 餘額變動即時讓快取失效，取代高頻輪詢（失敗時維持 REST）
+        user_stream = None
+        if Config.USE_USER_STREAM and Config.TRADING_MODE == 'future' and not Config.V6_DRY_RUN:
+            user_stream = UserDataStream(self.futures_client, self.risk_manager, sandbox=Config.SANDBOX_MODE)
+            user_stream.start()
+
+        # 行情推播：K 線 / 最新價由 kline 串流維護，fetch_ohlcv / fetch_ticker 命中時不打 REST
+        if Config.USE_MARKET_STREAM and Config.TRADING_MODE == 'future':
+            market_cache = MarketDataCache(sandbox=Config.SANDBOX_MODE, trigger_timeframe=Config.TIMEFRAME_SIGNAL)
+            if market_cache.start():
+                self.market_cache = market_cache
+                self.data_provider.market_cache = market_cache
+
+        # Telegram 指令獨立執行緒：查詢不必等本輪掃描 / 監控跑完
+        self.telegram_handler.start()
+
         cycle = 0
+        fail_streak = 0        # 同步 / 監控連續失敗的輪數（整個循環退避）
+        scan_fail_streak = 0   # 掃描連續失敗次數（只退避掃描）
+        scan_skip = 0          # 剩餘要跳過掃描的輪數
+        self._cycle_started_at = time.monotonic()
         while True:
             try:
                 cycle += 1
-                logger.debug(f"[循環 #{cycle}]")
-
-                self.scan_for_signals()
-                self._sync_exchange_positions()  # 每 cycle 都執行，active_trades 為空時也偵測幽靈倉位
-                self.monitor_positions()
-                self.telegram_handler.poll()
+                logger.debug("[循環 #%d]", cycle)
+
+                self._apply_config_reload()
+                self._prefetch_exchange_positions()
+                # 各階段各自攔錯：掃描失敗不影響本輪的同步與持倉監控，且只退避掃描本身
+                if scan_skip > 0:
+                    scan_skip -= 1
+                    logger.debug("循環 #%d 掃描退避中，跳過（剩 %d 輪）", cycle, scan_skip)
+                elif self._run_phase(cycle, '掃描', self.scan_for_signals):
+                    scan_fail_streak = 0
+                else:
+                    scan_skip = self._scan_skip_cycles(scan_fail_streak)
+                    scan_fail_streak += 1
+                    logger.warning("掃描連續失敗 %d 次，之後 %d 輪跳過掃描", scan_fail_streak, scan_skip)
+
+                core_ok = all([
+                    # 每 cycle 都執行，active_trades 為空時也偵測幽靈倉位
+                    self._run_phase(cycle, '同步', self._sync_exchange_positions),
+                    self._run_phase(cycle, '監控', self.monitor_positions),
+                ])
+                if core_ok:
+                    fail_streak = 0
+                    self._wait_next_cycle()
+                    continue
 
-                logger.debug(f"休息 {Config.CHECK_INTERVAL} 秒...\n")
-                time.sleep(Config.CHECK_INTERVAL)
+                delay = self._error_backoff(fail_streak)
+                fail_streak += 1
+                logger.warning("循環 #%d 同步 / 監控失敗（連續 %d 次），%.0f 秒後重試", cycle, fail_streak, delay)
+                self._backoff_wait(delay)
 
             except KeyboardInterrupt:
                 logger.info("使用者中斷，停止運行")
                 self._save_positions()
+                self.telegram_handler.stop()
+                for pool in (self._prefetch_pool, self._stop_pool):
+                    if pool is not None:
+                        pool.shutdown(wait=False)
+                if user_stream is not None:
+                    user_stream.stop()
+                if self.market_cache is not None:
+                    self.market_cache.stop()
                 break
             except Exception as e:
-                logger.error(f"循環 #{cycle} 錯誤: {e}")
-                time.sleep(Config.CHECK_INTERVAL)
+                delay = self._error_backoff(fail_streak)
+                fail_streak += 1
+                logger.error("循環 #%d 錯誤（連續 %d 次，%.0f 秒後重試）: %s", cycle, fail_streak, delay, e)
+                self._backoff_wait(delay)
 
 
 # ==================== 入口 ====================
 if __name__ == "__main__":
-    import argparse
+    import atexit
+    import queue
 
     # SIGTERM → KeyboardInterrupt（systemd stop 時 graceful flush positions）
     signal.signal(signal.SIGTERM, lambda *_: (_ for _ in ()).throw(KeyboardInterrupt()))
 
-    parser = argparse.ArgumentParser(description='Trading Bot V6.0')
-    parser.add_argument('--dry-run', action='store_true', help='Dry run mode')
-    parser.add_argument('--debug', action='store_true', help='Debug mode')
-    args = parser.parse_args()
+    # 只有兩個布林旗標，直接查 sys.argv：supervisor 崩潰重啟時省下 argparse 的載入與建構
+    _usage = "usage: bot.py [--dry-run] [--debug]\n  --dry-run  Dry run mode\n  --debug    Debug mode"
+    _argv = sys.argv[1:]
+    if '-h' in _argv or '--help' in _argv:
+        print(_usage)
+        sys.exit(0)
+    _unknown = [a for a in _argv if a not in ('--dry-run', '--debug')]
+    if _unknown:
+        print(f"{_usage}\nbot.py: error: unrecognized arguments: {' '.join(_unknown)}", file=sys.stderr)
+        sys.exit(2)
+    dry_run = '--dry-run' in _argv
+    debug = '--debug' in _argv
 
     # Runtime 目錄（.log/ 子目錄）
     project_root = Path(__file__).resolve().parent.parent
@@ -1804,18 +2256,20 @@ if __name__ == "__main__":
 
     # 設定 logging
     log_file = str(log_dir / 'v6_bot.log')
-    log_level = logging.DEBUG if args.debug else logging.INFO
-
-    logging.basicConfig(
-        level=log_level,
-        format='%(asctime)s [%(levelname)s] %(message)s',
-        handlers=[
-            logging.StreamHandler(),
-            logging.handlers.RotatingFileHandler(
-                log_file, maxBytes=5*1024*1024, backupCount=3, encoding='utf-8'
-            ),
-        ],
+    log_level = logging.DEBUG if debug else logging.INFO
+
+    # 格式只用 asctime / levelname / message：關掉每筆 record 的執行緒 / 行程資訊（僅用公開開關）
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    log_format = logging.Formatter('%(asctime)s [%(levelname)s] %(message)s')
+    console_handler = logging.StreamHandler()
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=5*1024*1024, backupCount=3, encoding='utf-8'
     )
+    for _handler in (console_handler, file_handler):
+        _handler.setFormatter(log_format)
 
     # [TRADE] 日誌分流到 .log/v6_trades.log
     class _TradeFilter(logging.Filter):
@@ -1829,7 +2283,20 @@ if __name__ == "__main__":
     _trade_handler.setFormatter(logging.Formatter('%(message)s'))
     _trade_handler.addFilter(_TradeFilter())
     _trade_handler.setLevel(logging.INFO)
-    logging.getLogger().addHandler(_trade_handler)
+
+    # console / 檔案寫入交給背景 listener：主循環記錄一筆 log 只是 queue.put，
+    # 每筆 write + flush（含 rotation 檢查）的 syscall 不落在掃描 / 監控路徑上
+    log_queue = queue.SimpleQueue()
+    log_listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, _trade_handler, respect_handler_level=True
+    )
+    log_listener.start()
+    atexit.register(log_listener.stop)  # 結束時排空 queue，最後幾行不遺失
+
+    # queue 端只展開 message（含 traceback），時間 / 等級由 listener 端各 handler 的 formatter 加上
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    logging.basicConfig(level=log_level, handlers=[queue_handler])
 
     # WARNING/ERROR 轉發到 Telegram（節流：同訊息 5 分鐘內不重複發送）
     class _TelegramLogHandler(logging.Handler):
@@ -1857,7 +2324,7 @@ if __name__ == "__main__":
                 if len(self._last_sent) > 100:
                     cutoff = now - 300
                     self._last_sent = {k: v for k, v in self._last_sent.items() if v > cutoff}
-                TelegramNotifier.notify_warning(msg)
+                TelegramNotifier.dispatch(TelegramNotifier.notify_warning, msg)
             except Exception:
                 pass  # 通知失敗不影響主程式
 
@@ -1869,10 +2336,16 @@ if __name__ == "__main__":
         # bot_config.json 相對於專案根目錄（bot.py 的上層），不依賴 CWD
         config_path = str(Path(__file__).parent.parent / "bot_config.json")
         Config.load_from_json(config_path)
-        if args.dry_run:
+        if dry_run:
             Config.V6_DRY_RUN = True  # type: ignore[assignment]
 
         bot = TradingBotV6()
+        # SIGHUP → 下一輪開始前重新加載 bot_config.json（不含 secrets.json；Windows 無 SIGHUP）
+        if hasattr(signal, 'SIGHUP'):
+            signal.signal(signal.SIGHUP, lambda *_: bot.request_config_reload(config_path))
+        # SIGUSR1 → 不等 CHECK_INTERVAL，目前這輪結束後立即掃描 / 監控（Windows 無 SIGUSR1）
+        if hasattr(signal, 'SIGUSR1'):
+            signal.signal(signal.SIGUSR1, lambda *_: bot.request_refresh())
         bot.run()
     except Exception as e:
         logger.error(f"機器人啟動失敗: {e}")
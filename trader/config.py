@@ -9,9 +9,19 @@ import json
 import logging
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _diagnostic_timeframes(signal_timeframe: str) -> tuple:
+    """啟動診斷抓取的 (timeframe, 根數)：信號框架 50 根 + 4H 20 根（class 預設與 load_from_json 共用）"""
+    return ((signal_timeframe, 50), ('4h', 20))
+
+
 class Config:
     """
     Trading Bot 配置類（獨立版）
@@ -64,6 +74,10 @@ class Config:
     MTF_EMA_FAST = 20
     MTF_EMA_SLOW = 50
 
+    # 啟動診斷抓取的 (timeframe, 根數)：第一組失敗即診斷失敗，其餘只警告。
+    # 由時間框架設定推導，load_from_json 後重建；startup_diagnostics 直接讀取
+    DIAGNOSTIC_TIMEFRAMES = _diagnostic_timeframes(TIMEFRAME_SIGNAL)
+
     # 動態閾值系統
     ENABLE_DYNAMIC_THRESHOLDS = True
     ADX_BASE_THRESHOLD = 18
@@ -111,9 +125,20 @@ class Config:
     # 其他
     ENABLE_STRUCTURE_BREAK_EXIT = True
     CHECK_INTERVAL = 60
+    LOOP_ERROR_MAX_BACKOFF_SECONDS = 300  # 主循環連續出錯時的退避上限（CHECK_INTERVAL 起倍增）
     MAX_RETRY = 3
     RETRY_DELAY = 5
     TREND_CACHE_HOURS = 4
+    OHLCV_FETCH_CONCURRENCY = 8   # 掃描時 K 線並行抓取上限（尊重 API rate limit）
+    OHLCV_CACHE_TTL_SECONDS = 30  # REST K 線短期快取（< CHECK_INTERVAL：只去重同一週期內 scan / monitor 的重複抓取）
+    ACCOUNT_CACHE_TTL_SECONDS = 15  # balance / positions 快取秒數（成交後立即失效）
+    USE_USER_STREAM = True        # Binance user-data WebSocket（需 websocket-client；未安裝時維持 REST 輪詢）
+    USER_STREAM_CACHE_TTL_SECONDS = 300  # 串流連線中 balance / positions 快取上限（推播觸發即時失效）
+    USE_MARKET_STREAM = True      # Binance kline WebSocket 維護 K 線 / 最新價快取（需 websocket-client；未安裝時走 REST）
+    MARKET_STREAM_PRICE_MAX_AGE_SECONDS = 10  # 推播最新價超過此秒數未更新 → fetch_ticker 改走 REST
+    MARKET_STREAM_IDLE_SECONDS = 1800  # 序列多久沒被讀取就取消訂閱
+    ORDER_IO_CONCURRENCY = 5      # 同一輪多個持倉的止損更新並行送出上限
+    STRICT_DECIMAL_ROUNDING = False  # True: round_amount 走 Decimal（稽核用，較慢）
 
     # ==================== V6.0 滾倉系統 ====================
 
@@ -270,6 +295,8 @@ class Config:
     POSITIONS_JSON_PATH = str(Path(__file__).resolve().parent.parent / '.log' / 'positions.json')
     LOG_FILE_PATH = str(Path(__file__).resolve().parent.parent / '.log' / 'bot.log')
     AUTO_BACKUP_ON_STAGE_CHANGE = True
+    EXCHANGE_INFO_CACHE_PATH = str(Path(__file__).resolve().parent.parent / '.log' / 'exchange_info.json')
+    EXCHANGE_INFO_TTL_SECONDS = 3600  # exchangeInfo 全量精度快取（記憶體 + 磁碟）
     DB_PATH = "performance.db"
 
     # ==================== Scanner 整合 ====================
@@ -278,6 +305,9 @@ class Config:
     SCANNER_JSON_PATH = 'hot_symbols.json'
     SCANNER_MAX_AGE_MINUTES = 60
 
+    # load_from_json 上次成功加載時的檔案簽章 {config 絕對路徑: ((mtime_ns, size), secrets 同)}
+    _loaded_signatures: dict = {}
+
     # ==================== Config Validation ====================
 
     @classmethod
@@ -314,17 +344,36 @@ class Config:
         return True
 
     @classmethod
-    def load_from_json(cls, config_file: str = "bot_config.json"):
-        """從 JSON 配置文件加載設置"""
+    def load_from_json(cls, config_file: str = "bot_config.json", include_secrets: bool = True):
+        """
+        從 JSON 配置文件加載設置
+
+        config / secrets 的 (mtime, size) 與上次加載相同時直接返回，不重新解析；
+        SIGHUP 熱重載對未改動的檔案因此是 no-op。
+
+        先解析出所有待套用的值，套用後驗證；驗證失敗時還原成加載前的值再 raise，
+        不會留下一半新、一半舊或未通過驗證的配置。
+
+        Args:
+            include_secrets: 是否一併加載同目錄的 secrets.json。熱重載傳 False：
+                API client / ccxt 已用啟動時的金鑰建立，重載金鑰不會生效，換金鑰需重啟
+        """
         if not os.path.exists(config_file):
             logger.warning(f"⚠️ 配置文件 {config_file} 不存在，使用默認配置")
             return
 
-        try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
+        config_dir = os.path.dirname(os.path.abspath(config_file))
+        secrets_path = os.path.join(config_dir, "secrets.json")
+        cache_key = os.path.abspath(config_file)
+        signature = (_file_signature(config_file), _file_signature(secrets_path) if include_secrets else None)
+        if cls._loaded_signatures.get(cache_key) == signature:
+            logger.debug(f"配置文件 {config_file} 未變更，略過重新加載")
+            return
 
-            loaded_count = 0
+        # --- 解析 bot_config.json（尚未套用）---
+        assignments = []  # [(attr_name, value)]
+        try:
+            config_data = _read_json(config_file)
             unknown_keys = []
             for json_key, value in config_data.items():
                 attr_name = json_key.upper()
@@ -332,45 +381,85 @@ class Config:
                     current = getattr(cls, attr_name)
                     # dict 類型用 merge（保留未覆寫的 key）
                     if isinstance(current, dict) and isinstance(value, dict):
-                        current.update(value)
-                        value = current
-                    setattr(cls, attr_name, value)
-                    loaded_count += 1
+                        value = {**current, **value}
+                    assignments.append((attr_name, value))
                 else:
                     unknown_keys.append(json_key)
-
-            logger.info(f"✅ 已從 {config_file} 加載 {loaded_count} 項配置")
-            if unknown_keys:
-                logger.debug(f"⚠️ 以下 JSON key 無對應的 Config 屬性（已忽略）: {unknown_keys}")
-
         except Exception as e:
             logger.error(f"❌ 加載配置文件失敗: {e}")
             logger.info("⚠️ 將使用默認配置")
             return
+        loaded_count = len(assignments)
 
-        # --- 載入 secrets.json ---
-        config_dir = os.path.dirname(os.path.abspath(config_file))
-        secrets_path = os.path.join(config_dir, "secrets.json")
-        if os.path.exists(secrets_path):
+        # --- 解析 secrets.json ---
+        secrets_count = 0
+        if include_secrets and os.path.exists(secrets_path):
             try:
-                with open(secrets_path, 'r', encoding='utf-8') as f:
-                    secrets_data = json.load(f)
-                for key, value in secrets_data.items():
-                    attr_name = key.upper()
-                    setattr(cls, attr_name, value)
-                logger.info(f"✅ 已從 {secrets_path} 加載 {len(secrets_data)} 項 secrets")
+                secrets_data = _read_json(secrets_path)
+                assignments.extend((key.upper(), value) for key, value in secrets_data.items())
+                secrets_count = len(secrets_data)
             except Exception as e:
                 logger.error(f"❌ 加載 secrets 失敗: {e}")
-        else:
+        elif include_secrets:
             logger.warning(f"⚠️ Secrets 文件不存在: {secrets_path}（將使用 class defaults）")
 
-        # 載入後自動驗證
+        # --- 套用 + 驗證，失敗則還原 ---
+        snapshot = {}
+        for attr_name in [a for a, _ in assignments] + ['DIAGNOSTIC_TIMEFRAMES']:
+            if attr_name not in snapshot:
+                current = getattr(cls, attr_name, _MISSING)
+                snapshot[attr_name] = (current, dict(current) if isinstance(current, dict) else None)
+        for attr_name, value in assignments:
+            current = getattr(cls, attr_name, None)
+            if isinstance(current, dict) and isinstance(value, dict):
+                # 原地更新：保留其他模組持有的同一個 dict 物件
+                current.update(value)
+            else:
+                setattr(cls, attr_name, value)
+        cls.DIAGNOSTIC_TIMEFRAMES = _diagnostic_timeframes(cls.TIMEFRAME_SIGNAL)
+
         try:
             cls.validate()
         except ValueError as e:
-            logger.error(f"❌ Config validation failed: {e}")
+            logger.error(f"❌ Config validation failed（已還原加載前的配置）: {e}")
+            for attr_name, (original, dict_copy) in snapshot.items():
+                if original is _MISSING:
+                    delattr(cls, attr_name)
+                    continue
+                if dict_copy is not None:
+                    original.clear()
+                    original.update(dict_copy)
+                setattr(cls, attr_name, original)
             raise
 
+        logger.info(f"✅ 已從 {config_file} 加載 {loaded_count} 項配置")
+        if unknown_keys:
+            logger.debug(f"⚠️ 以下 JSON key 無對應的 Config 屬性（已忽略）: {unknown_keys}")
+        if secrets_count:
+            logger.info(f"✅ 已從 {secrets_path} 加載 {secrets_count} 項 secrets")
+        cls._loaded_signatures[cache_key] = signature
+
+
+_MISSING = object()
+
+
+def _file_signature(path: str):
+    """(mtime_ns, size)；檔案不存在回 None"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _read_json(path: str):
+    """讀整個檔案的 bytes 交給 orjson（C 解析器，不經文字 I/O 解碼層）；沒有 orjson 時用 stdlib json"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
 
 # Alias for convenience
 ConfigV6 = Config  # backward compat alias
@@ -11,14 +11,14 @@
   _futures_close_position   → close_position
   _place_hard_stop_loss     → place_hard_stop_loss
   _cancel_stop_loss_order   → cancel_stop_loss_order
-  _update_hard_stop_loss    → update_hard_stop_loss
+  _update_hard_stop_loss    → update_hard_stop_loss（先嘗試 modify_hard_stop_loss）
 """
 
 import logging
-from typing import Optional
+from typing import Dict, Iterable, Optional
 
 from trader.config import Config
-from trader.infrastructure.api_client import BinanceFuturesClient
+from trader.infrastructure.api_client import BinanceFuturesClient, exchange_symbol_id, response_json
 from trader.risk.manager import PrecisionHandler
 
 logger = logging.getLogger(__name__)
@@ -27,40 +27,59 @@ logger = logging.getLogger(__name__)
 class OrderExecutionEngine:
     """訂單執行引擎：封裝所有與交易所 API 的實際下單互動"""
 
+    # 原地修改止損「不支援」的錯誤碼（-1014 UNKNOWN_ORDER_COMPOSITION、-1020 UNSUPPORTED_OPERATION）；
+    # 其餘 400（價格被拒、精度、會立即觸發…）只是這一筆失敗，不關閉修改路徑
+    _MODIFY_UNSUPPORTED_CODES = frozenset({-1014, -1020})
+
     def __init__(
         self,
         exchange,
         futures_client: BinanceFuturesClient,
         precision_handler: PrecisionHandler,
+        leveraged_symbols: Iterable[str] = (),
     ):
         """
         Args:
             exchange: 已初始化的 ccxt exchange（non-sandbox fallback 用）
             futures_client: BinanceFuturesClient（簽章下單用）
-            precision_handler: PrecisionHandler（數量格式化用）
+            precision_handler: PrecisionHandler（數量 / 觸發價格式化用）
+            leveraged_symbols: 啟動時已設定為 Config.LEVERAGE 的交易對
         """
         self.exchange = exchange
         self.futures_client = futures_client
         self.precision_handler = precision_handler
+        self._modify_supported = True  # 交易所回報不支援修改後關閉
+        # {symbol: 已套用的槓桿}：同一 session 每個交易對只設一次，Config.LEVERAGE 變更時才重設
+        self._leverage_applied: Dict[str, int] = {s: Config.LEVERAGE for s in leveraged_symbols}
 
     # ==================== 槓桿設置 ====================
 
     def set_leverage(self, symbol: str) -> bool:
         """設置槓桿"""
-        symbol_id = symbol.replace('/', '')
+        symbol_id = exchange_symbol_id(symbol)
+        leverage = Config.LEVERAGE
         result = self.futures_client.signed_request_json('POST', '/fapi/v1/leverage', {
-            'symbol': symbol_id, 'leverage': Config.LEVERAGE
+            'symbol': symbol_id, 'leverage': leverage
         })
-        return 'error' not in result
+        if 'error' in result:
+            return False
+        self._leverage_applied[symbol] = leverage
+        return True
+
+    def ensure_leverage(self, symbol: str) -> bool:
+        """本 session 尚未以目前 Config.LEVERAGE 設定過才送出（省下開倉前一次簽章 round-trip）"""
+        if self._leverage_applied.get(symbol) == Config.LEVERAGE:
+            return True
+        return self.set_leverage(symbol)
 
     # ==================== 開倉 ====================
 
     def create_order(self, symbol: str, side: str, quantity: float) -> dict:
-        """下市價單（自動先設置槓桿）"""
-        self.set_leverage(symbol)
+        """下市價單（該交易對尚未設置槓桿時先設置）"""
+        self.ensure_leverage(symbol)
         formatted = self.precision_handler.format_quantity(symbol, quantity)
         params = {
-            'symbol': symbol.replace('/', ''),
+            'symbol': exchange_symbol_id(symbol),
             'side': side.upper(),
             'type': 'MARKET',
             'quantity': formatted,
@@ -81,7 +100,7 @@ class OrderExecutionEngine:
         close_side = 'SELL' if side == 'LONG' else 'BUY'
         formatted = self.precision_handler.format_quantity(symbol, quantity)
         params = {
-            'symbol': symbol.replace('/', ''),
+            'symbol': exchange_symbol_id(symbol),
             'side': close_side,
             'type': 'MARKET',
             'quantity': formatted,
@@ -110,7 +129,7 @@ class OrderExecutionEngine:
         if not Config.USE_HARD_STOP_LOSS:
             return None
         try:
-            symbol_id = symbol.replace('/', '')
+            symbol_id = exchange_symbol_id(symbol)
             stop_side = 'SELL' if side == 'LONG' else 'BUY'
             formatted = self.precision_handler.format_quantity(symbol, size)
 
@@ -121,12 +140,12 @@ class OrderExecutionEngine:
                     'type': 'STOP_MARKET',
                     'algoType': 'CONDITIONAL',
                     'quantity': formatted,
-                    'triggerPrice': f"{stop_price:.2f}",
+                    'triggerPrice': self.precision_handler.format_price(symbol, stop_price),
                     'reduceOnly': 'true',
                 }
                 response = self.futures_client.signed_request('POST', '/fapi/v1/algoOrder', params)
                 if response.status_code == 200:
-                    algo_id = response.json().get('algoId')
+                    algo_id = response_json(response).get('algoId')
                     logger.info(f"{symbol} 硬止損已設定 @ ${stop_price:.2f} (ID: {algo_id})")
                     return str(algo_id)
                 else:
@@ -148,7 +167,7 @@ class OrderExecutionEngine:
             return True
         try:
             if BinanceFuturesClient.is_enabled():
-                params = {'symbol': symbol.replace('/', ''), 'algoId': order_id}
+                params = {'symbol': exchange_symbol_id(symbol), 'algoId': order_id}
                 self.futures_client.signed_request('DELETE', '/fapi/v1/algoOrder', params)
             else:
                 self.exchange.cancel_order(order_id, symbol)
@@ -157,10 +176,56 @@ class OrderExecutionEngine:
             logger.debug(f"取消止損單失敗（可能已觸發）: {e}")
             return False
 
+    def modify_hard_stop_loss(self, pm, new_stop: float) -> bool:
+        """
+        原地修改既有止損單的觸發價（單一 round-trip）。
+
+        Returns:
+            True  — 修改成功，pm.stop_order_id 已更新
+            False — 無既有單 / 交易所不支援 / 失敗，呼叫方改走 cancel + place
+        """
+        if not pm.stop_order_id or not self._modify_supported or not BinanceFuturesClient.is_enabled():
+            return False
+        try:
+            params = {
+                'symbol': exchange_symbol_id(pm.symbol),
+                'algoId': pm.stop_order_id,
+                'side': 'SELL' if pm.side == 'LONG' else 'BUY',
+                'quantity': self.precision_handler.format_quantity(pm.symbol, pm.total_size),
+                'triggerPrice': self.precision_handler.format_price(pm.symbol, new_stop),
+            }
+            response = self.futures_client.signed_request('PUT', '/fapi/v1/algoOrder', params)
+            if response.status_code == 200:
+                algo_id = response_json(response).get('algoId') or pm.stop_order_id
+                pm.stop_order_id = str(algo_id)
+                logger.info(f"{pm.symbol} 硬止損已修改 @ ${new_stop:.2f} (ID: {algo_id})")
+                return True
+            if response.status_code in (404, 405) or (
+                response.status_code == 400 and self._error_code(response) in self._MODIFY_UNSUPPORTED_CODES
+            ):
+                # 端點 / 單型不支援修改 → 本進程之後直接走 cancel + place，不再浪費一次 RTT
+                self._modify_supported = False
+                logger.info(f"止損修改不支援，改用取消重掛: {response.status_code} - {response.text}")
+            else:
+                # 本次修改被拒（含時鐘誤差 -1021）：這一筆改走 cancel + place，下次仍先嘗試修改
+                logger.warning(f"{pm.symbol} 止損修改失敗: {response.status_code} - {response.text}")
+        except Exception as e:
+            logger.warning(f"{pm.symbol} 止損修改失敗: {e}")
+        return False
+
+    @staticmethod
+    def _error_code(response) -> Optional[int]:
+        try:
+            return response_json(response).get('code')
+        except Exception:
+            return None
+
     def update_hard_stop_loss(self, pm, new_stop: float):
-        """更新硬止損單（取消舊的，設置新的，直接更新 pm.stop_order_id）"""
+        """更新硬止損單（優先原地修改，失敗時取消舊的、設置新的；直接更新 pm.stop_order_id）"""
         if not Config.USE_HARD_STOP_LOSS:
             return
+        if self.modify_hard_stop_loss(pm, new_stop):
+            return
         self.cancel_stop_loss_order(pm.symbol, pm.stop_order_id)
         pm.stop_order_id = self.place_hard_stop_loss(
             pm.symbol, pm.side, pm.total_size, new_stop
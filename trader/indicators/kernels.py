@@ -0,0 +1,248 @@
+"""
+數值 kernel 層（Numba JIT）
+
+遞迴型指標（Wilder 平滑等）在 pandas 中只能逐筆 Python 迴圈，
+這裡以 numpy 陣列 + @njit 實作，供 technical.py 呼叫。
+
+numba 為可選依賴：未安裝時 njit 退化為 no-op decorator，
+kernel 以純 Python 執行，結果一致、只是較慢。
+
+精度分工：只做閾值比較的 kernel（ADX）以 float32 進出；
+輸出會成為進場價 / 止損 / 目標價的 kernel（evaluate_symbol、swing_pivots_nb）
+以及 EMA / ATR 欄位維持 float64，倉位大小與止損距離由這些值推導。
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+NUMBA_AVAILABLE = njit is not None
+
+if njit is None:
+    def njit(*args, **kwargs):
+        """numba 缺席時的 no-op 替代（支援 @njit 與 @njit(...) 兩種寫法）"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+# ==================== ADX（Wilder 平滑） ====================
+
+# 指標 kernel 以 float32 進出：只用於閾值比較，7 位有效數字足夠，頻寬減半。
+# 價格 × 數量等金額相關計算仍維持 float64（不經這些 kernel）。
+@njit('UniTuple(float32[:], 3)(float32[:], float32[:], float32[:], int64)',
+      cache=True, fastmath=True, nogil=True, boundscheck=False)
+def adx_nb(high, low, close, n):
+    """
+    Wilder ADX
+
+    TR = max(H-L, |H-Cprev|, |L-Cprev|)
+    TR_n = TR_n - TR_n/n + TR（+DM/-DM 同理）
+    DX = 100 * |+DI - -DI| / (+DI + -DI)
+    ADX 首值 = 前 n 個 DX 平均，之後 ADX_t = (ADX_{t-1}*(n-1) + DX_t) / n
+
+    輸入/輸出為 float32；平滑累加器用 float64，避免遞迴誤差累積。
+    返回: (adx, plus_di, minus_di)，暖機區為 NaN
+    """
+    size = high.shape[0]
+    adx = np.full(size, np.nan, dtype=np.float32)
+    plus_di = np.full(size, np.nan, dtype=np.float32)
+    minus_di = np.full(size, np.nan, dtype=np.float32)
+    if n < 1 or size <= 2 * n - 1:
+        return adx, plus_di, minus_di
+
+    tr_s = 0.0
+    pdm_s = 0.0
+    mdm_s = 0.0
+    dx_sum = 0.0
+    prev_adx = 0.0
+
+    for i in range(1, size):
+        hl = float(high[i]) - float(low[i])
+        hc = abs(float(high[i]) - float(close[i - 1]))
+        lc = abs(float(low[i]) - float(close[i - 1]))
+        tr = hl
+        if hc > tr:
+            tr = hc
+        if lc > tr:
+            tr = lc
+
+        up = float(high[i]) - float(high[i - 1])
+        down = float(low[i - 1]) - float(low[i])
+        pdm = up if (up > down and up > 0.0) else 0.0
+        mdm = down if (down > up and down > 0.0) else 0.0
+
+        if i <= n:
+            # 暖機：前 n 根直接累加作為首個平滑值
+            tr_s += tr
+            pdm_s += pdm
+            mdm_s += mdm
+            if i < n:
+                continue
+        else:
+            tr_s = tr_s - tr_s / n + tr
+            pdm_s = pdm_s - pdm_s / n + pdm
+            mdm_s = mdm_s - mdm_s / n + mdm
+
+        pdi = 100.0 * pdm_s / tr_s if tr_s > 0.0 else 0.0
+        mdi = 100.0 * mdm_s / tr_s if tr_s > 0.0 else 0.0
+        plus_di[i] = pdi
+        minus_di[i] = mdi
+
+        di_sum = pdi + mdi
+        dx = 100.0 * abs(pdi - mdi) / di_sum if di_sum > 0.0 else 0.0
+
+        if i < 2 * n - 1:
+            dx_sum += dx
+        elif i == 2 * n - 1:
+            prev_adx = (dx_sum + dx) / n
+            adx[i] = prev_adx
+        else:
+            prev_adx = (prev_adx * (n - 1) + dx) / n
+            adx[i] = prev_adx
+
+    return adx, plus_di, minus_di
+
+
+# ==================== 最新 K 線信號評估（融合） ====================
+
+# evaluate_symbol 輸出欄位索引
+SIG_PB_SIDE = 0        # EMA 回撤方向：1=LONG, -1=SHORT, 0=無
+SIG_PB_EXTREME = 1     # 回撤前一根 low/high（raw）
+SIG_PB_STOP = 2
+SIG_PB_TARGET = 3
+SIG_BO_SIDE = 4        # 量能突破方向
+SIG_BO_EXTREME = 5     # 近 10 根低/高點（raw）
+SIG_BO_STOP = 6
+SIG_BO_TARGET = 7
+SIG_VOL_RATIO = 8
+SIG_FIELDS = 9
+
+# cfg 陣列索引（Config 閾值以 ndarray 傳入 kernel）
+CFG_PB_THRESHOLD = 0
+CFG_BO_MULT = 1
+CFG_SL_ATR_BUFFER = 2
+CFG_PB_MIN_VOL = 3
+CFG_FIELDS = 4
+
+
+@njit(cache=True, nogil=True)
+def _window_max(arr, start, stop):
+    """arr[start:stop] 最大值，略過 NaN（與 pandas max 一致；全 NaN 回 NaN）"""
+    out = np.nan
+    for i in range(start, stop):
+        x = arr[i]
+        if x == x and (out != out or x > out):
+            out = x
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _window_min(arr, start, stop):
+    out = np.nan
+    for i in range(start, stop):
+        x = arr[i]
+        if x == x and (out != out or x < out):
+            out = x
+    return out
+
+
+@njit(cache=True, nogil=True)
+def evaluate_symbol(o, h, l, c, v, ema_f, ema_s, atr, vol_ma, cfg):
+    """
+    單次掃描最新 K 線，同時評估 EMA 回撤與量能突破
+
+    只讀最後 20 根，所有偵測共用同一批陣列。
+    不開 fastmath：NaN 比較必須維持 False 語義（暖機區 EMA 為 NaN 時不出信號）。
+
+    返回: float64[SIG_FIELDS]，方向為 0 代表該信號不成立
+    """
+    out = np.zeros(SIG_FIELDS)
+    size = c.shape[0]
+    last = size - 1
+    prev = size - 2
+
+    price = c[last]
+    cur_atr = atr[last]
+    cur_vol_ma = vol_ma[last]
+    vol_ratio = v[last] / cur_vol_ma if cur_vol_ma > 0.0 else 0.0
+    out[SIG_VOL_RATIO] = vol_ratio
+
+    # === EMA 回撤 ===
+    fast = ema_f[last]
+    slow = ema_s[last]
+    threshold = fast * cfg[CFG_PB_THRESHOLD]
+    sl_buffer = cur_atr * cfg[CFG_SL_ATR_BUFFER]
+    pb_side = 0.0
+    if fast > slow:
+        if abs(l[prev] - fast) < threshold and price > fast:
+            pb_side = 1.0
+            out[SIG_PB_EXTREME] = l[prev]
+            out[SIG_PB_STOP] = min(l[prev], slow) - sl_buffer
+            out[SIG_PB_TARGET] = _window_max(h, max(0, size - 20), size)
+    elif fast < slow:
+        if abs(h[prev] - fast) < threshold and price < fast:
+            pb_side = -1.0
+            out[SIG_PB_EXTREME] = h[prev]
+            out[SIG_PB_STOP] = max(h[prev], slow) + sl_buffer
+            out[SIG_PB_TARGET] = _window_min(l, max(0, size - 20), size)
+    if pb_side != 0.0 and vol_ratio >= cfg[CFG_PB_MIN_VOL]:
+        out[SIG_PB_SIDE] = pb_side
+
+    # === 量能突破 ===
+    if vol_ratio >= cfg[CFG_BO_MULT]:
+        start = max(0, size - 10)
+        recent_high = _window_max(h, start, last)
+        recent_low = _window_min(l, start, last)
+        if price > recent_high and price > o[last]:
+            out[SIG_BO_SIDE] = 1.0
+            out[SIG_BO_EXTREME] = recent_low
+            out[SIG_BO_STOP] = recent_low - cur_atr * 0.5
+            out[SIG_BO_TARGET] = price + (price - recent_low)
+        elif price < recent_low and price < o[last]:
+            out[SIG_BO_SIDE] = -1.0
+            out[SIG_BO_EXTREME] = recent_high
+            out[SIG_BO_STOP] = recent_high + cur_atr * 0.5
+            out[SIG_BO_TARGET] = price - (recent_high - price)
+
+    return out
+
+
+# ==================== Swing Point Pivot ====================
+
+@njit(cache=True, nogil=True)
+def swing_pivots_nb(high, low, left_bars, right_bars):
+    """
+    單次掃描標記 confirmed swing high/low
+
+    Swing Low: low[i] 嚴格低於左側 left_bars 根與右側 right_bars 根的 low；Swing High 鏡像。
+    價格陣列維持 float64（pivot 價位會直接成為止損 / neckline）。
+    不開 fastmath：比較語義需與原 pandas 逐筆版本一致（含 NaN 比較為 False）。
+
+    返回: (is_swing_low, is_swing_high) bool 陣列，頭尾無法確認的 K 線為 False
+    """
+    size = high.shape[0]
+    is_low = np.zeros(size, dtype=np.bool_)
+    is_high = np.zeros(size, dtype=np.bool_)
+
+    for i in range(left_bars, size - right_bars):
+        cur_low = low[i]
+        ok = True
+        for j in range(i - left_bars, i + right_bars + 1):
+            if j != i and low[j] <= cur_low:
+                ok = False
+                break
+        is_low[i] = ok
+
+        cur_high = high[i]
+        ok = True
+        for j in range(i - left_bars, i + right_bars + 1):
+            if j != i and high[j] >= cur_high:
+                ok = False
+                break
+        is_high[i] = ok
+
+    return is_low, is_high
@@ -11,9 +11,10 @@
 """
 
 import logging
+from collections import OrderedDict
 import pandas as pd
 import numpy as np
-from typing import Dict, Optional, Tuple
+from typing import Dict, Hashable, Optional, Tuple
 
 try:
     import pandas_ta as ta
@@ -21,9 +22,14 @@ except ImportError:
     ta = None
 
 from trader.config import Config
+from trader.indicators.kernels import adx_nb
 
 logger = logging.getLogger(__name__)
 
+# ADX 欄位名固定（_adx 輸出 ADX_{length}），不再逐次掃描 columns
+_ADX_LENGTH = 14
+_ADX_COL = f'ADX_{_ADX_LENGTH}'
+
 
 # ==================== pandas_ta 備用實現 ====================
 
@@ -50,29 +56,19 @@ def _atr(high: pd.Series, low: pd.Series, close: pd.Series, length: int) -> pd.S
     return tr.rolling(window=length).mean()
 
 
-def _adx(high: pd.Series, low: pd.Series, close: pd.Series, length: int):
-    if ta is not None:
-        return ta.adx(high, low, close, length=length)
-    tr = pd.concat([
-        high - low,
-        (high - close.shift()).abs(),
-        (low - close.shift()).abs()
-    ], axis=1).max(axis=1)
-    plus_dm = high.diff()
-    minus_dm = -low.diff()
-    plus_dm = plus_dm.where((plus_dm > minus_dm) & (plus_dm > 0), 0.0)
-    minus_dm = minus_dm.where((minus_dm > plus_dm) & (minus_dm > 0), 0.0)
-    atr_val = tr.rolling(window=length).mean().replace(0, np.nan)
-    plus_di = 100 * (plus_dm.rolling(window=length).mean() / atr_val)
-    minus_di = 100 * (minus_dm.rolling(window=length).mean() / atr_val)
-    dx = (plus_di - minus_di).abs() / (plus_di + minus_di).replace(0, np.nan) * 100
-    adx_val = dx.rolling(window=length).mean()
-    result = pd.DataFrame({
+def _adx(high: pd.Series, low: pd.Series, close: pd.Series, length: int) -> pd.DataFrame:
+    """Wilder ADX（Numba kernel，不經 pandas_ta）"""
+    adx_val, plus_di, minus_di = adx_nb(
+        high.to_numpy(dtype=np.float32),
+        low.to_numpy(dtype=np.float32),
+        close.to_numpy(dtype=np.float32),
+        length,
+    )
+    return pd.DataFrame({
         f'ADX_{length}': adx_val,
         f'DMP_{length}': plus_di,
         f'DMN_{length}': minus_di
-    })
-    return result
+    }, index=high.index)
 
 
 # ==================== 技術分析 ====================
@@ -81,15 +77,19 @@ class TechnicalAnalysis:
     """技術分析工具類"""
 
     @staticmethod
-    def extract_adx_series(df: pd.DataFrame, length: int = 14) -> Optional[pd.Series]:
+    def extract_adx_series(df: pd.DataFrame, length: int = _ADX_LENGTH) -> Optional[pd.Series]:
         """安全提取 ADX Series"""
         adx_data = _adx(df['high'], df['low'], df['close'], length=length)
-        if adx_data is None or adx_data.empty:
+        if adx_data.empty:
             return None
-        if isinstance(adx_data, pd.DataFrame):
-            adx_cols = [c for c in adx_data.columns if c.startswith('ADX')]
-            return adx_data[adx_cols[0]] if adx_cols else None
-        return adx_data
+        return adx_data[_ADX_COL if length == _ADX_LENGTH else f'ADX_{length}']
+
+    @staticmethod
+    def get_adx_series(df: pd.DataFrame) -> Optional[pd.Series]:
+        """優先沿用 calculate_indicators 已算好的 adx 欄位，沒有才重新計算"""
+        if 'adx' in df.columns:
+            return df['adx']
+        return TechnicalAnalysis.extract_adx_series(df)
 
     @staticmethod
     def calculate_indicators(df: pd.DataFrame) -> pd.DataFrame:
@@ -125,17 +125,20 @@ class TechnicalAnalysis:
         if len(df) < ema_period:
             return False, "數據不足"
 
-        latest = df.iloc[-1]
-        if 'ema_trend' not in latest or pd.isna(latest['ema_trend']):
+        if 'ema_trend' not in df.columns:
+            return False, "EMA 計算失敗"
+        ema_trend = df['ema_trend'].to_numpy()[-1]
+        if pd.isna(ema_trend):
             return False, "EMA 計算失敗"
+        close = df['close'].to_numpy()[-1]
 
         if side == 'LONG':
-            if latest['close'] > latest['ema_trend']:
+            if close > ema_trend:
                 return True, "多頭趨勢"
             else:
                 return False, "空頭趨勢"
         else:
-            if latest['close'] < latest['ema_trend']:
+            if close < ema_trend:
                 return True, "空頭趨勢"
             else:
                 return False, "多頭趨勢"
@@ -156,18 +159,113 @@ class TechnicalAnalysis:
             return current_price > swing_high * (1 + tol)
 
 
+# ==================== 增量指標快取 ====================
+
+class IndicatorCache:
+    """
+    calculate_indicators 的增量版，以 (symbol, timeframe, 筆數) 為 key。
+
+    同一根 K 線形成期間，每輪抓回的視窗只有最後一根會變；所有指標皆為因果計算，
+    前 n-1 根 OHLCV 與上次相同時，前 n-1 個指標值也不變，只重算最後一個值：
+    - EMA：y = (1-α)·y_prev + α·close
+    - vol_ma / ATR（SMA 版）：只取最後一個視窗
+    - ATR（pandas_ta 版）與 ADX：整段重算（向量化 / numba，成本低且避免與原實作分歧）
+    新 K 線開盤（視窗滑動）或任何不一致 → 完整重算 calculate_indicators。
+    """
+
+    _OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+    _INDICATOR_COLUMNS = ('ema_trend', 'vol_ma', 'atr', 'ema_fast', 'ema_slow')
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._entries: 'OrderedDict[Hashable, dict]' = OrderedDict()
+
+    def calculate(self, key: Hashable, df: pd.DataFrame) -> pd.DataFrame:
+        if df.empty or len(df) < 50 or 'timestamp' not in df.columns:
+            return TechnicalAnalysis.calculate_indicators(df)
+        try:
+            values = df[self._OHLCV_COLUMNS].to_numpy(dtype=np.float64)
+        except (KeyError, ValueError, TypeError):
+            return TechnicalAnalysis.calculate_indicators(df)
+        timestamps = df['timestamp'].to_numpy()
+
+        entry = self._entries.get(key)
+        if (entry is not None
+                and np.array_equal(entry['timestamps'], timestamps)
+                and np.array_equal(entry['values'][:-1], values[:-1])):
+            columns = self._update_last_row(entry['columns'], values)
+            if columns is not None:
+                for name in self._INDICATOR_COLUMNS:
+                    df[name] = columns[name].copy()  # 呼叫方改 df 不污染快取
+                adx_series = TechnicalAnalysis.extract_adx_series(df)
+                if adx_series is not None:
+                    df['adx'] = adx_series
+                entry['values'] = values
+                entry['columns'] = columns
+                self._entries.move_to_end(key)
+                return df
+
+        df = TechnicalAnalysis.calculate_indicators(df)
+        try:
+            columns = {name: df[name].to_numpy(dtype=np.float64, copy=True) for name in self._INDICATOR_COLUMNS}
+        except (KeyError, ValueError, TypeError):
+            self._entries.pop(key, None)
+            return df
+        self._entries[key] = {'timestamps': timestamps, 'values': values, 'columns': columns}
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return df
+
+    @staticmethod
+    def _update_last_row(columns: Dict[str, np.ndarray], values: np.ndarray) -> Optional[Dict[str, np.ndarray]]:
+        """只重算最後一列；前一列有 NaN（暖機區）時回傳 None 改走完整重算"""
+        high, low, close, volume = values[:, 1], values[:, 2], values[:, 3], values[:, 4]
+        updated = {name: arr.copy() for name, arr in columns.items()}
+
+        ema_lengths = (
+            ('ema_trend', getattr(Config, 'EMA_TREND', 200)),
+            ('ema_fast', Config.EMA_PULLBACK_FAST),
+            ('ema_slow', Config.EMA_PULLBACK_SLOW),
+        )
+        for name, length in ema_lengths:
+            prev = updated[name][-2]
+            if not np.isfinite(prev):
+                return None
+            alpha = 2.0 / (length + 1)
+            updated[name][-1] = (1.0 - alpha) * prev + alpha * close[-1]
+
+        vol_period = Config.VOLUME_MA_PERIOD
+        updated['vol_ma'][-1] = volume[-vol_period:].mean() if len(volume) >= vol_period else np.nan
+
+        atr_period = Config.ATR_PERIOD
+        if ta is None:
+            if len(close) <= atr_period:
+                return None
+            h, l, prev_close = high[-atr_period:], low[-atr_period:], close[-atr_period - 1:-1]
+            tr = np.maximum(h - l, np.maximum(np.abs(h - prev_close), np.abs(l - prev_close)))
+            updated['atr'][-1] = tr.mean()
+        else:
+            updated['atr'] = _atr(
+                pd.Series(high), pd.Series(low), pd.Series(close), length=atr_period
+            ).to_numpy(dtype=np.float64)
+
+        return updated
+
+
 # ==================== 動態閾值管理器 ====================
 
 class DynamicThresholdManager:
     """動態閾值管理器"""
 
     @staticmethod
-    def get_adx_threshold(df: pd.DataFrame) -> float:
-        """根據近期市場狀態動態調整 ADX 閾值"""
+    def get_adx_threshold(df: pd.DataFrame, adx_series: Optional[pd.Series] = None) -> float:
+        """根據近期市場狀態動態調整 ADX 閾值（adx_series 可由呼叫端傳入，避免重算）"""
         if not Config.ENABLE_DYNAMIC_THRESHOLDS:
             return Config.ADX_THRESHOLD
 
-        adx_series = TechnicalAnalysis.extract_adx_series(df)
+        if adx_series is None:
+            adx_series = TechnicalAnalysis.get_adx_series(df)
         if adx_series is None:
             return Config.ADX_THRESHOLD
         adx_series = adx_series.dropna()
@@ -265,11 +363,11 @@ class MarketFilter:
         if len(df_trend) < min_data_required:
             return False, f"數據不足（需要至少 {min_data_required} 根）", False
 
-        dynamic_adx_threshold = DynamicThresholdManager.get_adx_threshold(df_trend)
+        adx_series = TechnicalAnalysis.get_adx_series(df_trend)
+        dynamic_adx_threshold = DynamicThresholdManager.get_adx_threshold(df_trend, adx_series)
 
-        adx_series = TechnicalAnalysis.extract_adx_series(df_trend)
         if adx_series is None:
-            logger.warning(f"{symbol} ADX 計算失敗")
+            logger.warning("%s ADX 計算失敗", symbol)
             return False, "ADX 計算失敗", False
         current_adx = adx_series.iloc[-1]
 
@@ -297,5 +395,5 @@ class MarketFilter:
                 if ema_diff < Config.EMA_ENTANGLEMENT_THRESHOLD:
                     return False, f"均線糾纏 (差距={ema_diff*100:.1f}%)", False
 
-        logger.debug(f"✅ {symbol} 市場狀態良好 (ADX={current_adx:.1f}, 動態閾值={dynamic_adx_threshold:.1f})")
+        logger.debug("✅ %s 市場狀態良好 (ADX=%.1f, 動態閾值=%.1f)", symbol, current_adx, dynamic_adx_threshold)
         return True, "市場狀態良好", is_strong_market
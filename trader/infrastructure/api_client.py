@@ -5,27 +5,108 @@ Binance Futures API 客戶端
 從 v6/core.py 提取。
 """
 
+import hashlib
+import json
+import hmac
 import time
 import logging
+import threading
+from urllib.parse import urlencode
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from trader.config import Config
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _build_session() -> requests.Session:
+    """keep-alive 連線池：同一 host 重用 TCP/TLS 連線，省去每次握手"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=Retry(total=0))
+    session.mount('https://', adapter)
+    return session
+
+
+# 所有 Binance Futures REST 呼叫（簽章請求、exchangeInfo、ccxt transport）共用
+_FUTURES_SESSION = _build_session()
+
+
+def get_futures_session() -> requests.Session:
+    """取得共用的 Binance Futures HTTP session"""
+    return _FUTURES_SESSION
+
+
+def exchange_symbol_id(symbol: str) -> str:
+    """'BTC/USDT' → 'BTCUSDT'（統一下單 / 撤單端的 symbol 轉換）"""
+    return symbol.replace('/', '')
+
+
+def json_loads(data):
+    """bytes / str → Python 物件：有 orjson 時用 orjson，否則 stdlib json"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj, indent: bool = False) -> bytes:
+    """
+    Python 物件 → UTF-8 bytes（非 ASCII 原樣輸出）：有 orjson 時用 orjson，否則 stdlib json
+
+    orjson 另開 numpy 純量與非字串 key 支援，與 stdlib json 可接受的輸入對齊。
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def response_json(response: requests.Response):
+    """解析 Response JSON：有 orjson 時直接解析 bytes（exchangeInfo 等大型 payload 快數倍），否則走 requests"""
+    content = response.content
+    if orjson is not None and isinstance(content, bytes):
+        return orjson.loads(content)
+    return response.json()
+
+
 class BinanceFuturesClient:
     """統一的 Binance Futures API 客戶端，消除重複的簽章與請求邏輯"""
 
+    # 每次簽章固定的尾段（10s 容差：默認 5s 太緊，易觸發 -1021），之後只接 timestamp
+    _SIGNED_TAIL = 'recvWindow=10000&timestamp='
+
+    # 屬性固定：slots 取代每個實例的 __dict__，下單路徑上的屬性讀取少一次 dict 查找
+    __slots__ = (
+        'api_key', 'api_secret', 'session', '_headers', '_form_headers',
+        '_hmac_template', 'base_url', '_current_weight', '_weight_limit', '_weight_lock',
+    )
+
     def __init__(self, api_key: str, api_secret: str, sandbox: bool = True):
         self.api_key = api_key
         self.api_secret = api_secret
+        self.session = get_futures_session()
+        self._headers = {'X-MBX-APIKEY': api_key}
+        # POST / PUT body 是預先編碼的字串，requests 不會自動補 Content-Type
+        self._form_headers = {**self._headers, 'Content-Type': 'application/x-www-form-urlencoded'}
+        # 預先以 secret 初始化的 HMAC，每次簽章只 copy() + update()
+        self._hmac_template = hmac.new((api_secret or '').strip().encode('utf-8'), digestmod=hashlib.sha256)
         self.base_url = (
             "https://demo-fapi.binance.com" if sandbox
             else "https://fapi.binance.com"
         )
         self._current_weight = 0
         self._weight_limit = 2000  # Binance 上限 2400，保留安全邊際
+        # 平行下單 / 查詢會在多個執行緒共用同一個 client，權重讀寫需加鎖
+        self._weight_lock = threading.Lock()
 
     @staticmethod
     def is_enabled() -> bool:
@@ -37,50 +118,51 @@ class BinanceFuturesClient:
     def signed_request(self, method: str, endpoint: str, params: dict = None) -> requests.Response:
         """
         HMAC SHA256 簽章 + HTTP 請求，回傳原始 Response。
+
+        params 依插入順序編碼，後接固定的 recvWindow / timestamp 與 signature；
+        呼叫端傳入的 dict 不會被修改。
         """
-        import hmac as hmac_mod
-        import hashlib
-        from urllib.parse import urlencode
-
-        if params is None:
-            params = {}
-
-        params['timestamp'] = int(time.time() * 1000)
-        params['recvWindow'] = 10000  # 10s 容差（默認 5s 太緊，易觸發 -1021）
-        query_string = urlencode(params)
-        signature = hmac_mod.new(
-            self.api_secret.strip().encode('utf-8'),
-            query_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
-        params['signature'] = signature
-
-        headers = {'X-MBX-APIKEY': self.api_key}
+        # 查詢字串只組一次：簽的就是送出的 bytes，requests 不再重新 urlencode dict
+        prefix = f"{urlencode(params)}&" if params else ''
+        query = f"{prefix}{self._SIGNED_TAIL}{int(time.time() * 1000)}"
+        signer = self._hmac_template.copy()
+        signer.update(query.encode('utf-8'))
+        query = f"{query}&signature={signer.hexdigest()}"
+
         url = f"{self.base_url}{endpoint}"
+        session = self.session
 
-        if self._current_weight > self._weight_limit:
-            logger.warning(f"API weight {self._current_weight} exceeds limit {self._weight_limit}, sleeping 1s")
+        with self._weight_lock:
+            current_weight = self._current_weight
+        if current_weight > self._weight_limit:
+            logger.warning(f"API weight {current_weight} exceeds limit {self._weight_limit}, sleeping 1s")
             time.sleep(1.0)
 
-        if method.upper() == 'POST':
-            response = requests.post(url, data=params, headers=headers, timeout=30)
-        elif method.upper() == 'DELETE':
-            response = requests.delete(url, params=params, headers=headers, timeout=30)
+        method = method.upper()
+        if method == 'POST':
+            response = session.post(url, data=query, headers=self._form_headers, timeout=30)
+        elif method == 'PUT':
+            response = session.put(url, data=query, headers=self._form_headers, timeout=30)
+        elif method == 'DELETE':
+            response = session.delete(f"{url}?{query}", headers=self._headers, timeout=30)
         else:
-            response = requests.get(url, params=params, headers=headers, timeout=30)
+            response = session.get(f"{url}?{query}", headers=self._headers, timeout=30)
 
         weight_header = response.headers.get('X-MBX-USED-WEIGHT-1M')
         if weight_header:
             try:
-                self._current_weight = int(weight_header)
-                logger.debug(f"API weight: {self._current_weight}/2400")
+                used_weight = int(weight_header)
             except ValueError:
                 pass
+            else:
+                with self._weight_lock:
+                    self._current_weight = used_weight
+                logger.debug(f"API weight: {used_weight}/2400")
 
         # 偵測 -1021 timestamp 錯誤，方便排查時鐘同步問題
         if response.status_code == 400:
             try:
-                error_body = response.json()
+                error_body = response_json(response)
                 if error_body.get('code') == -1021:
                     logger.warning(f"[TIMESTAMP] 時鐘偏差過大，建議檢查 NTP: {endpoint}")
             except Exception:
@@ -88,12 +170,17 @@ class BinanceFuturesClient:
 
         return response
 
+    def api_key_request(self, method: str, endpoint: str) -> requests.Response:
+        """僅帶 API key header、不簽章的請求（USER_STREAM 類端點，如 listenKey）"""
+        url = f"{self.base_url}{endpoint}"
+        return self.session.request(method.upper(), url, headers=self._headers, timeout=30)
+
     def signed_request_json(self, method: str, endpoint: str, params: dict = None) -> dict:
         """簽章 + 請求 + JSON 解析 + 統一錯誤處理。"""
         try:
             response = self.signed_request(method, endpoint, params)
             if response.status_code == 200:
-                return response.json()
+                return response_json(response)
             else:
                 logger.error(f"API 錯誤: {response.status_code} - {response.text}")
                 return {"error": response.text, "code": response.status_code}
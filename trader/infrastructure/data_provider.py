@@ -13,17 +13,31 @@
         trading_mode=Config.TRADING_MODE,
     )
     df = provider.fetch_ohlcv('BTC/USDT', '1h', limit=100)
+    frames = provider.fetch_ohlcv_batch([('BTC/USDT', '1h', 100), ('ETH/USDT', '1h', 100)])
+
+掛上 market_cache（MarketDataCache）後，fetch_ohlcv 先讀推播維護的快取，
+miss 才走 REST，REST 結果再 seed 回快取並訂閱該 kline 串流。
+
+REST 結果另以 (symbol, timeframe) 短暫快取（OHLCV_CACHE_TTL_SECONDS，且不跨越 K 線收盤），
+同一週期內 scan 與 monitor 重複要同一序列時（limit 較小者取尾段）不再打第二次 REST。
 """
 
 import time
 import logging
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
 try:
     import ccxt
 except ImportError:
     ccxt = None  # type: ignore
 
+from trader.infrastructure.api_client import exchange_symbol_id, get_futures_session, response_json
+from trader.config import Config
+from trader.infrastructure.market_stream import MarketDataCache, ohlcv_frame, timeframe_to_ms
+
 logger = logging.getLogger(__name__)
 
 
@@ -51,6 +65,8 @@ class MarketDataProvider:
         self.retry_delay = retry_delay
         self.sandbox_mode = sandbox_mode
         self.trading_mode = trading_mode
+        self.market_cache: Optional[MarketDataCache] = None  # 行情串流啟動後由 bot 掛上
+        self._ohlcv_cache: Dict[Tuple[str, str], Tuple[float, pd.DataFrame]] = {}  # {(symbol, tf): (expire_ts, df)}
 
     def fetch_ohlcv(self, symbol: str, timeframe: str, limit: int = 100) -> pd.DataFrame:
         """
@@ -58,10 +74,29 @@ class MarketDataProvider:
 
         沙盒模式下，若 ccxt 失敗會自動切換為直連 demo-fapi.binance.com。
 
+        回傳的 DataFrame 可能與 TTL 快取共用底層陣列：只可新增或整欄替換欄位，
+        不可原地修改既有欄位的值。
+
         Returns:
             pd.DataFrame with columns: timestamp, open, high, low, close, volume
             失敗時回傳空 DataFrame
         """
+        cache = self.market_cache
+        if cache is not None:
+            df = cache.get_ohlcv(symbol, timeframe, limit)
+            if df is not None:
+                return df
+
+        key = (symbol, timeframe)
+        entry = self._ohlcv_cache.get(key)
+        if entry is not None and entry[0] > time.time() and len(entry[1]) >= limit:
+            # 淺複製與快取共用底層陣列。契約：呼叫端只能新增 / 整欄替換欄位（df['x'] = ...），
+            # 不可原地改既有欄位的值（.loc / .iloc 賦值）—— pandas 2.x 預設未開 Copy-on-Write，會寫回快取
+            cached = entry[1]
+            if len(cached) == limit:
+                return cached.copy(deep=False)
+            return cached.iloc[-limit:].reset_index(drop=True)
+
         for attempt in range(self.max_retry):
             try:
                 ohlcv = None
@@ -71,26 +106,27 @@ class MarketDataProvider:
                 except Exception:
                     # Sandbox / Demo Trading fallback：直接呼叫 demo-fapi REST API
                     if self.trading_mode == 'future' and self.sandbox_mode:
-                        import requests as req
-                        symbol_id = symbol.replace('/', '')
+                        symbol_id = exchange_symbol_id(symbol)
                         base_url = 'https://demo-fapi.binance.com'
-                        resp = req.get(
+                        resp = get_futures_session().get(
                             f'{base_url}/fapi/v1/klines',
                             params={'symbol': symbol_id, 'interval': timeframe, 'limit': limit},
                             timeout=30,
                         )
                         if resp.status_code == 200:
-                            ohlcv = [
-                                [int(c[0]), float(c[1]), float(c[2]), float(c[3]), float(c[4]), float(c[5])]
-                                for c in resp.json()
-                            ]
+                            # 字串價量由 numpy 一次解析，不逐根 float()
+                            klines = response_json(resp)
+                            if klines:
+                                ohlcv = np.asarray(klines, dtype=np.float64)[:, :6]
 
                 if ohlcv is None or len(ohlcv) == 0:
                     return pd.DataFrame()
 
-                df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-                df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-                return df
+                if cache is not None:
+                    cache.seed(symbol, timeframe, ohlcv, limit)
+                df = ohlcv_frame(ohlcv)
+                self._store_ohlcv(key, timeframe, df)
+                return df.copy(deep=False)
 
             except Exception as e:
                 # ccxt.NetworkError 或其他異常：重試
@@ -102,3 +138,51 @@ class MarketDataProvider:
                     break
 
         return pd.DataFrame()
+
+    def _store_ohlcv(self, key: Tuple[str, str], timeframe: str, df: pd.DataFrame):
+        """寫入短期快取；到期時間取 TTL 與最後一根 K 線收盤時刻的較早者"""
+        ttl = Config.OHLCV_CACHE_TTL_SECONDS
+        if ttl <= 0:
+            return
+        expire = time.time() + ttl
+        tf_ms = timeframe_to_ms(timeframe)
+        if tf_ms is not None:
+            expire = min(expire, (df['timestamp'].iat[-1].value // 1_000_000 + tf_ms) / 1000)
+        previous = self._ohlcv_cache.get(key)
+        # 較長的序列可服務較短的 limit：未過期時不以較短結果覆蓋
+        if previous is not None and previous[0] > time.time() and len(previous[1]) > len(df):
+            return
+        self._ohlcv_cache[key] = (expire, df)
+
+    def fetch_ohlcv_batch(
+        self,
+        requests: List[Tuple[str, str, int]],
+        max_concurrency: int = 8,
+    ) -> Dict[Tuple[str, str, int], pd.DataFrame]:
+        """
+        並行獲取多組 (symbol, timeframe, limit) 的 K 線
+
+        REST 抓取是 network-bound，以 thread pool 並行送出，
+        max_concurrency 限制同時在途的請求數以尊重 rate limit。
+        每組請求沿用 fetch_ohlcv 的重試與 fallback，失敗時該組為空 DataFrame。
+
+        Returns:
+            {(symbol, timeframe, limit): DataFrame}
+        """
+        unique = list(dict.fromkeys(requests))
+        if not unique:
+            return {}
+
+        def _fetch(req: Tuple[str, str, int]) -> pd.DataFrame:
+            symbol, timeframe, limit = req
+            try:
+                return self.fetch_ohlcv(symbol, timeframe, limit)
+            except Exception as e:
+                logger.warning(f"{symbol} {timeframe} K 線抓取失敗: {e}")
+                return pd.DataFrame()
+
+        workers = max(1, min(max_concurrency, len(unique)))
+        if workers == 1:
+            return {req: _fetch(req) for req in unique}
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='ohlcv') as pool:
+            return dict(zip(unique, pool.map(_fetch, unique)))
@@ -0,0 +1,338 @@
+"""
+Binance Futures 行情串流快取（kline WebSocket 推播）
+
+取代 monitor / scan 每輪對同一批 (symbol, timeframe) 的 REST K 線與 ticker 輪詢：
+- 第一次 fetch_ohlcv 仍走 REST，結果 seed 進快取並訂閱 <symbol>@kline_<tf>
+- 之後 kline 推播原地更新最後一根 / 追加新 K 線，fetch_ohlcv 直接由快取組 DataFrame
+- 最新成交價取自任一已訂閱 timeframe 的 kline close，供 fetch_ticker 使用
+
+保守原則（任何不確定都回到 REST）：
+- 斷線 → 清空所有序列，重連後下一次讀取重新 REST seed
+- 推播出現跳號（漏掉整根 K 線）→ 丟棄該序列
+- 最後一根不是「目前這根」（訂閱沒生效 / 冷門幣久無成交）→ 視為 miss
+- 長時間沒人讀的序列自動取消訂閱
+
+使用方式：
+    cache = MarketDataCache(sandbox=Config.SANDBOX_MODE)
+    cache.start()    # websocket-client 未安裝時回傳 False，維持 REST
+    provider.market_cache = cache
+    ...
+    cache.stop()
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    import websocket  # websocket-client
+except ImportError:
+    websocket = None  # type: ignore
+
+from trader.config import Config
+from trader.infrastructure.api_client import json_loads
+
+logger = logging.getLogger(__name__)
+
+_TIMEFRAME_UNIT_MS = {'m': 60_000, 'h': 3_600_000, 'd': 86_400_000, 'w': 604_800_000}
+
+
+def timeframe_to_ms(timeframe: str) -> Optional[int]:
+    """'15m' / '1h' / '4h' / '1d' → 毫秒；不支援的格式（如 '1M'）回傳 None"""
+    unit_ms = _TIMEFRAME_UNIT_MS.get(timeframe[-1:])
+    if unit_ms is None or not timeframe[:-1].isdigit():
+        return None
+    return int(timeframe[:-1]) * unit_ms
+
+
+def ohlcv_frame(rows) -> pd.DataFrame:
+    """
+    [[ts_ms, o, h, l, c, v, ...], ...]（list 或 ndarray）→ OHLCV DataFrame
+
+    一次轉成 float64 二維陣列，各欄直接以 column view 建 DataFrame（不逐列推斷 dtype）。
+    Binance 原始 klines 的字串價量也由 numpy 一併解析；第 6 欄以後忽略。
+    """
+    arr = np.asarray(rows, dtype=np.float64)
+    return pd.DataFrame({
+        'timestamp': pd.to_datetime(arr[:, 0].astype(np.int64), unit='ms'),
+        'open': arr[:, 1],
+        'high': arr[:, 2],
+        'low': arr[:, 3],
+        'close': arr[:, 4],
+        'volume': arr[:, 5],
+    }, copy=False)
+
+
+class _Series:
+    """
+    單一 (symbol, timeframe) 的 K 線序列：[timestamp_ms, o, h, l, c, v]
+
+    confirmed：REST seed 後收到同一根（seed 最後一根）的推播才成立；之前不對外提供，
+    避免訂閱生效前收盤的那根以 REST 的形成中快照留在序列裡。
+    """
+
+    __slots__ = ('bars', 'tf_ms', 'last_read', 'confirmed')
+
+    def __init__(self, rows: List[list], maxlen: int, tf_ms: int):
+        self.bars = deque(rows, maxlen=maxlen)
+        self.tf_ms = tf_ms
+        self.last_read = time.monotonic()
+        self.confirmed = False
+
+
+class MarketDataCache:
+    """kline 推播維護的 OHLCV / 最新價快取（daemon 執行緒，自動重連）"""
+
+    RECONNECT_DELAY_SECONDS = 5.0
+    MAX_RECONNECT_DELAY_SECONDS = 300.0
+    # Binance 每條連線每秒最多 10 則上行訊息：訂閱變更累積後每秒合併送一次
+    SUBSCRIPTION_FLUSH_SECONDS = 1.0
+
+    def __init__(self, sandbox: bool = True, trigger_timeframe: Optional[str] = None):
+        self.ws_url = (
+            "wss://fstream.binancefuture.com/ws" if sandbox
+            else "wss://fstream.binance.com/ws"
+        )
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple[str, str], _Series] = {}
+        self._prices: Dict[str, Tuple[float, float]] = {}   # {symbol: (price, monotonic)}
+        self._symbols: Dict[str, str] = {}                  # {'BTCUSDT': 'BTC/USDT'}
+        self._streams: Dict[str, Tuple[str, str]] = {}      # {stream: (symbol, timeframe)} 已訂閱
+        self._pending_sub: set = set()
+        self._pending_unsub: set = set()
+        self._request_id = 0
+        self._ws = None
+        self._connected = False
+        self._opened = False  # 本次 run_forever 是否曾成功連線（決定重連延遲是否重置）
+        self._stop = threading.Event()
+        self._threads = []
+        # trigger_timeframe 的 K 線收盤推播（k.x）時 set，主循環據此提前開始下一輪
+        self.trigger_timeframe = trigger_timeframe
+        self.bar_closed = threading.Event()
+
+    @staticmethod
+    def is_available() -> bool:
+        return websocket is not None
+
+    @property
+    def connected(self) -> bool:
+        return self._connected
+
+    @staticmethod
+    def _stream_name(symbol: str, timeframe: str) -> str:
+        return f"{symbol.replace('/', '').lower()}@kline_{timeframe}"
+
+    # ==================== 生命週期 ====================
+
+    def start(self) -> bool:
+        """啟動接收與訂閱維護執行緒；依賴缺失時回傳 False"""
+        if not self.is_available():
+            logger.info("websocket-client 未安裝，行情維持 REST 輪詢")
+            return False
+        if self._threads:
+            return True
+        self._stop.clear()
+        self._threads = [
+            threading.Thread(target=self._run, name='market-stream', daemon=True),
+            threading.Thread(target=self._maintenance_loop, name='market-stream-subs', daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+        return True
+
+    def stop(self):
+        self._stop.set()
+        ws = self._ws
+        if ws is not None:
+            try:
+                ws.close()
+            except Exception:
+                pass
+        self._threads = []
+        self._on_disconnect()
+
+    # ==================== 讀取 / seed ====================
+
+    def get_ohlcv(self, symbol: str, timeframe: str, limit: int) -> Optional[pd.DataFrame]:
+        """快取命中（連線中、筆數足夠、最後一根是目前這根）→ DataFrame；否則 None 交給 REST"""
+        if not self._connected:
+            return None
+        with self._lock:
+            series = self._series.get((symbol, timeframe))
+            if series is None or not series.confirmed or len(series.bars) < limit:
+                return None
+            now_ms = time.time() * 1000
+            if series.bars[-1][0] + series.tf_ms <= now_ms:
+                return None
+            series.last_read = time.monotonic()
+            rows = list(series.bars)[-limit:]
+        return ohlcv_frame(rows)
+
+    def seed(self, symbol: str, timeframe: str, rows: List[list], limit: int):
+        """
+        以 REST 結果建立 / 重建序列，並確保已訂閱該 kline 串流
+
+        新序列在收到 seed 最後一根的推播前不對外提供（見 _Series.confirmed）。
+        前一份序列還沒確認就又重新 seed，代表訂閱可能沒生效，重送一次 SUBSCRIBE。
+        """
+        tf_ms = timeframe_to_ms(timeframe)
+        # 未連線時 seed 無意義：斷線期間的變動收不到，重連後仍需重新 seed
+        if tf_ms is None or not rows or not self._connected:
+            return
+        stream = self._stream_name(symbol, timeframe)
+        with self._lock:
+            previous = self._series.get((symbol, timeframe))
+            maxlen = max(limit, previous.bars.maxlen if previous is not None else 0)
+            self._series[(symbol, timeframe)] = _Series(
+                [[int(r[0]), float(r[1]), float(r[2]), float(r[3]), float(r[4]), float(r[5])] for r in rows],
+                maxlen, tf_ms,
+            )
+            self._symbols[symbol.replace('/', '')] = symbol
+            if stream not in self._streams:
+                self._streams[stream] = (symbol, timeframe)
+                self._pending_sub.add(stream)
+                self._pending_unsub.discard(stream)
+            elif previous is not None and not previous.confirmed:
+                self._pending_sub.add(stream)
+
+    def last_price(self, symbol: str) -> Optional[float]:
+        """推播來的最新成交價；超過 MARKET_STREAM_PRICE_MAX_AGE_SECONDS 未更新則回傳 None"""
+        if not self._connected:
+            return None
+        entry = self._prices.get(symbol)
+        if entry is None or time.monotonic() - entry[1] > Config.MARKET_STREAM_PRICE_MAX_AGE_SECONDS:
+            return None
+        return entry[0]
+
+    # ==================== 推播處理 ====================
+
+    def handle_event(self, event: dict):
+        """
+        kline 事件：同一根 → 覆寫；下一根 → 追加；舊的 → 忽略；跳號 → 丟棄序列
+
+        未確認序列的第一則推播必須是 seed 最後一根（覆寫並確認）；若已是之後的 K 線，
+        代表 seed 那根在訂閱生效前就收盤了，REST 快照不是收盤值 → 丟棄，下次讀取重新 seed。
+        """
+        if event.get('e') != 'kline':
+            return
+        k = event.get('k') or {}
+        symbol = self._symbols.get(event.get('s', ''))
+        if symbol is None:
+            return
+        close = float(k['c'])
+        self._prices[symbol] = (close, time.monotonic())
+        if k.get('x') and k.get('i') == self.trigger_timeframe:
+            self.bar_closed.set()
+
+        key = (symbol, k.get('i', ''))
+        bar = [int(k['t']), float(k['o']), float(k['h']), float(k['l']), close, float(k['v'])]
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                return
+            last_ts = series.bars[-1][0]
+            if bar[0] == last_ts:
+                series.bars[-1] = bar
+                series.confirmed = True
+            elif not series.confirmed:
+                if bar[0] > last_ts:
+                    logger.debug("%s %s 訂閱生效前 K 線已收盤，序列改由 REST 重建", symbol, key[1])
+                    del self._series[key]
+            elif bar[0] == last_ts + series.tf_ms:
+                series.bars.append(bar)
+            elif bar[0] > last_ts:
+                logger.debug("%s %s kline 推播跳號，序列改由 REST 重建", symbol, key[1])
+                del self._series[key]
+
+    # ==================== WebSocket ====================
+
+    def _run(self):
+        delay = self.RECONNECT_DELAY_SECONDS
+        while not self._stop.is_set():
+            self._ws = websocket.WebSocketApp(
+                self.ws_url,
+                on_open=self._on_open,
+                on_message=self._on_message,
+                on_error=self._on_error,
+                on_close=self._on_close,
+            )
+            self._opened = False
+            self._ws.run_forever(ping_interval=60, ping_timeout=20)
+            self._ws = None
+            self._on_disconnect()
+            if self._opened:
+                delay = self.RECONNECT_DELAY_SECONDS
+            if self._stop.wait(delay):
+                break
+            delay = min(delay * 2, self.MAX_RECONNECT_DELAY_SECONDS)
+
+    def _on_open(self, ws):
+        with self._lock:
+            # 重連：所有已知串流重新訂閱（序列已在斷線時清空，下一次讀取由 REST seed）
+            self._pending_sub = set(self._streams)
+            self._pending_unsub.clear()
+        self._opened = True
+        self._connected = True
+        logger.info("✅ 行情串流已連線，K 線 / 最新價改由推播更新")
+
+    def _on_error(self, ws, error):
+        logger.warning(f"行情串流錯誤: {error}")
+
+    def _on_close(self, ws, status_code, message):
+        if not self._stop.is_set():
+            logger.warning(f"行情串流斷線 ({status_code})，改回 REST 並重新連線")
+        self._on_disconnect()
+
+    def _on_disconnect(self):
+        self._connected = False
+        with self._lock:
+            self._series.clear()
+            self._prices.clear()
+
+    def _on_message(self, ws, message):
+        try:
+            event = json_loads(message)
+        except ValueError:
+            logger.debug("行情串流無法解析訊息: %r", message)
+            return
+        if isinstance(event, dict):
+            self.handle_event(event)
+
+    def _maintenance_loop(self):
+        while not self._stop.wait(self.SUBSCRIPTION_FLUSH_SECONDS):
+            self._evict_idle()
+            if self._connected:
+                self._flush_subscriptions()
+
+    def _evict_idle(self):
+        """MARKET_STREAM_IDLE_SECONDS 未被讀取的序列 → 取消訂閱"""
+        cutoff = time.monotonic() - Config.MARKET_STREAM_IDLE_SECONDS
+        with self._lock:
+            for (symbol, timeframe), series in list(self._series.items()):
+                if series.last_read < cutoff:
+                    del self._series[(symbol, timeframe)]
+                    stream = self._stream_name(symbol, timeframe)
+                    if self._streams.pop(stream, None) is not None:
+                        self._pending_sub.discard(stream)
+                        self._pending_unsub.add(stream)
+
+    def _flush_subscriptions(self):
+        with self._lock:
+            messages = []
+            for method, pending in (('SUBSCRIBE', self._pending_sub), ('UNSUBSCRIBE', self._pending_unsub)):
+                if pending:
+                    self._request_id += 1
+                    messages.append({'method': method, 'params': sorted(pending), 'id': self._request_id})
+                    pending.clear()
+        ws = self._ws
+        for message in messages:
+            try:
+                ws.send(json.dumps(message))
+            except Exception as e:
+                logger.warning(f"行情串流訂閱更新失敗: {e}")
@@ -2,21 +2,66 @@
 Telegram 通知器
 
 封裝所有 Telegram Bot 推送邏輯，從 v6/core.py 提取。
+
+交易路徑上的通知經 TelegramNotifier.dispatch 交給單一背景執行緒送出，
+下單 / 平倉不必等 Telegram 的 HTTPS round-trip；單一 worker 維持訊息先後順序。
 """
 
 import html
 import logging
 import requests
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict
+
+from requests.adapters import HTTPAdapter
 
 from trader.config import Config
 
 logger = logging.getLogger(__name__)
 
 
+def _build_session() -> requests.Session:
+    """api.telegram.org keep-alive 連線池：long polling 佔一條連線，通知 / 指令回覆重用其餘連線"""
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+    return session
+
+
+# 通知（dispatch 背景執行緒）與指令執行緒（getUpdates / 回覆）共用，不必每則訊息重做 TCP/TLS 握手
+_TELEGRAM_SESSION = _build_session()
+
+
+def get_telegram_session() -> requests.Session:
+    """取得 Telegram Bot API 共用的 keep-alive Session"""
+    return _TELEGRAM_SESSION
+
+
 class TelegramNotifier:
     """Telegram 推送通知類"""
 
+    _pool = None  # 首次 dispatch 時建立
+
+    @classmethod
+    def dispatch(cls, notify: Callable, *args, **kwargs):
+        """
+        背景送出通知（fire-and-forget）
+
+        參數在呼叫當下即已求值，之後呼叫端修改狀態不影響訊息內容；
+        失敗只記 log（send_message 內已處理），不回拋給交易路徑。
+        """
+        if not Config.TELEGRAM_ENABLED:
+            return
+        if cls._pool is None:
+            cls._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='telegram')
+        cls._pool.submit(cls._run_safely, notify, args, kwargs)
+
+    @staticmethod
+    def _run_safely(notify: Callable, args: tuple, kwargs: dict):
+        try:
+            notify(*args, **kwargs)
+        except Exception as e:
+            logger.error(f"Telegram 通知失敗: {e}")
+
     @staticmethod
     def send_message(message: str):
         if not Config.TELEGRAM_ENABLED:
@@ -29,7 +74,7 @@ class TelegramNotifier:
                 'text': message,
                 'parse_mode': 'HTML'
             }
-            resp = requests.post(url, data=payload, timeout=10)
+            resp = get_telegram_session().post(url, data=payload, timeout=10)
             if not resp.ok:
                 logger.error(f"Telegram 發送失敗: {resp.status_code} {resp.text[:200]}")
         except Exception as e:
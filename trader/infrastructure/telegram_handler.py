@@ -6,19 +6,22 @@ Polling 模式接收 Telegram 指令，回覆倉位/狀態/餘額資訊。
 
 import html
 import logging
+import threading
 import time
 from datetime import datetime, timezone
 from typing import Optional
 
-import requests
-
 from trader.config import Config
+from trader.infrastructure.notifier import get_telegram_session
 
 logger = logging.getLogger(__name__)
 
 
 class TelegramCommandHandler:
-    """Telegram Bot 指令處理（Polling 模式）"""
+    """Telegram Bot 指令處理（Polling 模式，獨立執行緒，不受主循環掃描 / 監控阻塞）"""
+
+    LONG_POLL_SECONDS = 25       # getUpdates 在伺服器端等待新訊息，有訊息立即返回
+    ERROR_RETRY_SECONDS = 5.0
 
     def __init__(self, bot):
         """
@@ -28,30 +31,61 @@ class TelegramCommandHandler:
         self.bot = bot
         self.last_update_id = 0
         self.base_url = f"https://api.telegram.org/bot{Config.TELEGRAM_BOT_TOKEN}"
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
 
-    def poll(self):
-        """檢查新訊息並處理指令。主 loop 每 cycle 呼叫一次。"""
+    # ==================== 生命週期 ====================
+
+    def start(self) -> bool:
+        """啟動指令執行緒；Telegram 未啟用時回傳 False"""
         if not Config.TELEGRAM_ENABLED:
-            return
+            return False
+        if self._thread is not None:
+            return True
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='telegram-commands', daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self):
+        self._stop.set()
+        self._thread = None
+
+    def _run(self):
+        # long polling：阻塞在 socket 上直到有訊息或逾時，不需固定間隔輪詢；失敗時才退避
+        while not self._stop.is_set():
+            if not self.poll(self.LONG_POLL_SECONDS):
+                self._stop.wait(self.ERROR_RETRY_SECONDS)
+
+    def poll(self, wait_seconds: int = 0) -> bool:
+        """
+        檢查新訊息並處理指令（指令執行緒循環呼叫）
+
+        wait_seconds > 0 時為 long polling，最多等待該秒數；回傳是否成功取得 updates。
+        """
+        if not Config.TELEGRAM_ENABLED:
+            return False
 
         try:
-            updates = self._get_updates()
+            updates = self._get_updates(wait_seconds)
             for update in updates:
                 self._handle_update(update)
+            return True
         except Exception as e:
             logger.debug(f"Telegram poll 錯誤: {e}")
+            return False
 
-    def _get_updates(self) -> list:
-        """取得新訊息（long polling timeout=0，非阻塞）"""
+    def _get_updates(self, wait_seconds: int = 0) -> list:
+        """取得新訊息（wait_seconds=0 立即返回，否則由 Telegram 伺服器端等待）"""
         url = f"{self.base_url}/getUpdates"
         params = {
             'offset': self.last_update_id + 1,
-            'timeout': 0,
+            'timeout': wait_seconds,
             'allowed_updates': '["message"]',
         }
-        resp = requests.get(url, params=params, timeout=5)
+        resp = get_telegram_session().get(url, params=params, timeout=wait_seconds + 5)
         if not resp.ok:
-            return []
+            raise RuntimeError(f"getUpdates HTTP {resp.status_code}")
 
         data = resp.json()
         return data.get('result', [])
@@ -102,7 +136,7 @@ class TelegramCommandHandler:
             'parse_mode': 'HTML',
         }
         try:
-            resp = requests.post(url, data=payload, timeout=10)
+            resp = get_telegram_session().post(url, data=payload, timeout=10)
             if not resp.ok:
                 logger.error(f"Telegram 回覆失敗: {resp.status_code}")
         except Exception as e:
@@ -112,7 +146,7 @@ class TelegramCommandHandler:
 
     def _cmd_positions(self) -> str:
         """列出目前所有開倉部位"""
-        trades = self.bot.active_trades
+        trades = dict(self.bot.active_trades)  # 快照：主循環可能同時增刪倉位
         if not trades:
             return "<b>目前無開倉部位</b>"
 
@@ -145,7 +179,7 @@ class TelegramCommandHandler:
 
     def _cmd_status(self) -> str:
         """Bot 運行狀態"""
-        trades = self.bot.active_trades
+        trades = dict(self.bot.active_trades)
         active_count = len(trades)
 
         # 啟動時間
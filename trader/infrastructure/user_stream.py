@@ -0,0 +1,187 @@
+"""
+Binance Futures User Data Stream（WebSocket 推播）
+
+以一條長連線取代 balance / positionRisk 的高頻輪詢：
+- ACCOUNT_UPDATE（餘額 / 持倉變動）、ORDER_TRADE_UPDATE 成交 → RiskManager.invalidate()
+- 連線中 RiskManager 快取放寬到 USER_STREAM_CACHE_TTL_SECONDS（定期 REST 對帳）
+- 斷線 → set_stream_connected(False)，立即回到 ACCOUNT_CACHE_TTL_SECONDS 短輪詢，背景重連
+
+推播內容不直接寫入快取：ACCOUNT_UPDATE 沒有 availableBalance，持倉欄位也與 positionRisk 不同，
+一律以失效 + REST 重新查詢取得與原本完全相同格式的資料。
+
+使用方式：
+    stream = UserDataStream(futures_client, risk_manager, sandbox=Config.SANDBOX_MODE)
+    stream.start()   # websocket-client 未安裝時回傳 False，維持 REST 輪詢
+    ...
+    stream.stop()
+"""
+
+import logging
+import threading
+from typing import Optional
+
+try:
+    import websocket  # websocket-client
+except ImportError:
+    websocket = None  # type: ignore
+
+from trader.infrastructure.api_client import json_loads, response_json
+
+logger = logging.getLogger(__name__)
+
+
+class UserDataStream:
+    """listenKey 管理 + WebSocket 接收執行緒（daemon，自動重連）"""
+
+    LISTEN_KEY_ENDPOINT = '/fapi/v1/listenKey'
+    KEEPALIVE_SECONDS = 30 * 60      # listenKey 60 分鐘過期，每 30 分鐘延長
+    RECONNECT_DELAY_SECONDS = 5.0
+    MAX_RECONNECT_DELAY_SECONDS = 300.0
+
+    # 觸發帳戶快取失效的成交狀態
+    _FILL_STATUSES = ('FILLED', 'PARTIALLY_FILLED')
+
+    def __init__(self, futures_client, risk_manager, sandbox: bool = True):
+        self.futures_client = futures_client
+        self.risk_manager = risk_manager
+        self.ws_base_url = (
+            "wss://fstream.binancefuture.com/ws/" if sandbox
+            else "wss://fstream.binance.com/ws/"
+        )
+        self._listen_key: Optional[str] = None
+        self._ws = None
+        self._opened = False  # 本次 run_forever 是否曾成功連線（決定重連延遲是否重置）
+        self._stop = threading.Event()
+        self._threads = []
+
+    @staticmethod
+    def is_available() -> bool:
+        return websocket is not None
+
+    @property
+    def connected(self) -> bool:
+        return self.risk_manager.stream_connected
+
+    # ==================== 生命週期 ====================
+
+    def start(self) -> bool:
+        """啟動接收與 keepalive 執行緒；依賴缺失時回傳 False"""
+        if not self.is_available():
+            logger.info("websocket-client 未安裝，帳戶狀態維持 REST 輪詢")
+            return False
+        if self._threads:
+            return True
+        self._stop.clear()
+        self._threads = [
+            threading.Thread(target=self._run, name='user-stream', daemon=True),
+            threading.Thread(target=self._keepalive_loop, name='user-stream-keepalive', daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+        return True
+
+    def stop(self):
+        self._stop.set()
+        ws = self._ws
+        if ws is not None:
+            try:
+                ws.close()
+            except Exception:
+                pass
+        if self._listen_key:
+            try:
+                self.futures_client.api_key_request('DELETE', self.LISTEN_KEY_ENDPOINT)
+            except Exception:
+                pass
+        self._threads = []
+        self.risk_manager.set_stream_connected(False)
+
+    # ==================== listenKey ====================
+
+    def _create_listen_key(self) -> Optional[str]:
+        try:
+            response = self.futures_client.api_key_request('POST', self.LISTEN_KEY_ENDPOINT)
+            if response.status_code == 200:
+                return response_json(response).get('listenKey')
+            logger.warning("listenKey 建立失敗: %s - %s", response.status_code, response.text)
+        except Exception as e:
+            logger.warning("listenKey 建立失敗: %s", e)
+        return None
+
+    def _keepalive_loop(self):
+        while not self._stop.wait(self.KEEPALIVE_SECONDS):
+            if not self._listen_key:
+                continue
+            try:
+                response = self.futures_client.api_key_request('PUT', self.LISTEN_KEY_ENDPOINT)
+                if response.status_code != 200:
+                    logger.warning("listenKey 延長失敗: %s，重新連線", response.status_code)
+                    self._reconnect()
+            except Exception as e:
+                logger.warning("listenKey 延長失敗: %s", e)
+
+    # ==================== WebSocket ====================
+
+    def _run(self):
+        delay = self.RECONNECT_DELAY_SECONDS
+        while not self._stop.is_set():
+            self._listen_key = self._create_listen_key()
+            if self._listen_key:
+                self._opened = False
+                self._ws = websocket.WebSocketApp(
+                    self.ws_base_url + self._listen_key,
+                    on_open=self._on_open,
+                    on_message=self._on_message,
+                    on_error=self._on_error,
+                    on_close=self._on_close,
+                )
+                self._ws.run_forever(ping_interval=60, ping_timeout=20)
+                self._ws = None
+                if self._opened:
+                    delay = self.RECONNECT_DELAY_SECONDS
+                self.risk_manager.set_stream_connected(False)
+            if self._stop.wait(delay):
+                break
+            delay = min(delay * 2, self.MAX_RECONNECT_DELAY_SECONDS)
+
+    def _reconnect(self):
+        ws = self._ws
+        if ws is not None:
+            ws.close()
+
+    def _on_open(self, ws):
+        logger.info("✅ User data stream 已連線，帳戶狀態改由推播觸發更新")
+        self._opened = True
+        # 連線前的變動沒有推播，先清一次快取
+        self.risk_manager.invalidate()
+        self.risk_manager.set_stream_connected(True)
+
+    def _on_error(self, ws, error):
+        logger.warning("User data stream 錯誤: %s", error)
+
+    def _on_close(self, ws, status_code, message):
+        logger.warning("User data stream 斷線 (%s)，改回 REST 輪詢並重新連線", status_code)
+        self.risk_manager.set_stream_connected(False)
+
+    def _on_message(self, ws, message):
+        try:
+            event = json_loads(message)
+        except ValueError:
+            logger.debug("User data stream 無法解析訊息: %r", message)
+            return
+        self.handle_event(event)
+
+    def handle_event(self, event: dict):
+        """依事件類型更新帳戶快取狀態"""
+        event_type = event.get('e')
+        if event_type == 'ACCOUNT_UPDATE':
+            self.risk_manager.invalidate()
+        elif event_type == 'ORDER_TRADE_UPDATE':
+            order = event.get('o', {})
+            if order.get('X') in self._FILL_STATUSES:
+                self.risk_manager.invalidate()
+                if order.get('R') and order.get('ot') in ('STOP_MARKET', 'STOP'):
+                    logger.info("%s 止損單成交推播 @ %s", order.get('s'), order.get('ap') or order.get('L'))
+        elif event_type == 'listenKeyExpired':
+            logger.warning("listenKey 已過期，重新建立連線")
+            self._reconnect()
@@ -30,6 +30,8 @@ class PositionPersistence:
         """
         self.file_path = os.path.expanduser(file_path)
         self.encoding = 'utf-8'
+        # 上次成功寫入的 positions 序列化內容（不含 last_updated），內容未變時略過寫檔
+        self._last_payload: Optional[str] = None
 
     def save_positions(self, positions_data: Dict[str, Dict[str, Any]]) -> bool:
         """
@@ -67,10 +69,19 @@ class PositionPersistence:
                 }
             }
 
+        內容與上次成功寫入相同（不計 last_updated）且檔案仍在時不重寫，
+        省去 temp file + fsync + rename；last_updated 因此只在狀態實際變動時更新。
+
         Returns:
-            bool: 成功 True，失敗 False
+            bool: 成功 True（含內容未變略過），失敗 False
         """
         try:
+            # 比對上次寫入內容：只變動 last_updated 的重複存檔直接略過
+            payload = json.dumps(positions_data, ensure_ascii=False)
+            if payload == self._last_payload and os.path.exists(self.file_path):
+                logger.debug("Positions 未變更，略過寫檔")
+                return True
+
             # 更新所有 position 的 last_updated timestamp
             for symbol, pos_data in positions_data.items():
                 pos_data['last_updated'] = datetime.now(timezone.utc).isoformat()
@@ -82,6 +93,7 @@ class PositionPersistence:
             }
 
             # 準備寫入內容（pretty print for readability）
+            # 用 stdlib json：非有限浮點數寫成 NaN / Infinity 可原樣讀回（orjson 會寫成 null）
             json_content = json.dumps(envelope, indent=2, ensure_ascii=False)
 
             # Atomic write: 先寫到 temp，再 rename
@@ -101,6 +113,7 @@ class PositionPersistence:
 
             # Atomic rename（same directory, so it's atomic on all OS）
             os.replace(tmp_path, self.file_path)
+            self._last_payload = payload
 
             logger.debug(f"✅ Positions saved: {len(positions_data)} active")
             return True
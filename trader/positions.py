@@ -7,10 +7,13 @@ V6.0 PositionManager — 取代 V5.3 TradeManager
 """
 
 import logging
+import time
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Dict, List, Optional, Any
 from dataclasses import dataclass, field, asdict
 
+from trader.config import ConfigV6 as Cfg
+
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
@@ -92,7 +95,7 @@ class PositionManager:
         self.is_closed = False
 
         # === 時間追蹤 ===
-        self.entry_time = datetime.now(timezone.utc)
+        self.entry_time = datetime.now(timezone.utc)  # setter 同步 entry_monotonic
         self.monitor_count = 0
 
         # === 價格追蹤（用於結構追蹤止損）===
@@ -132,6 +135,21 @@ class PositionManager:
 
     # ==================== 屬性（Properties）====================
 
+    @property
+    def entry_time(self) -> datetime:
+        return self._entry_time
+
+    @entry_time.setter
+    def entry_time(self, value: datetime):
+        """
+        同步換算 monotonic 錨點（entry_monotonic）。
+
+        策略每個 tick 的持倉時間判斷用 time.monotonic() - entry_monotonic，
+        不必每次建立 tz-aware datetime；entry_time 保留給持久化 / log / Telegram。
+        """
+        self._entry_time = value
+        self.entry_monotonic = time.monotonic() - (datetime.now(timezone.utc) - value).total_seconds()
+
     @property
     def is_v6_pyramid(self) -> bool:
         """是否為 V6 金字塔策略（向下相容）"""
@@ -210,10 +228,8 @@ class PositionManager:
 
         tag = "V7" if self.strategy_name == "v7_structure" else "V6"
         logger.info(
-            f"[{tag}] {self.symbol} Stage 2 added: "
-            f"+{size:.6f} @ ${price:.2f} | "
-            f"Total: {self.total_size:.6f} | Avg: ${self.avg_entry:.2f} | "
-            f"SL -> ${new_sl:.2f}"
+            "[%s] %s Stage 2 added: +%.6f @ $%.2f | Total: %.6f | Avg: $%.2f | SL -> $%.2f",
+            tag, self.symbol, size, price, self.total_size, self.avg_entry, new_sl,
         )
         return True
 
@@ -253,10 +269,8 @@ class PositionManager:
 
         tag = "V7" if self.strategy_name == "v7_structure" else "V6"
         logger.info(
-            f"[{tag}] {self.symbol} Stage 3 added: "
-            f"+{size:.6f} @ ${price:.2f} | "
-            f"Total: {self.total_size:.6f} | Avg: ${self.avg_entry:.2f} | "
-            f"SL -> ${swing_stop:.2f} (swing structure)"
+            "[%s] %s Stage 3 added: +%.6f @ $%.2f | Total: %.6f | Avg: $%.2f | SL -> $%.2f (swing structure)",
+            tag, self.symbol, size, price, self.total_size, self.avg_entry, swing_stop,
         )
         return True
 
@@ -279,20 +293,18 @@ class PositionManager:
         Returns:
             bool: 是否觸發
         """
-        from trader.config import ConfigV6 as Cfg
-
         _tag = "V7" if self.strategy_name == "v7_structure" else "V6"
-        prefix = f"[{_tag}] {self.symbol} Stage2Check"
+        # 每個 tick 都會跑：訊息用 % 延遲格式化，level 未開啟時不組字串
         log_fn = logger.info if Cfg.V6_STAGE2_DEBUG_LOG else logger.debug
+        prefix = "[%s] %s Stage2Check: "
+        tag_args = (_tag, self.symbol)
 
         if self.stage != 1 or self.neckline is None:
-            log_fn(
-                f"{prefix}: SKIP stage={self.stage} "
-                f"neckline={'None' if self.neckline is None else f'${self.neckline:.2f}'}"
-            )
+            log_fn(prefix + "SKIP stage=%s neckline=%s", *tag_args, self.stage,
+                   self.neckline if self.neckline is None else '$%.2f' % self.neckline)
             return False
         if df_1h is None or df_1h.empty:
-            log_fn(f"{prefix}: SKIP df_1h empty/None")
+            log_fn(prefix + "SKIP df_1h empty/None", *tag_args)
             return False
 
         current = df_1h.iloc[-1]
@@ -303,51 +315,38 @@ class PositionManager:
 
         # 條件 1: 倉位盈利
         if self.side == 'LONG' and close <= self.entries[0].price:
-            log_fn(
-                f"{prefix}: FAIL profit check "
-                f"close=${close:.2f} <= entry=${self.entries[0].price:.2f}"
-            )
+            log_fn(prefix + "FAIL profit check close=$%.2f <= entry=$%.2f",
+                   *tag_args, close, self.entries[0].price)
             return False
         if self.side == 'SHORT' and close >= self.entries[0].price:
-            log_fn(
-                f"{prefix}: FAIL profit check "
-                f"close=${close:.2f} >= entry=${self.entries[0].price:.2f}"
-            )
+            log_fn(prefix + "FAIL profit check close=$%.2f >= entry=$%.2f",
+                   *tag_args, close, self.entries[0].price)
             return False
 
         # 條件 2: 收盤突破 neckline
         if self.side == 'LONG' and close <= self.neckline:
-            log_fn(
-                f"{prefix}: FAIL neckline "
-                f"close=${close:.2f} <= neckline=${self.neckline:.2f} "
-                f"(gap=${self.neckline - close:.2f})"
-            )
+            log_fn(prefix + "FAIL neckline close=$%.2f <= neckline=$%.2f (gap=$%.2f)",
+                   *tag_args, close, self.neckline, self.neckline - close)
             return False
         if self.side == 'SHORT' and close >= self.neckline:
-            log_fn(
-                f"{prefix}: FAIL neckline "
-                f"close=${close:.2f} >= neckline=${self.neckline:.2f} "
-                f"(gap=${close - self.neckline:.2f})"
-            )
+            log_fn(prefix + "FAIL neckline close=$%.2f >= neckline=$%.2f (gap=$%.2f)",
+                   *tag_args, close, self.neckline, close - self.neckline)
             return False
 
         # 條件 3: 放量
         if vol_ma <= 0:
-            log_fn(f"{prefix}: FAIL vol_ma=0")
+            log_fn(prefix + "FAIL vol_ma=0", *tag_args)
             return False
         if vol_ratio < Cfg.STAGE2_VOLUME_MULT:
-            log_fn(
-                f"{prefix}: FAIL volume "
-                f"vol_ratio={vol_ratio:.2f}x < {Cfg.STAGE2_VOLUME_MULT}x "
-                f"(need +{(Cfg.STAGE2_VOLUME_MULT - vol_ratio) * 100:.0f}% more volume)"
-            )
+            log_fn(prefix + "FAIL volume vol_ratio=%.2fx < %sx (need +%.0f%% more volume)",
+                   *tag_args, vol_ratio, Cfg.STAGE2_VOLUME_MULT,
+                   (Cfg.STAGE2_VOLUME_MULT - vol_ratio) * 100)
             return False
 
         _tag = "V7" if self.strategy_name == "v7_structure" else "V6"
         logger.info(
-            f"[{_tag}] {self.symbol} Stage 2 TRIGGERED: "
-            f"close=${close:.2f} broke neckline=${self.neckline:.2f} | "
-            f"vol={vol_ratio:.2f}x"
+            "[%s] %s Stage 2 TRIGGERED: close=$%.2f broke neckline=$%.2f | vol=%.2fx",
+            _tag, self.symbol, close, self.neckline, vol_ratio,
         )
         return True
 
@@ -372,8 +371,6 @@ class PositionManager:
         if df_1h is None or len(df_1h) < 3:
             return False
 
-        from trader.config import ConfigV6 as Cfg
-
         current = df_1h.iloc[-1]
         prev = df_1h.iloc[-2]
 
@@ -418,8 +415,8 @@ class PositionManager:
 
         _tag = "V7" if self.strategy_name == "v7_structure" else "V6"
         logger.info(
-            f"[{_tag}] {self.symbol} Stage 3 TRIGGERED: "
-            f"EMA pullback + reduced volume + reversal candle"
+            "[%s] %s Stage 3 TRIGGERED: EMA pullback + reduced volume + reversal candle",
+            _tag, self.symbol,
         )
         return True
 
@@ -440,8 +437,6 @@ class PositionManager:
         Returns:
             float: 加倉數量（0 = 不加倉）
         """
-        from trader.config import ConfigV6 as Cfg
-
         if self.initial_r <= 0:
             logger.warning(f"[{self.symbol}] initial_r={self.initial_r}, skipping stage2 sizing")
             return 0.0
@@ -474,9 +469,8 @@ class PositionManager:
             adjusted_size = max_size * ratio
             _tag = "V7" if self.strategy_name == "v7_structure" else "V6"
             logger.info(
-                f"[{_tag}] {self.symbol} Stage 2 risk cap: "
-                f"max_size={max_size:.6f} -> adjusted={adjusted_size:.6f} "
-                f"(risk ratio={ratio:.2f})"
+                "[%s] %s Stage 2 risk cap: max_size=%.6f -> adjusted=%.6f (risk ratio=%.2f)",
+                _tag, self.symbol, max_size, adjusted_size, ratio,
             )
             return adjusted_size
 
@@ -495,8 +489,6 @@ class PositionManager:
         Returns:
             float: 加倉數量（0 = 不加倉）
         """
-        from trader.config import ConfigV6 as Cfg
-
         if self.initial_r <= 0:
             logger.warning(f"[{self.symbol}] initial_r={self.initial_r}, skipping stage3 sizing")
             return 0.0
@@ -529,8 +521,8 @@ class PositionManager:
             adjusted_size = max_size * ratio
             _tag = "V7" if self.strategy_name == "v7_structure" else "V6"
             logger.info(
-                f"[{_tag}] {self.symbol} Stage 3 risk cap: "
-                f"max_size={max_size:.6f} -> adjusted={adjusted_size:.6f}"
+                "[%s] %s Stage 3 risk cap: max_size=%.6f -> adjusted=%.6f",
+                _tag, self.symbol, max_size, adjusted_size,
             )
             return adjusted_size
 
@@ -538,11 +530,12 @@ class PositionManager:
 
     # ==================== Monitor（Strategy Pattern V7 P2）====================
 
-    def monitor(self, current_price: float, df_1h=None, df_4h=None) -> Dict[str, Any]:
+    def monitor(self, current_price: float, df_1h=None, df_4h=None, latest_atr: Optional[float] = None) -> Dict[str, Any]:
         """
         統一監控入口（V7 P2 起回傳 Dict）。
 
         委託 self.strategy.get_decision() 計算出場/加倉決策。
+        latest_atr：呼叫方已從 df_1h 取出的最新 ATR，策略不必再碰 pandas。
 
         Returns:
             dict: {
@@ -555,7 +548,7 @@ class PositionManager:
         """
         if self.is_closed:
             return {"action": "ACTIVE", "reason": "ALREADY_CLOSED", "new_sl": None, "close_pct": None}
-        return self.strategy.get_decision(self, current_price, df_1h, df_4h)
+        return self.strategy.get_decision(self, current_price, df_1h, df_4h, latest_atr=latest_atr)
 
     # ==================== 序列化（for positions.json）====================
 
@@ -9,19 +9,29 @@
 從 v6/core.py 提取，業務邏輯不變。
 """
 
-import ccxt
 import math
+import os
 import time
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from decimal import Decimal, ROUND_DOWN
-from typing import Dict, List, Optional, Tuple
+from operator import itemgetter
+from typing import Callable, Dict, List, Optional, Tuple
+
+import ccxt
+import numpy as np
 
 from trader.config import Config
-from trader.infrastructure.api_client import BinanceFuturesClient
+from trader.infrastructure.api_client import (
+    BinanceFuturesClient, get_futures_session, json_dumps, json_loads, response_json,
+)
 from trader.indicators.technical import DynamicThresholdManager
 
 logger = logging.getLogger(__name__)
 
+_POSITION_AMT = itemgetter('positionAmt')
+
 
 # ==================== 精度處理 ====================
 
@@ -40,11 +50,24 @@ class PrecisionHandler:
         'LINK/USDT': {'amount': 2, 'price': 3, 'min_amount': 0.01, 'min_cost': 5},
     }
 
+    # 類別層級 exchangeInfo 快取：同一進程內所有實例共用，{'ts', 'url', 'map'}
+    _EXINFO: Dict = {'ts': 0.0, 'url': '', 'map': {}}
+    _exinfo_last_attempt: float = 0.0
+    # 同時只有一個執行緒下載 exchangeInfo；其他執行緒等待後直接讀快取
+    _exinfo_lock = threading.RLock()
+
     def __init__(self, exchange):
         self.exchange = exchange
         self.markets = {}
         self.use_default_precision = False
-        self._exchange_info_cache = {}  # {symbol: {'quantity': int, 'price': int}}
+        self._exchange_info_cache = {}  # {symbol: {'quantity': int, 'price': int, 'tick': float}}
+        self._merged_exinfo_ts = 0.0    # 已合併進本實例的 _EXINFO 版本（ts）
+        # 合併後的數量精度 {symbol: int}：DEFAULT → ccxt → exchangeInfo（後者覆蓋前者）
+        self._precision_lookup: Dict[str, int] = {}
+        # {symbol: (precision, 10**p, Decimal(10)**p, formatter)}，精度來源更新時清空
+        self._entry_cache: Dict[str, Tuple[int, int, Decimal, Callable[[float], str]]] = {}
+        # {symbol: (tickSize, formatter)}，觸發價等價格欄位用
+        self._price_entry_cache: Dict[str, Tuple[float, Callable[[float], str]]] = {}
         self.load_markets()
         self._load_exchange_info()
 
@@ -58,25 +81,80 @@ class PrecisionHandler:
             logger.warning("⚠️ 使用默認精度設置")
             self.use_default_precision = True
             self.markets = {}
+        self._rebuild_precision_lookup()
 
-    def _load_exchange_info(self):
-        """啟動時從 Binance exchangeInfo 一次載入所有幣種精度"""
-        import requests
+    @staticmethod
+    def _exchange_info_url() -> str:
         if Config.SANDBOX_MODE and Config.TRADING_MODE == 'future':
-            url = "https://demo-fapi.binance.com/fapi/v1/exchangeInfo"
-        else:
-            url = "https://fapi.binance.com/fapi/v1/exchangeInfo"
+            return "https://demo-fapi.binance.com/fapi/v1/exchangeInfo"
+        return "https://fapi.binance.com/fapi/v1/exchangeInfo"
+
+    def _apply_exchange_info(self, url: str, mapping: Dict[str, Dict[str, int]], ts: float):
+        """寫入類別層級快取並合併進本實例"""
+        PrecisionHandler._EXINFO = {'ts': ts, 'url': url, 'map': mapping}
+        self._exchange_info_cache.update(mapping)
+        self._merged_exinfo_ts = ts
+        self._rebuild_precision_lookup()
+
+    def _load_exchange_info_from_disk(self, url: str) -> bool:
+        """磁碟快取未過期 → 直接載入（重啟時不必重新下載整份 exchangeInfo）"""
+        path = Config.EXCHANGE_INFO_CACHE_PATH
+        try:
+            with open(path, 'rb') as f:
+                cached = json_loads(f.read())
+        except (OSError, ValueError):
+            return False
+        if cached.get('url') != url or time.time() - cached.get('ts', 0) >= Config.EXCHANGE_INFO_TTL_SECONDS:
+            return False
+        self._apply_exchange_info(url, cached.get('map', {}), cached['ts'])
+        logger.info("✅ exchangeInfo 從磁碟快取載入 %d 個交易對精度", len(self._exchange_info_cache))
+        return True
+
+    def _save_exchange_info_to_disk(self):
+        path = Config.EXCHANGE_INFO_CACHE_PATH
+        try:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(json_dumps(PrecisionHandler._EXINFO))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug("exchangeInfo 磁碟快取寫入失敗: %s", e)
+
+    def _load_exchange_info(self, attempts: int = 3):
+        """
+        從 Binance exchangeInfo 一次載入所有幣種精度
 
-        for attempt in range(3):
+        來源優先序：進程內快取 → 磁碟快取 → HTTP 下載；三者皆以 EXCHANGE_INFO_TTL_SECONDS 判斷新鮮度。
+        """
+        with PrecisionHandler._exinfo_lock:
+            self._load_exchange_info_locked(attempts)
+
+    def _load_exchange_info_locked(self, attempts: int):
+        url = self._exchange_info_url()
+        cache = PrecisionHandler._EXINFO
+        if cache['url'] == url and time.time() - cache['ts'] < Config.EXCHANGE_INFO_TTL_SECONDS:
+            if cache['ts'] != self._merged_exinfo_ts:
+                self._exchange_info_cache.update(cache['map'])
+                self._merged_exinfo_ts = cache['ts']
+                self._rebuild_precision_lookup()
+            return
+
+        if self._load_exchange_info_from_disk(url):
+            return
+
+        PrecisionHandler._exinfo_last_attempt = time.time()
+        for attempt in range(attempts):
             try:
-                resp = requests.get(url, timeout=15)
+                resp = get_futures_session().get(url, timeout=15)
                 if resp.status_code != 200:
-                    logger.warning(f"exchangeInfo HTTP {resp.status_code} (attempt {attempt + 1}/3)")
-                    time.sleep(2)
+                    logger.warning(f"exchangeInfo HTTP {resp.status_code} (attempt {attempt + 1}/{attempts})")
+                    if attempt < attempts - 1:
+                        time.sleep(2)
                     continue
 
-                data = resp.json()
-                count = 0
+                data = response_json(resp)
+                mapping = {}
                 for s in data.get('symbols', []):
                     sid = s.get('symbol', '')
                     base = s.get('baseAsset', '')
@@ -88,19 +166,51 @@ class PrecisionHandler:
                     else:
                         continue
 
-                    self._exchange_info_cache[ccxt_sym] = {
+                    entry = {
                         'quantity': int(s.get('quantityPrecision', 3)),
                         'price': int(s.get('pricePrecision', 2)),
                     }
-                    count += 1
-
-                logger.info(f"✅ exchangeInfo 載入 {count} 個交易對精度")
+                    # 價格以 PRICE_FILTER.tickSize 為準（pricePrecision 與實際 tick 可能不一致）
+                    for f in s.get('filters', ()):
+                        if f.get('filterType') == 'PRICE_FILTER':
+                            tick = float(f.get('tickSize') or 0)
+                            if tick > 0:
+                                entry['tick'] = tick
+                                entry['price'] = self._tick_decimals(f['tickSize'])
+                            break
+                    mapping[ccxt_sym] = entry
+
+                self._apply_exchange_info(url, mapping, time.time())
+                self._save_exchange_info_to_disk()
+                logger.info("✅ exchangeInfo 載入 %d 個交易對精度", len(mapping))
                 return
             except Exception as e:
-                logger.warning(f"exchangeInfo 載入失敗 (attempt {attempt + 1}/3): {e}")
-                time.sleep(2)
+                logger.warning(f"exchangeInfo 載入失敗 (attempt {attempt + 1}/{attempts}): {e}")
+                if attempt < attempts - 1:
+                    time.sleep(2)
 
-        logger.error("❌ exchangeInfo 3 次都失敗，將依賴 ccxt/DEFAULT_PRECISIONS")
+        logger.error(f"❌ exchangeInfo {attempts} 次都失敗，將依賴 ccxt/DEFAULT_PRECISIONS")
+
+    def _refresh_exchange_info_on_miss(self):
+        """
+        查無精度時：已載入過且快取已過 TTL 才重新下載（單次嘗試）。
+        從未載入成功（啟動失敗）維持原行為，交給 ccxt/DEFAULT 保底；
+        以上次嘗試時間節流，API 故障時不會在熱路徑反覆重試。
+        多執行緒同時 miss 時只有第一個下載，其餘等鎖後合併同一份結果。
+        """
+        with PrecisionHandler._exinfo_lock:
+            now = time.time()
+            loaded_ts = PrecisionHandler._EXINFO['ts']
+            if not loaded_ts:
+                return
+            if now - loaded_ts < Config.EXCHANGE_INFO_TTL_SECONDS:
+                # 其他執行緒 / 實例剛補抓完 → 合併新版本（無 HTTP）
+                if loaded_ts != self._merged_exinfo_ts:
+                    self._load_exchange_info_locked(attempts=1)
+                return
+            if now - PrecisionHandler._exinfo_last_attempt < Config.EXCHANGE_INFO_TTL_SECONDS:
+                return
+            self._load_exchange_info_locked(attempts=1)
 
     @staticmethod
     def _step_to_decimals(step) -> int:
@@ -111,26 +221,46 @@ class PrecisionHandler:
             return 0
         return max(0, int(round(-math.log10(float(step)))))
 
-    def get_precision(self, symbol: str) -> int:
-        """獲取交易對的數量精度（優先 exchangeInfo → ccxt → DEFAULT → 預設 3）"""
-        # 第一優先：exchangeInfo cache（啟動時全量載入）
-        if symbol in self._exchange_info_cache:
-            return self._exchange_info_cache[symbol]['quantity']
+    @staticmethod
+    def _tick_decimals(tick_size) -> int:
+        """tickSize 字串（如 '0.00050000'）→ 小數位數；非 10 的次方步長也正確（0.0005 → 4）"""
+        exponent = Decimal(str(tick_size)).normalize().as_tuple().exponent
+        return max(0, -exponent)
+
+    @classmethod
+    def _coerce_precision(cls, precision) -> Optional[int]:
+        """ccxt precision 可能是小數位數（int）或步長（float），統一轉成小數位數"""
+        if isinstance(precision, int):
+            return precision
+        if isinstance(precision, float) and precision > 0:
+            return cls._step_to_decimals(precision)
+        return None
+
+    def _rebuild_precision_lookup(self):
+        """依優先序合併所有精度來源，get_precision 常見路徑只需一次 dict.get"""
+        lookup = {symbol: info['amount'] for symbol, info in self.DEFAULT_PRECISIONS.items()}
+        for symbol, market in self.markets.items():
+            precision = self._coerce_precision((market.get('precision') or {}).get('amount'))
+            if precision is not None:
+                lookup[symbol] = precision
+        for symbol, info in self._exchange_info_cache.items():
+            lookup[symbol] = info['quantity']
+        self._precision_lookup = lookup
+        self._entry_cache.clear()
+        self._price_entry_cache.clear()
 
-        # 第二：ccxt markets
-        if symbol in self.markets:
-            precision = self.markets[symbol]['precision']['amount']
-            if isinstance(precision, int):
-                return precision
-            if isinstance(precision, float) and precision > 0:
-                return self._step_to_decimals(precision)
+    def get_precision(self, symbol: str) -> int:
+        """獲取交易對的數量精度（exchangeInfo → ccxt → DEFAULT → 預設 3，已預先合併）"""
+        precision = self._precision_lookup.get(symbol)
+        if precision is not None:
+            return precision
 
-        # 第三：硬編碼保底
-        if symbol in self.DEFAULT_PRECISIONS:
-            logger.debug(f"{symbol} 使用 DEFAULT_PRECISIONS")
-            return self.DEFAULT_PRECISIONS[symbol]['amount']
+        # 未知交易對（新上架）：exchangeInfo 快取過期時補抓一次
+        self._refresh_exchange_info_on_miss()
+        precision = self._precision_lookup.get(symbol)
+        if precision is not None:
+            return precision
 
-        # 全部失敗
         logger.warning(f"⚠️ {symbol} 無法取得精度，使用預設值 3")
         return 3
 
@@ -140,11 +270,9 @@ class PrecisionHandler:
             return self._exchange_info_cache[symbol]['price']
 
         if symbol in self.markets:
-            precision = self.markets[symbol]['precision']['price']
-            if isinstance(precision, int):
+            precision = self._coerce_precision(self.markets[symbol]['precision']['price'])
+            if precision is not None:
                 return precision
-            if isinstance(precision, float) and precision > 0:
-                return self._step_to_decimals(precision)
 
         if symbol in self.DEFAULT_PRECISIONS:
             return self.DEFAULT_PRECISIONS[symbol]['price']
@@ -152,20 +280,40 @@ class PrecisionHandler:
         logger.warning(f"⚠️ {symbol} 無法取得價格精度，使用預設值 2")
         return 2
 
+    def _price_entry(self, symbol: str) -> Tuple[float, Callable[[float], str]]:
+        entry = self._price_entry_cache.get(symbol)
+        if entry is None:
+            precision = self.get_price_precision(symbol)
+            tick = (self._exchange_info_cache.get(symbol) or {}).get('tick') or 10.0 ** -precision
+            entry = (tick, f"{{:.{precision}f}}".format)
+            self._price_entry_cache[symbol] = entry
+        return entry
+
+    def format_price(self, symbol: str, price: float) -> str:
+        """將價格對齊 tickSize 並格式化為交易所接受的字串（觸發價等）"""
+        tick, formatter = self._price_entry(symbol)
+        return formatter(round(price / tick) * tick)
+
+    def _entry(self, symbol: str) -> Tuple[int, int, Decimal, Callable[[float], str]]:
+        """每個交易對的精度常數只算一次：(precision, 10**p, Decimal(10)**p, formatter)"""
+        entry = self._entry_cache.get(symbol)
+        if entry is None:
+            precision = self.get_precision(symbol)
+            formatter = f"{{:.{precision}f}}".format if precision else (lambda x: str(int(x)))
+            entry = (precision, 10 ** precision, Decimal(10) ** precision, formatter)
+            self._entry_cache[symbol] = entry
+        return entry
+
     def format_quantity(self, symbol: str, quantity: float) -> str:
         """將數量格式化為交易所要求的字串精度"""
-        precision = self.get_precision(symbol)
-        if precision == 0:
-            formatted = str(int(quantity))
-        else:
-            formatted = f"{quantity:.{precision}f}"
-        logger.debug(f"{symbol} format_quantity: {quantity} → {formatted} (precision={precision})")
+        precision, _, _, formatter = self._entry(symbol)
+        formatted = formatter(quantity)
+        logger.debug("%s format_quantity: %s → %s (precision=%d)", symbol, quantity, formatted, precision)
         return formatted
 
     def round_amount_up(self, symbol: str, amount: float, price: float) -> float:
         """向上取整數量，確保訂單價值滿足最小要求"""
-        precision = self.get_precision(symbol)
-        multiplier = 10 ** precision
+        multiplier = self._entry(symbol)[1]
 
         rounded = math.ceil(amount * multiplier) / multiplier
 
@@ -175,17 +323,20 @@ class PrecisionHandler:
         if order_value < min_notional:
             min_quantity = min_notional / price
             rounded = math.ceil(min_quantity * multiplier) / multiplier
-            logger.debug(f"⚠️ 調整數量以滿足最小訂單價值 ${min_notional}")
+            logger.debug("⚠️ 調整數量以滿足最小訂單價值 $%s", min_notional)
 
         return rounded
 
     def round_amount(self, symbol: str, amount: float) -> float:
         """向下取整數量（用於平倉等操作）"""
-        precision = self.get_precision(symbol)
-        amount_decimal = Decimal(str(amount))
-        multiplier = Decimal(10) ** precision
-        rounded = (amount_decimal * multiplier).quantize(Decimal('1'), rounding=ROUND_DOWN) / multiplier
-        return float(rounded)
+        _, multiplier, decimal_multiplier, _ = self._entry(symbol)
+        if Config.STRICT_DECIMAL_ROUNDING:
+            amount_decimal = Decimal(str(amount))
+            rounded = (amount_decimal * decimal_multiplier).quantize(Decimal('1'), rounding=ROUND_DOWN)
+            return float(rounded / decimal_multiplier)
+        # 相對誤差 1e-12 吸收浮點誤差（0.29 * 100 = 28.999999999999996）；
+        # 真正略低於一個 step 的量（4.9999999995）仍向下取整，不會多出一個 step
+        return math.floor(amount * multiplier * (1 + 1e-12)) / multiplier
 
     def get_min_amount(self, symbol: str) -> float:
         """獲取交易對的最小交易數量"""
@@ -237,10 +388,46 @@ class PrecisionHandler:
 class RiskManager:
     """風險管理類"""
 
-    def __init__(self, exchange, precision_handler: PrecisionHandler):
+    def __init__(self, exchange, precision_handler: PrecisionHandler,
+                 futures_client: Optional[BinanceFuturesClient] = None):
         self.exchange = exchange
         self.precision_handler = precision_handler
-        self.futures_client = BinanceFuturesClient(Config.API_KEY, Config.API_SECRET, Config.SANDBOX_MODE)
+        # 與 bot 共用同一個 client（同一份預先初始化的 HMAC key），未提供才自建
+        self.futures_client = futures_client or BinanceFuturesClient(
+            Config.API_KEY, Config.API_SECRET, Config.SANDBOX_MODE
+        )
+
+        # 帳戶快取：(value, monotonic_ts)；成交後由 invalidate() 清除
+        self._cache_lock = threading.Lock()
+        self._balance_cache: Optional[Tuple[float, float]] = None
+        self._positions_cache: Optional[Tuple[list, float]] = None
+        # invalidate() 世代：查詢期間若已失效，結果不寫入快取、也不讓新呼叫方共用
+        self._cache_gen = 0
+        # 進行中的查詢 {(key, gen): Future}，同時 miss 的執行緒共用同一次 HTTP
+        self._inflight: Dict[Tuple[str, int], Future] = {}
+        # UserDataStream 連線中：帳戶變動由推播觸發 invalidate()，快取可放寬到 USER_STREAM_CACHE_TTL_SECONDS
+        self.stream_connected = False
+        # 冷快取時與餘額並行查詢持倉用的背景執行緒（首次需要時才建立，之後重用）
+        self._account_pool: Optional[ThreadPoolExecutor] = None
+
+    def invalidate(self):
+        """清除 balance / positions 快取（下單、平倉後呼叫，確保下一次讀到成交後狀態）"""
+        with self._cache_lock:
+            self._balance_cache = None
+            self._positions_cache = None
+            self._cache_gen += 1
+
+    def set_stream_connected(self, connected: bool):
+        """UserDataStream 連線狀態變更；斷線期間的變動沒有推播，清快取改回短 TTL 輪詢"""
+        self.stream_connected = connected
+        if not connected:
+            self.invalidate()
+
+    def _cache_fresh(self, entry) -> bool:
+        if entry is None:
+            return False
+        ttl = Config.USER_STREAM_CACHE_TTL_SECONDS if self.stream_connected else Config.ACCOUNT_CACHE_TTL_SECONDS
+        return time.monotonic() - entry[1] < ttl
 
     def _get_futures_balance(self) -> float:
         """使用 /fapi/v2/balance 端點獲取 Futures 餘額"""
@@ -248,7 +435,7 @@ class RiskManager:
             response = self.futures_client.signed_request('GET', '/fapi/v2/balance')
 
             if response.status_code == 200:
-                data = response.json()
+                data = response_json(response)
                 for asset in data:
                     if asset.get('asset') == 'USDT':
                         return float(asset.get('availableBalance', 0))
@@ -261,8 +448,48 @@ class RiskManager:
             logger.error(f"獲取 Futures 餘額失敗: {e}")
             return 0
 
+    def _single_flight(self, key: str, fetch: Callable):
+        """
+        同一 key（同一失效世代）同時只發一次查詢，其餘執行緒等待並共用結果。
+
+        Returns:
+            (result, gen) — gen 為查詢開始時的世代，供呼叫方判斷結果能否寫入快取
+        """
+        with self._cache_lock:
+            gen = self._cache_gen
+            future = self._inflight.get((key, gen))
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[(key, gen)] = future
+        if not owner:
+            return future.result(), gen
+        try:
+            result = fetch()
+            future.set_result(result)
+            return result, gen
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._cache_lock:
+                self._inflight.pop((key, gen), None)
+
     def get_balance(self) -> float:
-        """獲取帳戶餘額"""
+        """獲取帳戶餘額（ACCOUNT_CACHE_TTL_SECONDS 內重用上次成功結果）"""
+        with self._cache_lock:
+            if self._cache_fresh(self._balance_cache):
+                return self._balance_cache[0]
+
+        balance, gen = self._single_flight('balance', self._fetch_balance)
+        if balance > 0:
+            with self._cache_lock:
+                if gen == self._cache_gen:
+                    self._balance_cache = (balance, time.monotonic())
+        return balance
+
+    def _fetch_balance(self) -> float:
+        """向交易所查詢餘額（含重試）"""
         for attempt in range(Config.MAX_RETRY):
             try:
                 if Config.SANDBOX_MODE and Config.TRADING_MODE == 'future' and Config.EXCHANGE == 'binance':
@@ -296,6 +523,20 @@ class RiskManager:
             list  — 成功，可能為 []（真的沒倉位）
             None  — API 錯誤，呼叫方應跳過同步
         """
+        with self._cache_lock:
+            if self._cache_fresh(self._positions_cache):
+                return list(self._positions_cache[0])
+
+        positions, gen = self._single_flight('positions', self._fetch_positions)
+        if positions is not None:
+            with self._cache_lock:
+                if gen == self._cache_gen:
+                    self._positions_cache = (positions, time.monotonic())
+            return list(positions)
+        return None
+
+    def _fetch_positions(self) -> Optional[list]:
+        """向交易所查詢持倉；None 表示 API 錯誤"""
         try:
             if Config.SANDBOX_MODE and Config.TRADING_MODE == 'future' and Config.EXCHANGE == 'binance':
                 return self._get_futures_positions()
@@ -312,8 +553,10 @@ class RiskManager:
             response = self.futures_client.signed_request('GET', '/fapi/v2/positionRisk')
 
             if response.status_code == 200:
-                data = response.json()
-                return [p for p in data if float(p.get('positionAmt', 0)) != 0]
+                data = response_json(response)
+                # positionRisk 回傳所有交易對（單向持倉模式下多數為 0），數量欄位一次取出批次轉換
+                amounts = map(float, map(_POSITION_AMT, data))
+                return [p for p, amt in zip(data, amounts) if amt != 0]
             else:
                 logger.error(f"獲取持倉 API 錯誤: {response.status_code} - {response.text}")
                 return None
@@ -322,10 +565,26 @@ class RiskManager:
             return None
 
     def get_account_info(self) -> dict:
-        """獲取完整帳戶資訊"""
+        """
+        獲取完整帳戶資訊（餘額與持倉各自走 TTL 快取）
+
+        兩者皆未命中時並行查詢，冷快取只等一次 RTT 而非兩次。
+        """
+        with self._cache_lock:
+            positions_fresh = self._cache_fresh(self._positions_cache)
+            balance_fresh = self._cache_fresh(self._balance_cache)
+        if positions_fresh or balance_fresh:
+            return {
+                'balance': self.get_balance(),
+                'positions': self.get_positions() or []
+            }
+        if self._account_pool is None:
+            self._account_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='account')
+        positions = self._account_pool.submit(self.get_positions)
+        balance = self.get_balance()
         return {
-            'balance': self.get_balance(),
-            'positions': self.get_positions() or []
+            'balance': balance,
+            'positions': positions.result() or []
         }
 
     def calculate_position_size(self, symbol: str, balance: float,
@@ -353,8 +612,10 @@ class RiskManager:
         if not self.precision_handler.check_limits(symbol, rounded_position, entry_price):
             return 0
 
-        order_value = rounded_position * entry_price
-        logger.info(f"💰 {symbol} 倉位: {rounded_position:.6f} (訂單價值: ${order_value:.2f}, 等級乘數: {tier_multiplier})")
+        logger.info(
+            "💰 %s 倉位: %.6f (訂單價值: $%.2f, 等級乘數: %s)",
+            symbol, rounded_position, rounded_position * entry_price, tier_multiplier,
+        )
         return rounded_position
 
     def calculate_stop_loss(self, extreme_point: float, atr: float,
@@ -367,27 +628,30 @@ class RiskManager:
         else:
             return extreme_point + (atr * atr_mult)
 
+    @staticmethod
+    def total_open_risk(positions: List, entry_attr: str = 'avg_entry', size_attr: str = 'total_size') -> float:
+        """
+        未平倉部位的剩餘風險總額：Σ size × max(0, sign × (entry − sl))，sign: LONG=+1 / SHORT=−1
+
+        止損已越過進場價（鎖利）的部位風險為 0。一次向量化 reduction 取代逐筆 Python 分支。
+        """
+        open_positions = [p for p in positions if not p.is_closed]
+        n = len(open_positions)
+        if n == 0:
+            return 0.0
+        entry = np.fromiter((getattr(p, entry_attr) for p in open_positions), dtype=np.float64, count=n)
+        sl = np.fromiter((p.current_sl for p in open_positions), dtype=np.float64, count=n)
+        size = np.fromiter((getattr(p, size_attr) for p in open_positions), dtype=np.float64, count=n)
+        sign = np.fromiter((1.0 if p.side == 'LONG' else -1.0 for p in open_positions), dtype=np.float64, count=n)
+        risk_per_unit = np.maximum(sign * (entry - sl), 0.0)
+        return float(np.dot(size, risk_per_unit))
+
     def check_total_risk(self, active_positions: List) -> bool:
         """計算所有持倉的實際剩餘風險"""
         if not active_positions:
             return True
 
-        total_risk = 0.0
-
-        for trade in active_positions:
-            if trade.is_closed:
-                continue
-
-            if trade.side == 'LONG':
-                risk_per_unit = trade.entry_price - trade.current_sl
-            else:
-                risk_per_unit = trade.current_sl - trade.entry_price
-
-            if risk_per_unit <= 0:
-                continue
-
-            actual_risk_amount = trade.current_size * risk_per_unit
-            total_risk += actual_risk_amount
+        total_risk = self.total_open_risk(active_positions, 'entry_price', 'current_size')
 
         balance = self.get_balance()
         if balance <= 0:
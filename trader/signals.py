@@ -6,15 +6,28 @@ V6.0 信號偵測模組
 """
 
 import logging
+import numpy as np
 import pandas as pd
 from typing import Tuple, Optional, Dict
 
 from trader.config import Config
+from trader.indicators.kernels import (
+    evaluate_symbol, CFG_FIELDS, CFG_PB_THRESHOLD, CFG_BO_MULT, CFG_SL_ATR_BUFFER, CFG_PB_MIN_VOL,
+    SIG_PB_SIDE, SIG_PB_EXTREME, SIG_PB_STOP, SIG_PB_TARGET,
+    SIG_BO_SIDE, SIG_BO_EXTREME, SIG_BO_STOP, SIG_BO_TARGET, SIG_VOL_RATIO,
+)
 from trader.structure import StructureAnalysis
 
 logger = logging.getLogger(__name__)
 
 
+def _last_value(df: pd.DataFrame, column: str, default):
+    """取欄位最後一筆（numpy 索引）；欄位不存在時回傳 default"""
+    if column not in df.columns:
+        return default
+    return df[column].to_numpy()[-1]
+
+
 def detect_2b_with_pivots(
     df: pd.DataFrame,
     left_bars: int = 5,
@@ -68,13 +81,15 @@ def detect_2b_with_pivots(
     if last_swing_low is None and last_swing_high is None:
         return False, None
 
-    current = df.iloc[-1]
-    close = current['close']
-    low = current['low']
-    high = current['high']
-    atr = current.get('atr', 0)
-    volume = current.get('volume', 0)
-    vol_ma = current.get('vol_ma', 0)
+    # 直接取 numpy 最後一筆，避免 df.iloc[-1] 建立 Series
+    close = df['close'].to_numpy()[-1]
+    low = df['low'].to_numpy()[-1]
+    high = df['high'].to_numpy()[-1]
+    open_ = df['open'].to_numpy()[-1]
+    atr = _last_value(df, 'atr', 0)
+    volume = _last_value(df, 'volume', 0)
+    vol_ma = _last_value(df, 'vol_ma', 0)
+    signal_time = df['timestamp'].iat[-1] if 'timestamp' in df.columns else None
 
     signal_side = None
     signal_details = {}
@@ -100,8 +115,8 @@ def detect_2b_with_pivots(
                 'atr': atr,
                 'volume': volume,
                 'vol_ma': vol_ma,
-                'signal_time': current.get('timestamp'),
-                'candle_confirmed': close > current['open'],
+                'signal_time': signal_time,
+                'candle_confirmed': close > open_,
                 'detection_method': 'swing_pivot',  # 標記為 V6.0 方法
             }
 
@@ -126,8 +141,8 @@ def detect_2b_with_pivots(
                 'atr': atr,
                 'volume': volume,
                 'vol_ma': vol_ma,
-                'signal_time': current.get('timestamp'),
-                'candle_confirmed': close < current['open'],
+                'signal_time': signal_time,
+                'candle_confirmed': close < open_,
                 'detection_method': 'swing_pivot',
             }
 
@@ -135,7 +150,8 @@ def detect_2b_with_pivots(
         return False, None
 
     # === 4. 量能分級（沿用 V5.3）===
-    vol_ratio = volume / vol_ma if vol_ma > 0 else 0
+    # vol_ma 缺值（暖機 NaN / 缺欄位）或為 0 → 量比 0（與 V5.3 相同，不做除法）
+    vol_ratio = float(volume / vol_ma) if vol_ma > 0 else 0.0
 
     if vol_ratio >= vol_explosive_threshold:
         signal_strength = 'explosive'
@@ -153,16 +169,17 @@ def detect_2b_with_pivots(
     if enable_volume_grading:
         if vol_ratio < vol_minimum_threshold:
             logger.debug(
-                f"2B {signal_side} filtered: vol {vol_ratio:.2f}x < min {vol_minimum_threshold}x"
+                "2B %s filtered: vol %.2fx < min %sx", signal_side, vol_ratio, vol_minimum_threshold
             )
             return False, None
 
         if not accept_weak_signals and signal_strength == 'weak':
             logger.debug(
-                f"2B {signal_side} filtered: weak signal ({vol_ratio:.2f}x), weak signals disabled"
+                "2B %s filtered: weak signal (%.2fx), weak signals disabled", signal_side, vol_ratio
             )
             return False, None
     else:
+        # 直接比較原始量：vol_ma 為 NaN 時比較為 False → 不過濾（沿用 V5.3）
         if volume <= vol_ma:
             return False, None
 
@@ -177,16 +194,16 @@ def detect_2b_with_pivots(
     # 下限：穿透太淺視為噪音（非真正流動性獵殺）
     if atr > 0 and fakeout_depth < atr * min_fakeout_atr:
         logger.debug(
-            f"2B {signal_side} filtered: penetration too shallow "
-            f"({fakeout_depth_atr:.2f}x ATR < {min_fakeout_atr}x ATR)"
+            "2B %s filtered: penetration too shallow (%.2fx ATR < %sx ATR)",
+            signal_side, fakeout_depth_atr, min_fakeout_atr,
         )
         return False, None
 
     # 上限：穿透太深視為無效
     if atr > 0 and fakeout_depth > atr * Config.MAX_FAKEOUT_ATR:
         logger.debug(
-            f"2B {signal_side} filtered: fakeout too deep "
-            f"({fakeout_depth:.2f} > {atr * Config.MAX_FAKEOUT_ATR:.2f})"
+            "2B %s filtered: fakeout too deep (%.2f > %.2f)",
+            signal_side, fakeout_depth, atr * Config.MAX_FAKEOUT_ATR,
         )
         return False, None
 
@@ -196,19 +213,19 @@ def detect_2b_with_pivots(
     # 爆量 2B = 大概率是真突破非 fakeout（4 筆 2B explosive: 1/4 wins, avg R=-0.63）
     if signal_strength == 'explosive':
         logger.debug(
-            f"2B {signal_side} filtered: explosive volume ({vol_ratio:.2f}x) — "
-            f"likely genuine breakout, not fakeout"
+            "2B %s filtered: explosive volume (%.2fx) — likely genuine breakout, not fakeout",
+            signal_side, vol_ratio,
         )
         return False, None
 
     # === 6c. ADX 上限過濾 ===
     # ADX>50 的 2B: 53% WR / avg R=-0.23（15 筆），趨勢過強時反轉容易失敗
-    adx = current.get('adx', 0)
+    adx = _last_value(df, 'adx', 0)
     adx_max = getattr(Config, 'ADX_MAX_2B', 50)
     if adx and adx > adx_max:
         logger.debug(
-            f"2B {signal_side} filtered: ADX {adx:.1f} > {adx_max} — "
-            f"trend too strong for reversal"
+            "2B %s filtered: ADX %.1f > %s — trend too strong for reversal",
+            signal_side, adx, adx_max,
         )
         return False, None
 
@@ -221,19 +238,119 @@ def detect_2b_with_pivots(
         sl_buffer = atr * Config.SL_ATR_BUFFER_SIGNAL if atr > 0 else 0
         signal_details['stop_loss'] = last_swing_high + sl_buffer
 
-    neck_str = f"${signal_details['neckline']:.2f}" if signal_details['neckline'] else 'N/A'
-    swing_type = 'low' if signal_side == 'LONG' else 'high'
-    logger.info(
-        f"[2B] {signal_side} detected: "
-        f"price=${close:.2f} | swing_{swing_type}="
-        f"${signal_details['stop_level']:.2f} | "
-        f"neckline={neck_str} | "
-        f"vol={vol_ratio:.2f}x ({signal_strength})"
-    )
+    if logger.isEnabledFor(logging.INFO):
+        neck_str = f"${signal_details['neckline']:.2f}" if signal_details['neckline'] else 'N/A'
+        logger.info(
+            "[2B] %s detected: price=$%.2f | swing_%s=$%.2f | neckline=%s | vol=%.2fx (%s)",
+            signal_side, close, 'low' if signal_side == 'LONG' else 'high',
+            signal_details['stop_level'], neck_str, vol_ratio, signal_strength,
+        )
 
     return True, signal_details
 
 
+def _fast_signal_arrays(df: pd.DataFrame) -> Tuple[np.ndarray, ...]:
+    """取出 evaluate_symbol 所需欄位（缺欄位時 ema→NaN、atr/volume/vol_ma→0，與舊版 .get 預設一致）"""
+    n = len(df)
+
+    def col(name: str, default: float) -> np.ndarray:
+        if name in df.columns:
+            return df[name].to_numpy(dtype=np.float64)
+        return np.full(n, default)
+
+    return (
+        col('open', np.nan), col('high', np.nan), col('low', np.nan), col('close', np.nan),
+        col('volume', 0.0), col('ema_fast', np.nan), col('ema_slow', np.nan),
+        col('atr', 0.0), col('vol_ma', 0.0),
+    )
+
+
+def scan_fast_signals(
+    df: pd.DataFrame,
+    ema_pullback_threshold: float = 0.02,
+    volume_breakout_mult: float = 2.0,
+    include: Tuple[str, ...] = ('EMA_PULLBACK', 'VOLUME_BREAKOUT'),
+) -> Dict[str, Tuple[bool, Optional[Dict]]]:
+    """
+    EMA 回撤 + 量能突破：單次 kernel 呼叫同時評估
+
+    兩個偵測器讀的都是最後 20 根 K 線，合併成一次 evaluate_symbol，
+    Python 端只負責把結果組成 signal_details。
+    include 決定要組裝（並記錄 log）的信號種類。
+
+    Returns:
+        {'EMA_PULLBACK': (has_signal, details), 'VOLUME_BREAKOUT': (has_signal, details)}
+    """
+    result: Dict[str, Tuple[bool, Optional[Dict]]] = {
+        'EMA_PULLBACK': (False, None),
+        'VOLUME_BREAKOUT': (False, None),
+    }
+    if df is None or len(df) < 30:
+        return result
+
+    o, h, l, c, v, ema_f, ema_s, atr_arr, vol_ma_arr = _fast_signal_arrays(df)
+    cfg = np.empty(CFG_FIELDS)
+    cfg[CFG_PB_THRESHOLD] = ema_pullback_threshold
+    cfg[CFG_BO_MULT] = volume_breakout_mult
+    cfg[CFG_SL_ATR_BUFFER] = Config.SL_ATR_BUFFER_SIGNAL
+    cfg[CFG_PB_MIN_VOL] = Config.VOLUME_PULLBACK_MIN_RATIO
+    out = evaluate_symbol(o, h, l, c, v, ema_f, ema_s, atr_arr, vol_ma_arr, cfg)
+
+    price = c[-1]
+    atr = atr_arr[-1]
+    volume = v[-1]
+    vol_ma = vol_ma_arr[-1]
+    vol_ratio = out[SIG_VOL_RATIO]
+
+    # EMA 回撤（原始邏輯：hardcoded 0.6 門檻，signal_strength 固定 moderate）
+    if 'EMA_PULLBACK' in include and out[SIG_PB_SIDE] != 0:
+        is_long = out[SIG_PB_SIDE] > 0
+        signal_side = 'LONG' if is_long else 'SHORT'
+        result['EMA_PULLBACK'] = (True, {
+            'side': signal_side,
+            'entry_price': price,
+            'lowest_point' if is_long else 'highest_point': out[SIG_PB_EXTREME],  # raw（給 _execute_trade 用）
+            'stop_level': out[SIG_PB_STOP],
+            'target_ref': out[SIG_PB_TARGET],
+            'atr': atr,
+            'volume': volume,
+            'vol_ma': vol_ma,
+            'signal_type': 'EMA_PULLBACK',
+            'candle_confirmed': bool(price > o[-1]) if is_long else bool(price < o[-1]),
+            'neckline': None,
+            'fakeout_depth_atr': 0.0,
+            'detection_method': 'ema_pullback',
+            'vol_ratio': vol_ratio,
+            'signal_strength': 'moderate',
+        })
+        logger.info("📈 發現 EMA 回撤信號: %s", signal_side)
+
+    # 量能突破（原始邏輯：signal_strength 固定 strong）
+    if 'VOLUME_BREAKOUT' in include and out[SIG_BO_SIDE] != 0:
+        is_long = out[SIG_BO_SIDE] > 0
+        signal_side = 'LONG' if is_long else 'SHORT'
+        result['VOLUME_BREAKOUT'] = (True, {
+            'side': signal_side,
+            'entry_price': price,
+            'lowest_point' if is_long else 'highest_point': out[SIG_BO_EXTREME],  # raw（給 _execute_trade 用）
+            'stop_level': out[SIG_BO_STOP],
+            'target_ref': out[SIG_BO_TARGET],
+            'atr': atr,
+            'volume': volume,
+            'vol_ma': vol_ma,
+            'signal_type': 'VOLUME_BREAKOUT',
+            'candle_confirmed': True,
+            'neckline': None,
+            'fakeout_depth_atr': 0.0,
+            'detection_method': 'volume_breakout',
+            'vol_ratio': vol_ratio,
+            'signal_strength': 'strong',
+        })
+        logger.info("📊 發現量能突破信號: %s (量能 %.2fx)", signal_side, vol_ratio)
+
+    return result
+
+
 def detect_ema_pullback(
     df: pd.DataFrame,
     ema_pullback_threshold: float = 0.02,
@@ -252,81 +369,11 @@ def detect_ema_pullback(
     Returns:
         (has_signal, signal_details)
     """
-    if df is None or len(df) < 30:
-        return False, None
-
-    if 'ema_fast' not in df.columns or 'ema_slow' not in df.columns:
-        return False, None
-
-    current = df.iloc[-1]
-    prev = df.iloc[-2]
-
-    ema_fast = current['ema_fast']
-    ema_slow = current['ema_slow']
-    price = current['close']
-    atr = current.get('atr', 0)
-    volume = current.get('volume', 0)
-    vol_ma = current.get('vol_ma', 0)
-
-    threshold = ema_fast * ema_pullback_threshold
-
-    signal_side = None
-    signal_details = {}
-
-    # 多頭趨勢：價格回撤到 ema_fast 附近後反彈
-    if ema_fast > ema_slow:
-        if abs(prev['low'] - ema_fast) < threshold and price > ema_fast:
-            signal_side = 'LONG'
-            signal_details = {
-                'side': 'LONG',
-                'entry_price': price,
-                'lowest_point': prev['low'],               # raw（給 _execute_trade 用）
-                'stop_level': min(prev['low'], ema_slow) - atr * Config.SL_ATR_BUFFER_SIGNAL,
-                'target_ref': df['high'].iloc[-20:].max(),
-                'atr': atr,
-                'volume': volume,
-                'vol_ma': vol_ma,
-                'signal_type': 'EMA_PULLBACK',
-                'candle_confirmed': price > current['open'],
-                'neckline': None,
-                'fakeout_depth_atr': 0.0,
-                'detection_method': 'ema_pullback',
-            }
-
-    # 空頭趨勢：價格反彈到 ema_fast 附近後回落
-    elif ema_fast < ema_slow:
-        if abs(prev['high'] - ema_fast) < threshold and price < ema_fast:
-            signal_side = 'SHORT'
-            signal_details = {
-                'side': 'SHORT',
-                'entry_price': price,
-                'highest_point': prev['high'],              # raw（給 _execute_trade 用）
-                'stop_level': max(prev['high'], ema_slow) + atr * Config.SL_ATR_BUFFER_SIGNAL,
-                'target_ref': df['low'].iloc[-20:].min(),
-                'atr': atr,
-                'volume': volume,
-                'vol_ma': vol_ma,
-                'signal_type': 'EMA_PULLBACK',
-                'candle_confirmed': price < current['open'],
-                'neckline': None,
-                'fakeout_depth_atr': 0.0,
-                'detection_method': 'ema_pullback',
-            }
-
-    if signal_side is None:
+    if df is None or 'ema_fast' not in df.columns or 'ema_slow' not in df.columns:
         return False, None
-
-    # 量能過濾（原始邏輯：hardcoded 0.6 門檻，signal_strength 固定 moderate）
-    vol_ratio = volume / vol_ma if vol_ma > 0 else 0
-    if vol_ratio < Config.VOLUME_PULLBACK_MIN_RATIO:
-        return False, None
-
-    signal_details['vol_ratio'] = vol_ratio
-    signal_details['signal_strength'] = 'moderate'
-
-    logger.info(f"📈 發現 EMA 回撤信號: {signal_side}")
-
-    return True, signal_details
+    return scan_fast_signals(
+        df, ema_pullback_threshold=ema_pullback_threshold, include=('EMA_PULLBACK',),
+    )['EMA_PULLBACK']
 
 
 def detect_volume_breakout(
@@ -347,70 +394,6 @@ def detect_volume_breakout(
     Returns:
         (has_signal, signal_details)
     """
-    if df is None or len(df) < 30:
-        return False, None
-
-    current = df.iloc[-1]
-    volume = current.get('volume', 0)
-    vol_ma = current.get('vol_ma', 0)
-    atr = current.get('atr', 0)
-
-    vol_ratio = volume / vol_ma if vol_ma > 0 else 0
-
-    if vol_ratio < volume_breakout_mult:
-        return False, None
-
-    recent_high = df['high'].iloc[-10:-1].max()
-    recent_low = df['low'].iloc[-10:-1].min()
-
-    price = current['close']
-    signal_side = None
-    signal_details = {}
-
-    # 量能突破 + 突破高點 + 陽線確認
-    if price > recent_high and price > current['open']:
-        signal_side = 'LONG'
-        signal_details = {
-            'side': 'LONG',
-            'entry_price': price,
-            'lowest_point': recent_low,                # raw（給 _execute_trade 用）
-            'stop_level': recent_low - atr * 0.5,
-            'target_ref': price + (price - recent_low),
-            'atr': atr,
-            'volume': volume,
-            'vol_ma': vol_ma,
-            'signal_type': 'VOLUME_BREAKOUT',
-            'candle_confirmed': True,
-            'neckline': None,
-            'fakeout_depth_atr': 0.0,
-            'detection_method': 'volume_breakout',
-        }
-    # 量能突破 + 跌破低點 + 陰線確認
-    elif price < recent_low and price < current['open']:
-        signal_side = 'SHORT'
-        signal_details = {
-            'side': 'SHORT',
-            'entry_price': price,
-            'highest_point': recent_high,              # raw（給 _execute_trade 用）
-            'stop_level': recent_high + atr * 0.5,
-            'target_ref': price - (recent_high - price),
-            'atr': atr,
-            'volume': volume,
-            'vol_ma': vol_ma,
-            'signal_type': 'VOLUME_BREAKOUT',
-            'candle_confirmed': True,
-            'neckline': None,
-            'fakeout_depth_atr': 0.0,
-            'detection_method': 'volume_breakout',
-        }
-
-    if signal_side is None:
-        return False, None
-
-    # 量能分級（原始邏輯：signal_strength 固定 strong）
-    signal_details['vol_ratio'] = vol_ratio
-    signal_details['signal_strength'] = 'strong'
-
-    logger.info(f"📊 發現量能突破信號: {signal_side} (量能 {vol_ratio:.2f}x)")
-
-    return True, signal_details
+    return scan_fast_signals(
+        df, volume_breakout_mult=volume_breakout_mult, include=('VOLUME_BREAKOUT',),
+    )['VOLUME_BREAKOUT']
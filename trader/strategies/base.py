@@ -18,6 +18,8 @@ from typing import TYPE_CHECKING, Dict, Optional, Type, TypedDict
 
 import pandas as pd
 
+from trader.config import ConfigV6 as Cfg
+
 if TYPE_CHECKING:
     from trader.positions import PositionManager
 
@@ -41,11 +43,13 @@ class DecisionDict(TypedDict):
     add_stage: Optional[int]    # ADD 時的階段（2 or 3）
 
 
-def _apply_common_pre(pm: 'PositionManager', current_price: float, df_1h) -> Optional[dict]:
+def _apply_common_pre(
+    pm: 'PositionManager', current_price: float, df_1h, latest_atr: Optional[float] = None,
+) -> Optional[dict]:
     """
     共同前處理（V6 + V53 共用）：
     1. 更新 highest_price / lowest_price
-    2. 更新 ATR
+    2. 更新 ATR（優先用呼叫方已取出的 latest_atr，否則讀 df_1h 最後一根）
     3. 遞增 monitor_count
     4. 止損觸發檢查
     5. 快速止損（Early Stop R）檢查
@@ -54,15 +58,15 @@ def _apply_common_pre(pm: 'PositionManager', current_price: float, df_1h) -> Opt
         None → 無早期退出，繼續策略邏輯
         dict → 需立即退出，直接回傳此 DecisionDict
     """
-    from trader.config import ConfigV6 as Cfg
-
     # 更新極值
     pm.highest_price = max(pm.highest_price, current_price)
     pm.lowest_price = min(pm.lowest_price, current_price)
 
     # 更新 ATR
-    if df_1h is not None and len(df_1h) > 0 and 'atr' in df_1h.columns:
-        pm.atr = df_1h['atr'].iloc[-1]
+    if latest_atr is not None:
+        pm.atr = latest_atr
+    elif df_1h is not None and len(df_1h) > 0 and 'atr' in df_1h.columns:
+        pm.atr = float(df_1h['atr'].to_numpy()[-1])
 
     pm.monitor_count += 1
 
@@ -10,19 +10,25 @@ V7 P2: V5.3 SOP 策略實作
 - ATR trailing
 
 V53 內部狀態（is_1r_protected 等）獨立於 PositionManager，透過 get_state/load_state 持久化。
+
+決策維持逐筆 Python（不做跨持倉 numba 批次）：持倉數受 MAX_POSITIONS_PER_GROUP 限制，
+R 階梯已預先換算為價位（每 tick 僅數次 float 比較），成本由 ticker / K 線 I/O 與結構破壞的
+swing 偵測主導；njit 的每次呼叫 dispatch 開銷反而高於省下的直譯成本。
 """
 
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timezone
-from typing import TYPE_CHECKING
+import time
+from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
     import pandas as pd
     from trader.positions import PositionManager
 
 from trader.strategies.base import Action, TradingStrategy, DecisionDict, _apply_common_pre
+from trader.config import ConfigV6 as Cfg
+from trader.structure import StructureAnalysis
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +41,32 @@ class V53SopStrategy(TradingStrategy):
         self.is_first_partial = False
         self.is_second_partial = False
         self.is_trailing_active = False
+        # R 階梯價位快取（不持久化，由 side/avg_entry/risk_dist 推導）
+        self._ladder_key: Optional[tuple] = None
+        self._ladder: tuple = ()
+
+    def _ladder_for(self, pm: 'PositionManager') -> tuple:
+        """
+        進場後固定的 R 階梯，換算成「乘上方向」的絕對價位，tick 內只做比較：
+        (sign, 1.0R, 1.5R, 2.0R 觸發價 × sign, 1R 保護 / 1.5R / 2.5R 減倉後的新 SL)
+
+        sign: LONG=+1 / SHORT=-1；sign * price >= 觸發價 × sign 等同原本 current_r >= k。
+        """
+        key = (pm.side, pm.avg_entry, pm.risk_dist)
+        if key != self._ladder_key:
+            sign = 1.0 if pm.side == 'LONG' else -1.0
+            entry, r_unit = pm.avg_entry, pm.risk_dist
+            self._ladder = (
+                sign,
+                sign * (entry + sign * (r_unit * 1.0)),
+                sign * (entry + sign * (r_unit * 1.5)),
+                sign * (entry + sign * (r_unit * 2.0)),
+                entry + sign * (r_unit * 0.3),
+                entry + sign * (r_unit * 1.0),
+                entry + sign * (r_unit * 1.5),
+            )
+            self._ladder_key = key
+        return self._ladder
 
     def get_state(self) -> dict:
         return {
@@ -71,9 +103,6 @@ class V53SopStrategy(TradingStrategy):
         7. ATR trailing 移損
         8. HOLD（持倉中）
         """
-        from trader.config import ConfigV6 as Cfg
-        from trader.structure import StructureAnalysis
-
         result: DecisionDict = {
             "action": Action.HOLD,
             "reason": "NONE",
@@ -83,7 +112,7 @@ class V53SopStrategy(TradingStrategy):
         }
 
         # === 共同前處理（SL / Early Stop）===
-        early = _apply_common_pre(pm, current_price, df_1h)
+        early = _apply_common_pre(pm, current_price, df_1h, kwargs.get('latest_atr'))
         if early is not None:
             return early
 
@@ -92,8 +121,9 @@ class V53SopStrategy(TradingStrategy):
             swings = StructureAnalysis.find_swing_points(
                 df_1h, left_bars=Cfg.SWING_LEFT_BARS, right_bars=Cfg.SWING_RIGHT_BARS
             )
-            close_curr = df_1h['close'].iloc[-1]
-            close_prev = df_1h['close'].iloc[-2]
+            closes = df_1h['close'].to_numpy()
+            close_curr = closes[-1]
+            close_prev = closes[-2]
             if pm.side == 'LONG' and swings['last_swing_low'] is not None:
                 threshold = swings['last_swing_low'] * (1 - Cfg.STRUCTURE_BREAK_TOLERANCE)
                 if close_prev < threshold and close_curr < threshold:
@@ -105,34 +135,28 @@ class V53SopStrategy(TradingStrategy):
                     pm.exit_reason = 'v53_structure_break'
                     return {**result, "action": Action.CLOSE}
 
-        r_unit = pm.risk_dist
-        if r_unit == 0:
+        if pm.risk_dist == 0:
             return result
 
-        if pm.side == 'LONG':
-            current_r = (current_price - pm.avg_entry) / r_unit
-        else:
-            current_r = (pm.avg_entry - current_price) / r_unit
+        sign, r10_level, r15_level, r20_level, sl_protect, sl_partial1, sl_partial2 = self._ladder_for(pm)
+        signed_price = sign * current_price
 
         # === 時間退出 ===
-        hours_held = (datetime.now(timezone.utc) - pm.entry_time).total_seconds() / 3600
-        if hours_held >= Cfg.STAGE1_MAX_HOURS and not self.is_first_partial:
+        seconds_held = time.monotonic() - pm.entry_monotonic
+        if seconds_held >= Cfg.STAGE1_MAX_HOURS * 3600 and not self.is_first_partial:
             logger.warning(
                 f"[V53] {pm.symbol} Time exit: "
-                f"{hours_held:.1f}h >= {Cfg.STAGE1_MAX_HOURS}h"
+                f"{seconds_held / 3600:.1f}h >= {Cfg.STAGE1_MAX_HOURS}h"
             )
             pm.exit_reason = 'stage1_timeout'
             return {**result, "action": Action.CLOSE, "reason": "TIME_EXIT"}
 
         # === 2.5R 減倉 ===
-        if not self.is_second_partial and current_r >= 2.0:
+        if not self.is_second_partial and signed_price >= r20_level:
             self.is_second_partial = True
             self.is_first_partial = True
             self.is_1r_protected = True
-            if pm.side == 'LONG':
-                new_sl = pm.avg_entry + (r_unit * 1.5)
-            else:
-                new_sl = pm.avg_entry - (r_unit * 1.5)
+            new_sl = sl_partial2
             pm.current_sl = new_sl
             self.is_trailing_active = True
             return {
@@ -144,13 +168,10 @@ class V53SopStrategy(TradingStrategy):
             }
 
         # === 1.5R 減倉 ===
-        elif not self.is_first_partial and current_r >= 1.5:
+        elif not self.is_first_partial and signed_price >= r15_level:
             self.is_first_partial = True
             self.is_1r_protected = True
-            if pm.side == 'LONG':
-                new_sl = pm.avg_entry + (r_unit * 1.0)
-            else:
-                new_sl = pm.avg_entry - (r_unit * 1.0)
+            new_sl = sl_partial1
             pm.current_sl = new_sl
             self.is_trailing_active = True
             return {
@@ -162,12 +183,9 @@ class V53SopStrategy(TradingStrategy):
             }
 
         # === 1.0R 移損 ===
-        elif not self.is_1r_protected and current_r >= 1.0:
+        elif not self.is_1r_protected and signed_price >= r10_level:
             self.is_1r_protected = True
-            if pm.side == 'LONG':
-                new_sl = pm.avg_entry + (r_unit * 0.3)
-            else:
-                new_sl = pm.avg_entry - (r_unit * 0.3)
+            new_sl = sl_protect
             pm.current_sl = new_sl
             result = {**result, "reason": "V53_1R_PROTECT", "new_sl": new_sl}
 
@@ -16,7 +16,7 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timezone
+import time
 from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
@@ -24,6 +24,8 @@ if TYPE_CHECKING:
     from trader.positions import PositionManager
 
 from trader.strategies.base import Action, TradingStrategy, DecisionDict, _apply_common_pre
+from trader.config import ConfigV6 as Cfg
+from trader.structure import StructureAnalysis
 
 logger = logging.getLogger(__name__)
 
@@ -52,9 +54,6 @@ class V6PyramidStrategy(TradingStrategy):
         7. Stage Trigger 檢查
         8. HOLD（持倉中）
         """
-        from trader.config import ConfigV6 as Cfg
-        from trader.structure import StructureAnalysis
-
         result: DecisionDict = {
             "action": Action.HOLD,
             "reason": "NONE",
@@ -64,17 +63,17 @@ class V6PyramidStrategy(TradingStrategy):
         }
 
         # === 共同前處理（SL / Early Stop）===
-        early = _apply_common_pre(pm, current_price, df_1h)
+        early = _apply_common_pre(pm, current_price, df_1h, kwargs.get('latest_atr'))
         if early is not None:
             return early
 
         # === Stage 1 超時退出 ===
         if pm.stage == 1:
-            hours_held = (datetime.now(timezone.utc) - pm.entry_time).total_seconds() / 3600
-            if hours_held >= Cfg.V6_STAGE1_MAX_HOURS:
+            seconds_held = time.monotonic() - pm.entry_monotonic
+            if seconds_held >= Cfg.V6_STAGE1_MAX_HOURS * 3600:
                 logger.warning(
                     f"[V6] {pm.symbol} Stage 1 timeout: "
-                    f"{hours_held:.1f}h >= {Cfg.V6_STAGE1_MAX_HOURS}h"
+                    f"{seconds_held / 3600:.1f}h >= {Cfg.V6_STAGE1_MAX_HOURS}h"
                 )
                 pm.exit_reason = 'stage1_timeout'
                 return {**result, "action": Action.CLOSE, "reason": "TIME_EXIT"}
@@ -83,12 +82,12 @@ class V6PyramidStrategy(TradingStrategy):
         if Cfg.V6_4H_EMA20_FORCE_EXIT and df_4h is not None and len(df_4h) > 0:
             ema20_4h = None
             if 'ema_fast' in df_4h.columns:
-                ema20_4h = df_4h['ema_fast'].iloc[-1]
+                ema20_4h = df_4h['ema_fast'].to_numpy()[-1]
             elif 'ema_slow' in df_4h.columns:
-                ema20_4h = df_4h['ema_slow'].iloc[-1]
+                ema20_4h = df_4h['ema_slow'].to_numpy()[-1]
 
             if ema20_4h is not None:
-                close_4h = df_4h['close'].iloc[-1]
+                close_4h = df_4h['close'].to_numpy()[-1]
                 if pm.side == 'LONG' and close_4h < ema20_4h:
                     logger.warning(
                         f"[V6] {pm.symbol} 4H EMA20 breakdown: "
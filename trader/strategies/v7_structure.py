@@ -11,7 +11,7 @@ V7 結構驅動加倉策略
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timezone
+import time
 from typing import TYPE_CHECKING, List, Optional
 
 if TYPE_CHECKING:
@@ -19,6 +19,8 @@ if TYPE_CHECKING:
     from trader.positions import PositionManager
 
 from trader.strategies.base import Action, TradingStrategy, DecisionDict, _apply_common_pre
+from trader.config import ConfigV6 as Cfg
+from trader.structure import StructureAnalysis
 
 logger = logging.getLogger(__name__)
 
@@ -51,8 +53,6 @@ class V7StructureStrategy(TradingStrategy):
         df_4h=None,
         **kwargs,
     ) -> DecisionDict:
-        from trader.config import ConfigV6 as Cfg
-
         result: DecisionDict = {
             "action": Action.HOLD,
             "reason": "NONE",
@@ -62,7 +62,7 @@ class V7StructureStrategy(TradingStrategy):
         }
 
         # 1. 共同前處理（SL / Early Stop）
-        early = _apply_common_pre(pm, current_price, df_1h)
+        early = _apply_common_pre(pm, current_price, df_1h, kwargs.get('latest_atr'))
         if early is not None:
             return early
 
@@ -74,11 +74,11 @@ class V7StructureStrategy(TradingStrategy):
 
         # 3. Stage 1 超時
         if pm.stage == 1:
-            hours_held = (datetime.now(timezone.utc) - pm.entry_time).total_seconds() / 3600
+            seconds_held = time.monotonic() - pm.entry_monotonic
             v7_timeout = getattr(Cfg, 'V7_STAGE1_MAX_HOURS', Cfg.V6_STAGE1_MAX_HOURS)
-            if hours_held >= v7_timeout:
+            if seconds_held >= v7_timeout * 3600:
                 logger.warning(
-                    f"[V7] {pm.symbol} Stage 1 timeout: {hours_held:.1f}h >= {v7_timeout}h"
+                    f"[V7] {pm.symbol} Stage 1 timeout: {seconds_held / 3600:.1f}h >= {v7_timeout}h"
                 )
                 pm.exit_reason = 'stage1_timeout'
                 return {**result, "action": Action.CLOSE, "reason": "TIME_EXIT"}
@@ -99,8 +99,6 @@ class V7StructureStrategy(TradingStrategy):
 
     def _check_add_trigger(self, pm, current_price, df_1h, Cfg) -> Optional[DecisionDict]:
         """三條件 AND 加倉觸發"""
-        from trader.structure import StructureAnalysis
-
         swings = StructureAnalysis.find_swing_points(
             df_1h, Cfg.SWING_LEFT_BARS, Cfg.SWING_RIGHT_BARS
         )
@@ -195,8 +193,6 @@ class V7StructureStrategy(TradingStrategy):
 
     def _check_reverse_2b(self, pm, df_1h, Cfg) -> Optional[DecisionDict]:
         """反向 2B 檢測（從 V6 移植，穿透深度 + 下根確認）"""
-        from trader.structure import StructureAnalysis
-
         swings = StructureAnalysis.find_swing_points(
             df_1h, Cfg.SWING_LEFT_BARS, Cfg.SWING_RIGHT_BARS
         )
@@ -243,8 +239,6 @@ class V7StructureStrategy(TradingStrategy):
 
         df 可以是 1H 或低時間框架（如 15m），由呼叫端根據 stage 決定。
         """
-        from trader.structure import StructureAnalysis
-
         swings = StructureAnalysis.find_swing_points(
             df, Cfg.SWING_LEFT_BARS, Cfg.SWING_RIGHT_BARS
         )
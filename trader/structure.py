@@ -5,9 +5,12 @@ Swing Point 結構分析模組
 實現真正的 Swing Point Pivot 偵測（左右側確認）+ Neckline 識別。
 """
 
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple, Optional
 
+from trader.indicators.kernels import swing_pivots_nb
+
 
 class StructureAnalysis:
     """結構分析工具"""
@@ -48,45 +51,15 @@ class StructureAnalysis:
                 'second_last_swing_high': None,
             }
 
-        swing_lows = []
-        swing_highs = []
-
-        # 遍歷可驗證範圍（排除頭尾無法確認的 K 線）
-        for i in range(left_bars, len(df) - right_bars):
-            current_low = df['low'].iloc[i]
-            current_high = df['high'].iloc[i]
+        # 逐筆比較交給 Numba kernel，避免巢狀迴圈內的 .iloc 存取
+        low = df['low'].to_numpy(dtype=np.float64)
+        high = df['high'].to_numpy(dtype=np.float64)
+        is_low, is_high = swing_pivots_nb(high, low, left_bars, right_bars)
 
-            # === Swing Low 檢查 ===
-            is_swing_low = True
-            # 左側驗證：左邊 left_bars 根 K 線都更高
-            for j in range(1, left_bars + 1):
-                if df['low'].iloc[i - j] <= current_low:
-                    is_swing_low = False
-                    break
-            # 右側驗證：右邊 right_bars 根 K 線都更高
-            if is_swing_low:
-                for j in range(1, right_bars + 1):
-                    if df['low'].iloc[i + j] <= current_low:
-                        is_swing_low = False
-                        break
-            if is_swing_low:
-                swing_lows.append((i, current_low))
-
-            # === Swing High 檢查 ===
-            is_swing_high = True
-            # 左側驗證：左邊 left_bars 根 K 線都更低
-            for j in range(1, left_bars + 1):
-                if df['high'].iloc[i - j] >= current_high:
-                    is_swing_high = False
-                    break
-            # 右側驗證：右邊 right_bars 根 K 線都更低
-            if is_swing_high:
-                for j in range(1, right_bars + 1):
-                    if df['high'].iloc[i + j] >= current_high:
-                        is_swing_high = False
-                        break
-            if is_swing_high:
-                swing_highs.append((i, current_high))
+        low_idx = np.flatnonzero(is_low)
+        high_idx = np.flatnonzero(is_high)
+        swing_lows = list(zip(low_idx.tolist(), low[low_idx].tolist()))
+        swing_highs = list(zip(high_idx.tolist(), high[high_idx].tolist()))
 
         return {
             'swing_lows': swing_lows,
@@ -231,6 +231,10 @@ def integration_bot(tmp_path):
     bot.exchange.fetch_ticker = MagicMock(return_value={
         'last': 50000.0, 'bid': 49999.0, 'ask': 50001.0,
     })
+    # fetch_tickers（monitor 批次）→ 逐一轉給當下的 fetch_ticker，test 改寫 fetch_ticker 即生效
+    bot.exchange.fetch_tickers = MagicMock(
+        side_effect=lambda symbols: {s: bot.exchange.fetch_ticker(s) for s in symbols}
+    )
 
     # data_provider.fetch_ohlcv → MagicMock（由各 test 自行設回傳值）
     bot.data_provider = MagicMock()
@@ -0,0 +1,209 @@
+"""
+Test: RiskManager balance / positions TTL 快取
+
+- TTL 內重用，不重打 API
+- 失敗結果（0 / None）不快取
+- invalidate() 後立即重新查詢
+- 下單 / 平倉 wrapper 會讓快取失效
+- 同時 miss 的執行緒共用同一次查詢；查詢期間失效的結果不寫入快取
+- get_account_info 冷快取時餘額與持倉並行查詢
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from trader.config import Config
+from trader.risk.manager import RiskManager
+
+
+def _rm() -> RiskManager:
+    return RiskManager(MagicMock(), MagicMock())
+
+
+def test_shares_injected_futures_client():
+    client = MagicMock()
+    assert RiskManager(MagicMock(), MagicMock(), client).futures_client is client
+
+
+class TestBalanceCache:
+
+    def test_reused_within_ttl(self):
+        rm = _rm()
+        with patch.object(rm, '_fetch_balance', return_value=1000.0) as fetch:
+            assert rm.get_balance() == 1000.0
+            assert rm.get_balance() == 1000.0
+        assert fetch.call_count == 1
+
+    def test_expired_after_ttl(self, monkeypatch):
+        rm = _rm()
+        monkeypatch.setattr(Config, 'ACCOUNT_CACHE_TTL_SECONDS', 0)
+        with patch.object(rm, '_fetch_balance', return_value=1000.0) as fetch:
+            rm.get_balance()
+            rm.get_balance()
+        assert fetch.call_count == 2
+
+    def test_zero_not_cached(self):
+        rm = _rm()
+        with patch.object(rm, '_fetch_balance', side_effect=[0, 500.0]) as fetch:
+            assert rm.get_balance() == 0
+            assert rm.get_balance() == 500.0
+        assert fetch.call_count == 2
+
+    def test_invalidate(self):
+        rm = _rm()
+        with patch.object(rm, '_fetch_balance', side_effect=[1000.0, 900.0]):
+            assert rm.get_balance() == 1000.0
+            rm.invalidate()
+            assert rm.get_balance() == 900.0
+
+
+class TestPositionsCache:
+
+    def test_reused_within_ttl(self):
+        rm = _rm()
+        positions = [{'symbol': 'BTCUSDT', 'positionAmt': '0.01'}]
+        with patch.object(rm, '_fetch_positions', return_value=positions) as fetch:
+            assert rm.get_positions() == positions
+            assert rm.get_positions() == positions
+        assert fetch.call_count == 1
+
+    def test_error_not_cached(self):
+        rm = _rm()
+        with patch.object(rm, '_fetch_positions', side_effect=[None, []]) as fetch:
+            assert rm.get_positions() is None
+            assert rm.get_positions() == []
+        assert fetch.call_count == 2
+
+    def test_caller_mutation_does_not_leak(self):
+        rm = _rm()
+        with patch.object(rm, '_fetch_positions', return_value=[{'symbol': 'BTCUSDT'}]):
+            rm.get_positions().clear()
+            assert rm.get_positions() == [{'symbol': 'BTCUSDT'}]
+
+
+class TestSingleFlight:
+
+    def test_concurrent_misses_share_one_fetch(self):
+        rm = _rm()
+        release = threading.Event()
+        calls = []
+
+        def slow_fetch():
+            calls.append(1)
+            release.wait(2)
+            return 1000.0
+
+        results = []
+        with patch.object(rm, '_fetch_balance', side_effect=slow_fetch):
+            threads = [threading.Thread(target=lambda: results.append(rm.get_balance()))
+                       for _ in range(5)]
+            for t in threads:
+                t.start()
+            # 讓其餘執行緒排到進行中的查詢後再放行；晚到的會直接命中快取
+            time.sleep(0.05)
+            release.set()
+            for t in threads:
+                t.join(2)
+        assert results == [1000.0] * 5
+        assert len(calls) == 1
+        assert rm._inflight == {}
+
+    def test_invalidate_during_fetch_not_cached(self):
+        rm = _rm()
+
+        def fetch_then_invalidated():
+            rm.invalidate()
+            return 1000.0
+
+        with patch.object(rm, '_fetch_balance', side_effect=fetch_then_invalidated) as fetch:
+            assert rm.get_balance() == 1000.0
+            assert rm.get_balance() == 1000.0
+        assert fetch.call_count == 2
+
+    def test_fetch_error_propagates_and_clears(self):
+        rm = _rm()
+        with patch.object(rm, '_fetch_positions', side_effect=RuntimeError('boom')):
+            try:
+                rm.get_positions()
+            except RuntimeError:
+                pass
+        assert rm._inflight == {}
+        with patch.object(rm, '_fetch_positions', return_value=[]):
+            assert rm.get_positions() == []
+
+
+class TestFuturesPositions:
+
+    def test_zero_amounts_filtered(self):
+        rm = _rm()
+        rm.futures_client = MagicMock()
+        response = MagicMock(status_code=200)
+        response.json.return_value = [
+            {'symbol': 'BTCUSDT', 'positionAmt': '0.010'},
+            {'symbol': 'ETHUSDT', 'positionAmt': '0.000'},
+            {'symbol': 'SOLUSDT', 'positionAmt': '-3'},
+        ]
+        rm.futures_client.signed_request.return_value = response
+        assert [p['symbol'] for p in rm._get_futures_positions()] == ['BTCUSDT', 'SOLUSDT']
+
+
+class TestAccountInfo:
+
+    def test_cold_cache_fetches_concurrently(self):
+        rm = _rm()
+        both_started = threading.Barrier(2, timeout=2)
+
+        def fetch_balance():
+            both_started.wait()  # 兩個查詢必須同時在途才會通過
+            return 1000.0
+
+        def fetch_positions():
+            both_started.wait()
+            return [{'symbol': 'BTCUSDT'}]
+
+        with patch.object(rm, '_fetch_balance', side_effect=fetch_balance), \
+             patch.object(rm, '_fetch_positions', side_effect=fetch_positions):
+            info = rm.get_account_info()
+        assert info == {'balance': 1000.0, 'positions': [{'symbol': 'BTCUSDT'}]}
+
+    def test_cold_fetch_reuses_pool(self):
+        rm = _rm()
+        with patch.object(rm, '_fetch_balance', return_value=1000.0), \
+             patch.object(rm, '_fetch_positions', return_value=[]):
+            rm.get_account_info()
+            pool = rm._account_pool
+            rm.invalidate()
+            rm.get_account_info()
+        assert pool is not None and rm._account_pool is pool
+
+    def test_warm_cache_no_fetch(self):
+        rm = _rm()
+        with patch.object(rm, '_fetch_balance', return_value=1000.0) as fb, \
+             patch.object(rm, '_fetch_positions', return_value=[]) as fp:
+            rm.get_account_info()
+            rm.get_account_info()
+        assert fb.call_count == 1 and fp.call_count == 1
+
+
+class TestInvalidateOnOrders:
+
+    def test_create_order_invalidates(self, mock_bot):
+        mock_bot.execution_engine = MagicMock()
+        mock_bot.risk_manager.invalidate = MagicMock()
+        mock_bot._futures_create_order('BTC/USDT', 'BUY', 0.01)
+        mock_bot.risk_manager.invalidate.assert_called_once()
+
+    def test_close_position_invalidates_even_on_error(self, mock_bot):
+        mock_bot.execution_engine = MagicMock()
+        mock_bot.execution_engine.close_position.side_effect = RuntimeError('api down')
+        mock_bot.risk_manager.invalidate = MagicMock()
+        try:
+            mock_bot._futures_close_position('BTC/USDT', 'LONG', 0.01)
+        except RuntimeError:
+            pass
+        mock_bot.risk_manager.invalidate.assert_called_once()
@@ -0,0 +1,164 @@
+"""
+Test: BinanceFuturesClient
+
+- 共用 keep-alive session（連線池）
+- signed_request 帶 API key header、簽章參數
+- 預初始化 HMAC template 的簽章與逐次計算一致
+- response_json：orjson 可用時解析 bytes，否則 fallback
+- json_dumps：orjson / stdlib 輸出一致的 UTF-8 bytes
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from trader.infrastructure.api_client import BinanceFuturesClient, get_futures_session
+
+
+def _client() -> BinanceFuturesClient:
+    return BinanceFuturesClient(api_key='test_key', api_secret='test_secret', sandbox=True)
+
+
+class TestSharedSession:
+
+    def test_clients_share_session(self):
+        assert _client().session is _client().session is get_futures_session()
+
+    def test_https_adapter_pool(self):
+        adapter = get_futures_session().get_adapter('https://demo-fapi.binance.com')
+        assert adapter._pool_maxsize == 20
+
+    def test_signed_get_uses_session(self):
+        client = _client()
+        mock_response = MagicMock(status_code=200, headers={})
+        with patch.object(client.session, 'get', return_value=mock_response) as mock_get:
+            client.signed_request('GET', '/fapi/v2/balance')
+
+        args, kwargs = mock_get.call_args
+        query = parse_qs(urlsplit(args[0]).query)
+        assert kwargs['headers']['X-MBX-APIKEY'] == 'test_key'
+        assert 'signature' in query and 'timestamp' in query
+        assert kwargs['timeout'] == 30
+
+    def test_signed_post_sends_body(self):
+        client = _client()
+        mock_response = MagicMock(status_code=200, headers={})
+        with patch.object(client.session, 'post', return_value=mock_response) as mock_post:
+            client.signed_request('POST', '/fapi/v1/order', {'symbol': 'BTCUSDT'})
+
+        _, kwargs = mock_post.call_args
+        body = parse_qs(kwargs['data'])
+        assert body['symbol'] == ['BTCUSDT']
+        assert 'signature' in body
+        assert kwargs['headers']['Content-Type'] == 'application/x-www-form-urlencoded'
+
+    def test_caller_params_not_mutated(self):
+        client = _client()
+        params = {'symbol': 'BTCUSDT'}
+        with patch.object(client.session, 'post', return_value=MagicMock(status_code=200, headers={})):
+            client.signed_request('POST', '/fapi/v1/order', params)
+        assert params == {'symbol': 'BTCUSDT'}
+
+    def test_slots_no_instance_dict(self):
+        assert not hasattr(_client(), '__dict__')
+
+
+class TestUsedWeight:
+
+    def test_weight_header_tracked(self):
+        client = _client()
+        response = MagicMock(status_code=200, headers={'X-MBX-USED-WEIGHT-1M': '37'})
+        with patch.object(client.session, 'get', return_value=response):
+            client.signed_request('GET', '/fapi/v2/balance')
+        assert client._current_weight == 37
+
+        response.headers = {'X-MBX-USED-WEIGHT-1M': 'n/a'}
+        with patch.object(client.session, 'get', return_value=response):
+            client.signed_request('GET', '/fapi/v2/balance')
+        assert client._current_weight == 37
+
+    def test_parallel_requests_share_weight_lock(self):
+        """平行執行緒共用 client：權重更新走同一把鎖，最後值為其中一個回應的 header"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        client = _client()
+        responses = [MagicMock(status_code=200, headers={'X-MBX-USED-WEIGHT-1M': str(w)}) for w in range(1, 9)]
+        with patch.object(client.session, 'get', side_effect=responses):
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                list(pool.map(lambda _: client.signed_request('GET', '/fapi/v2/balance'), range(8)))
+        assert 1 <= client._current_weight <= 8
+        assert not client._weight_lock.locked()
+
+
+class TestSigning:
+
+    def test_signature_matches_fresh_hmac(self):
+        import hashlib
+        import hmac
+
+        client = BinanceFuturesClient(api_key='k', api_secret='  secret  ', sandbox=True)
+        mock_response = MagicMock(status_code=200, headers={})
+        for _ in range(2):  # template 不應被前一次簽章污染
+            with patch.object(client.session, 'get', return_value=mock_response) as mock_get:
+                client.signed_request('GET', '/fapi/v2/balance', {'symbol': 'BTCUSDT'})
+            # 簽章涵蓋送出的查詢字串本身（signature 之前的全部內容）
+            signed, signature = urlsplit(mock_get.call_args[0][0]).query.split('&signature=')
+            assert signed.startswith('symbol=BTCUSDT&recvWindow=10000&timestamp=')
+            expected = hmac.new(b'secret', signed.encode(), hashlib.sha256).hexdigest()
+            assert signature == expected
+
+
+class TestResponseJson:
+
+    def test_parses_bytes_content(self):
+        import requests
+        from trader.infrastructure.api_client import response_json
+
+        resp = requests.Response()
+        resp._content = b'{"symbols": [{"symbol": "BTCUSDT", "quantityPrecision": 3}]}'
+        assert response_json(resp) == {'symbols': [{'symbol': 'BTCUSDT', 'quantityPrecision': 3}]}
+
+    def test_without_orjson_falls_back(self, monkeypatch):
+        import requests
+        from trader.infrastructure import api_client
+
+        monkeypatch.setattr(api_client, 'orjson', None)
+        resp = requests.Response()
+        resp._content = b'[1, 2]'
+        assert api_client.response_json(resp) == [1, 2]
+
+    def test_json_loads_with_and_without_orjson(self, monkeypatch):
+        from trader.infrastructure import api_client
+
+        payload = b'{"hot_symbols": [{"symbol": "ETH/USDT"}]}'
+        expected = {'hot_symbols': [{'symbol': 'ETH/USDT'}]}
+        assert api_client.json_loads(payload) == expected
+        monkeypatch.setattr(api_client, 'orjson', None)
+        assert api_client.json_loads(payload) == expected
+
+    def test_json_dumps_round_trip(self, monkeypatch):
+        import json
+
+        import numpy as np
+        from trader.infrastructure import api_client
+
+        obj = {'symbol': '比特幣', 'price': np.float64(1.5), 'entries': [1, 2]}
+        for orjson in (api_client.orjson, None):
+            monkeypatch.setattr(api_client, 'orjson', orjson)
+            for indent in (False, True):
+                out = api_client.json_dumps(obj, indent=indent)
+                assert isinstance(out, bytes)
+                assert '比特幣'.encode('utf-8') in out
+                assert json.loads(out) == {'symbol': '比特幣', 'price': 1.5, 'entries': [1, 2]}
+
+
+class TestSymbolId:
+
+    def test_strips_slash(self):
+        from trader.infrastructure.api_client import exchange_symbol_id
+
+        assert exchange_symbol_id('BTC/USDT') == 'BTCUSDT'
+        assert exchange_symbol_id('1000PEPE/USDT') == '1000PEPEUSDT'
@@ -0,0 +1,34 @@
+"""
+Test: _apply_common_pre ATR 更新
+
+- 呼叫方傳入 latest_atr → 直接使用，不讀 DataFrame
+- 未傳入 → 讀 df_1h 最後一根 atr
+- PositionManager.monitor 將 latest_atr 轉交策略
+"""
+
+import pandas as pd
+
+from trader.strategies.base import _apply_common_pre
+from trader.tests.conftest import make_pm
+
+
+def _df(atr_values):
+    return pd.DataFrame({'close': [100.0] * len(atr_values), 'atr': atr_values})
+
+
+class TestLatestAtr:
+
+    def test_latest_atr_preferred(self):
+        pm = make_pm(symbol='BTC/USDT', side='LONG', entry_price=100.0, stop_loss=90.0)
+        _apply_common_pre(pm, 100.0, _df([1.0, 2.0]), latest_atr=5.0)
+        assert pm.atr == 5.0
+
+    def test_falls_back_to_dataframe(self):
+        pm = make_pm(symbol='BTC/USDT', side='LONG', entry_price=100.0, stop_loss=90.0)
+        _apply_common_pre(pm, 100.0, _df([1.0, 2.0]))
+        assert pm.atr == 2.0
+
+    def test_monitor_forwards_latest_atr(self):
+        pm = make_pm(symbol='BTC/USDT', side='LONG', entry_price=100.0, stop_loss=90.0)
+        pm.monitor(100.0, _df([1.0, 2.0]), None, latest_atr=3.5)
+        assert pm.atr == 3.5
@@ -0,0 +1,93 @@
+"""
+Test: Config.load_from_json
+
+- 讀取 bot_config.json / secrets.json 並套用到 Config
+- 檔案 mtime / size 未變更時不重新解析；任一檔案變更即重載
+- 驗證失敗時還原加載前的值（含 dict 原地 merge 的項目）；熱重載可略過 secrets
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from trader.config import Config
+import trader.config as config_module
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    """寫入只含 check_interval 的配置檔；測試結束還原 Config"""
+    for attr in ('CHECK_INTERVAL', 'API_KEY', 'DIAGNOSTIC_TIMEFRAMES', 'STAGE1_RATIO', 'STRATEGY_USE_V6',
+                 'TIMEFRAME_SIGNAL'):
+        monkeypatch.setattr(Config, attr, getattr(Config, attr))
+    monkeypatch.setattr(Config, '_loaded_signatures', {})
+    path = tmp_path / 'bot_config.json'
+    path.write_text(json.dumps({'check_interval': 45}), encoding='utf-8')
+    return path
+
+
+class TestLoadFromJson:
+
+    def test_loads_config_and_secrets(self, config_file):
+        (config_file.parent / 'secrets.json').write_text(json.dumps({'api_key': 'k'}), encoding='utf-8')
+
+        Config.load_from_json(str(config_file))
+
+        assert Config.CHECK_INTERVAL == 45
+        assert Config.API_KEY == 'k'
+
+    def test_unchanged_file_not_reparsed(self, config_file):
+        Config.load_from_json(str(config_file))
+        with patch.object(config_module, '_read_json', wraps=config_module._read_json) as read:
+            Config.load_from_json(str(config_file))
+        read.assert_not_called()
+
+    def test_modified_file_reloaded(self, config_file):
+        Config.load_from_json(str(config_file))
+        config_file.write_text(json.dumps({'check_interval': 90}), encoding='utf-8')
+        st = config_file.stat()
+        os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        Config.load_from_json(str(config_file))
+
+        assert Config.CHECK_INTERVAL == 90
+
+    def test_diagnostic_timeframes_follow_signal_timeframe(self, config_file):
+        assert Config.DIAGNOSTIC_TIMEFRAMES == config_module._diagnostic_timeframes(Config.TIMEFRAME_SIGNAL)
+        config_file.write_text(json.dumps({'timeframe_signal': '15m'}), encoding='utf-8')
+
+        Config.load_from_json(str(config_file))
+
+        assert Config.DIAGNOSTIC_TIMEFRAMES == config_module._diagnostic_timeframes('15m')
+        assert Config.DIAGNOSTIC_TIMEFRAMES[0] == ('15m', 50)
+
+    def test_validation_failure_restores_previous_values(self, config_file):
+        flags = Config.STRATEGY_USE_V6
+        before = dict(flags)
+        config_file.write_text(json.dumps({
+            'check_interval': 45,
+            'stage1_ratio': 0.9,                  # 三段比例總和 != 1 → validate 失敗
+            'strategy_use_v6': {'2B_BREAKOUT': False},
+        }), encoding='utf-8')
+
+        with pytest.raises(ValueError):
+            Config.load_from_json(str(config_file))
+
+        assert Config.CHECK_INTERVAL != 45
+        assert Config.STRATEGY_USE_V6 is flags
+        assert Config.STRATEGY_USE_V6 == before
+
+    def test_secrets_skipped_when_excluded(self, config_file):
+        (config_file.parent / 'secrets.json').write_text(json.dumps({'api_key': 'k'}), encoding='utf-8')
+        before = Config.API_KEY
+
+        Config.load_from_json(str(config_file), include_secrets=False)
+
+        assert Config.CHECK_INTERVAL == 45
+        assert Config.API_KEY == before
@@ -0,0 +1,215 @@
+"""
+Test: MarketDataProvider
+
+- fetch_ohlcv 回傳欄位與型別
+- Demo Trading fallback 走共用 keep-alive session
+- fetch_ohlcv_batch 並行抓取、重複請求去重、單筆失敗不影響其他
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from trader.config import Config
+from trader.infrastructure.data_provider import MarketDataProvider
+
+
+def _klines(rows: int = 5, start_ms: int = 1_700_000_000_000):
+    return [
+        [start_ms + i * 3_600_000, 100.0 + i, 101.0 + i, 99.0 + i, 100.5 + i, 1000.0]
+        for i in range(rows)
+    ]
+
+
+def _provider(exchange=None) -> MarketDataProvider:
+    exchange = exchange or MagicMock()
+    return MarketDataProvider(exchange, max_retry=1, retry_delay=0)
+
+
+class TestFetchOhlcv:
+
+    def test_columns_and_timestamp(self):
+        exchange = MagicMock()
+        exchange.fetch_ohlcv.return_value = _klines()
+        df = _provider(exchange).fetch_ohlcv('BTC/USDT', '1h', limit=5)
+
+        assert list(df.columns) == ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+        assert pd.api.types.is_datetime64_any_dtype(df['timestamp'])
+        assert len(df) == 5
+
+    def test_empty_response(self):
+        exchange = MagicMock()
+        exchange.fetch_ohlcv.return_value = []
+        assert _provider(exchange).fetch_ohlcv('BTC/USDT', '1h').empty
+
+    def test_sandbox_fallback_uses_shared_session(self):
+        exchange = MagicMock()
+        exchange.fetch_ohlcv.side_effect = RuntimeError('ccxt sandbox unsupported')
+        session = MagicMock()
+        session.get.return_value = MagicMock(
+            status_code=200, content=None,
+            json=lambda: [[str(r[0])] + [str(v) for v in r[1:]] for r in _klines(3)],
+        )
+        provider = MarketDataProvider(exchange, max_retry=1, retry_delay=0,
+                                      sandbox_mode=True, trading_mode='future')
+        with patch('trader.infrastructure.data_provider.get_futures_session', return_value=session):
+            df = provider.fetch_ohlcv('BTC/USDT', '1h', limit=3)
+
+        assert session.get.call_args[0][0] == 'https://demo-fapi.binance.com/fapi/v1/klines'
+        assert df['close'].tolist() == [100.5, 101.5, 102.5]
+
+    def test_raw_klines_parsed_to_float_columns(self):
+        """Binance 原始 klines（字串價量、12 欄）→ float64 欄位，時間戳精確"""
+        exchange = MagicMock()
+        exchange.fetch_ohlcv.side_effect = RuntimeError('ccxt sandbox unsupported')
+        raw = [[r[0]] + [str(v) for v in r[1:]] + [r[0] + 3_599_999, '0', 10, '0', '0', '0'] for r in _klines(3)]
+        session = MagicMock()
+        session.get.return_value = MagicMock(status_code=200, content=None, json=lambda: raw)
+        provider = MarketDataProvider(exchange, max_retry=1, retry_delay=0,
+                                      sandbox_mode=True, trading_mode='future')
+        with patch('trader.infrastructure.data_provider.get_futures_session', return_value=session):
+            df = provider.fetch_ohlcv('BTC/USDT', '1h', limit=3)
+
+        assert list(df.columns) == ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+        assert all(df[col].dtype == 'float64' for col in ['open', 'high', 'low', 'close', 'volume'])
+        assert df['timestamp'].iloc[0] == pd.Timestamp(1_700_000_000_000, unit='ms')
+
+
+def _live_klines(rows: int = 5):
+    """最後一根是目前這根 1H K 線（尚未收盤）"""
+    now_ms = int(time.time() * 1000)
+    return _klines(rows, start_ms=now_ms - now_ms % 3_600_000 - (rows - 1) * 3_600_000)
+
+
+class TestOhlcvTtlCache:
+
+    def test_same_cycle_refetch_served_from_cache(self):
+        exchange = MagicMock()
+        exchange.fetch_ohlcv.return_value = _live_klines(10)
+        provider = _provider(exchange)
+
+        full = provider.fetch_ohlcv('BTC/USDT', '1h', limit=10)
+        tail = provider.fetch_ohlcv('BTC/USDT', '1h', limit=4)
+
+        assert exchange.fetch_ohlcv.call_count == 1
+        assert tail['close'].tolist() == full['close'].tolist()[-4:]
+        assert tail.index.tolist() == [0, 1, 2, 3]
+
+    def test_larger_limit_refetches(self):
+        exchange = MagicMock()
+        exchange.fetch_ohlcv.side_effect = lambda s, tf, limit: _live_klines(limit)
+        provider = _provider(exchange)
+
+        provider.fetch_ohlcv('BTC/USDT', '1h', limit=4)
+        assert len(provider.fetch_ohlcv('BTC/USDT', '1h', limit=10)) == 10
+        assert exchange.fetch_ohlcv.call_count == 2
+
+    def test_closed_bar_not_cached(self):
+        """最後一根已收盤 → 快取立即過期，下一根開盤不會被舊資料蓋住"""
+        exchange = MagicMock()
+        exchange.fetch_ohlcv.return_value = _klines(5)
+        provider = _provider(exchange)
+
+        provider.fetch_ohlcv('BTC/USDT', '1h', limit=5)
+        provider.fetch_ohlcv('BTC/USDT', '1h', limit=5)
+        assert exchange.fetch_ohlcv.call_count == 2
+
+    def test_caller_columns_do_not_leak(self):
+        exchange = MagicMock()
+        exchange.fetch_ohlcv.return_value = _live_klines(5)
+        provider = _provider(exchange)
+
+        df = provider.fetch_ohlcv('BTC/USDT', '1h', limit=5)
+        df['atr'] = 1.0
+        assert 'atr' not in provider.fetch_ohlcv('BTC/USDT', '1h', limit=5).columns
+
+    def test_indicator_pipeline_keeps_cached_ohlcv(self):
+        """淺複製契約：指標計算只新增 / 整欄替換欄位，快取中的 OHLCV 值不被改動"""
+        from trader.indicators.technical import TechnicalAnalysis
+
+        exchange = MagicMock()
+        exchange.fetch_ohlcv.return_value = _live_klines(60)
+        provider = _provider(exchange)
+
+        df = provider.fetch_ohlcv('BTC/USDT', '1h', limit=60)
+        original = df.copy(deep=True)
+        df = TechnicalAnalysis.calculate_indicators(df)
+        df['close'] = df['close'] * 2
+
+        cached = provider.fetch_ohlcv('BTC/USDT', '1h', limit=60)
+        assert exchange.fetch_ohlcv.call_count == 1
+        pd.testing.assert_frame_equal(cached, original)
+
+    def test_ttl_zero_disables(self, monkeypatch):
+        monkeypatch.setattr(Config, 'OHLCV_CACHE_TTL_SECONDS', 0)
+        exchange = MagicMock()
+        exchange.fetch_ohlcv.return_value = _live_klines(5)
+        provider = _provider(exchange)
+
+        provider.fetch_ohlcv('BTC/USDT', '1h', limit=5)
+        provider.fetch_ohlcv('BTC/USDT', '1h', limit=5)
+        assert exchange.fetch_ohlcv.call_count == 2
+
+
+class TestFetchOhlcvBatch:
+
+    def test_returns_frame_per_request(self):
+        exchange = MagicMock()
+        exchange.fetch_ohlcv.side_effect = lambda s, tf, limit: _klines(limit)
+        reqs = [('BTC/USDT', '1h', 5), ('ETH/USDT', '1h', 3), ('BTC/USDT', '1d', 4)]
+
+        frames = _provider(exchange).fetch_ohlcv_batch(reqs)
+
+        assert set(frames) == set(reqs)
+        assert len(frames[('ETH/USDT', '1h', 3)]) == 3
+        assert len(frames[('BTC/USDT', '1d', 4)]) == 4
+
+    def test_duplicate_requests_fetched_once(self):
+        exchange = MagicMock()
+        exchange.fetch_ohlcv.return_value = _klines()
+        reqs = [('BTC/USDT', '1h', 5)] * 3
+
+        frames = _provider(exchange).fetch_ohlcv_batch(reqs)
+
+        assert len(frames) == 1
+        assert exchange.fetch_ohlcv.call_count == 1
+
+    def test_failure_isolated(self):
+        provider = _provider()
+
+        def fake_fetch(symbol, timeframe, limit=100):
+            if symbol == 'BAD/USDT':
+                raise RuntimeError('boom')
+            return pd.DataFrame({'close': [1.0]})
+
+        provider.fetch_ohlcv = fake_fetch
+        frames = provider.fetch_ohlcv_batch([('BAD/USDT', '1h', 5), ('BTC/USDT', '1h', 5)])
+
+        assert frames[('BAD/USDT', '1h', 5)].empty
+        assert not frames[('BTC/USDT', '1h', 5)].empty
+
+    def test_concurrency_bounded(self):
+        provider = _provider()
+        lock = threading.Lock()
+        state = {'inflight': 0, 'peak': 0}
+
+        def fake_fetch(symbol, timeframe, limit=100):
+            with lock:
+                state['inflight'] += 1
+                state['peak'] = max(state['peak'], state['inflight'])
+            time.sleep(0.02)
+            with lock:
+                state['inflight'] -= 1
+            return pd.DataFrame()
+
+        provider.fetch_ohlcv = fake_fetch
+        reqs = [(f'S{i}/USDT', '1h', 5) for i in range(10)]
+        provider.fetch_ohlcv_batch(reqs, max_concurrency=3)
+
+        assert 1 < state['peak'] <= 3
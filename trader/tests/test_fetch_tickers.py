@@ -0,0 +1,51 @@
+"""
+Test: monitor_positions 的批次 ticker
+
+- 行情串流有新鮮價的標的不打 REST，其餘合併成一次 fetch_tickers
+- 合約 unified symbol（BTC/USDT:USDT）對回 bot 的寫法
+- 批次失敗 / 缺漏 → 結果不含該標的，由呼叫端逐一 fetch_ticker
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+
+class TestFetchTickers:
+
+    def test_single_batch_call(self, mock_bot):
+        mock_bot.exchange.fetch_tickers = MagicMock(return_value={
+            'BTC/USDT:USDT': {'last': 50000.0},
+            'ETH/USDT:USDT': {'last': 3000.0},
+        })
+
+        tickers = mock_bot.fetch_tickers(['BTC/USDT', 'ETH/USDT'])
+
+        mock_bot.exchange.fetch_tickers.assert_called_once_with(['BTC/USDT', 'ETH/USDT'])
+        assert tickers['BTC/USDT']['last'] == 50000.0
+        assert tickers['ETH/USDT']['last'] == 3000.0
+
+    def test_stream_prices_skip_rest(self, mock_bot):
+        mock_bot.market_cache = MagicMock()
+        mock_bot.market_cache.last_price.side_effect = lambda s: 123.0 if s == 'BTC/USDT' else None
+        mock_bot.exchange.fetch_tickers = MagicMock(return_value={'ETH/USDT': {'last': 3000.0}})
+
+        tickers = mock_bot.fetch_tickers(['BTC/USDT', 'ETH/USDT'])
+
+        mock_bot.exchange.fetch_tickers.assert_called_once_with(['ETH/USDT'])
+        assert tickers['BTC/USDT']['last'] == 123.0
+
+    def test_batch_failure_returns_partial(self, mock_bot):
+        mock_bot.exchange.fetch_tickers = MagicMock(side_effect=RuntimeError('boom'))
+        assert mock_bot.fetch_tickers(['BTC/USDT']) == {}
+
+    def test_missing_symbol_left_out(self, mock_bot):
+        mock_bot.exchange.fetch_tickers = MagicMock(return_value={'BTC/USDT': {'last': None}})
+        assert mock_bot.fetch_tickers(['BTC/USDT']) == {}
+
+    def test_empty_symbols_no_request(self, mock_bot):
+        mock_bot.exchange.fetch_tickers = MagicMock()
+        assert mock_bot.fetch_tickers([]) == {}
+        mock_bot.exchange.fetch_tickers.assert_not_called()
@@ -0,0 +1,105 @@
+"""
+IndicatorCache 增量指標 unit tests
+
+同一根 K 線形成期間只更新最後一列，結果需與完整 calculate_indicators 一致；
+視窗滑動 / 前段資料變動時回到完整重算。
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trader.indicators.technical import IndicatorCache, TechnicalAnalysis
+
+COLUMNS = ['ema_trend', 'vol_ma', 'atr', 'ema_fast', 'ema_slow', 'adx']
+
+
+def _make_ohlcv(rows: int = 120, seed: int = 3, start: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, rows + start))[start:]
+    return pd.DataFrame({
+        'timestamp': pd.to_datetime(np.arange(start, start + rows) * 3_600_000, unit='ms'),
+        'open': close + rng.normal(0, 0.3, rows),
+        'high': close + rng.uniform(0.1, 2.0, rows),
+        'low': close - rng.uniform(0.1, 2.0, rows),
+        'close': close,
+        'volume': rng.uniform(500, 1500, rows),
+    })
+
+
+def _tick(df: pd.DataFrame, close: float) -> pd.DataFrame:
+    """同一根 K 線的下一次快照：只有最後一列變動"""
+    df = df[['timestamp', 'open', 'high', 'low', 'close', 'volume']].copy()
+    df.loc[df.index[-1], ['close', 'high', 'volume']] = [close, max(close, df['high'].iloc[-1]), 2000.0]
+    return df
+
+
+def _assert_matches_full(cached: pd.DataFrame, raw: pd.DataFrame):
+    full = TechnicalAnalysis.calculate_indicators(raw.copy())
+    for col in COLUMNS:
+        np.testing.assert_allclose(cached[col].to_numpy(), full[col].to_numpy(), rtol=1e-9, equal_nan=True)
+
+
+class TestIndicatorCache:
+
+    def test_last_row_update_matches_full(self):
+        cache = IndicatorCache()
+        base = _make_ohlcv()
+        cache.calculate('k', base.copy())
+
+        snapshot = _tick(base, base['close'].iloc[-1] + 1.5)
+        with patch.object(TechnicalAnalysis, 'calculate_indicators', wraps=TechnicalAnalysis.calculate_indicators) as full:
+            cached = cache.calculate('k', snapshot.copy())
+        full.assert_not_called()
+        _assert_matches_full(cached, snapshot)
+
+    def test_repeated_ticks_stay_consistent(self):
+        cache = IndicatorCache()
+        base = _make_ohlcv()
+        cache.calculate('k', base.copy())
+        for price in (99.0, 101.0, 97.5):
+            snapshot = _tick(base, price)
+            cached = cache.calculate('k', snapshot.copy())
+        _assert_matches_full(cached, snapshot)
+
+    def test_window_shift_recomputes(self):
+        cache = IndicatorCache()
+        cache.calculate('k', _make_ohlcv(start=0))
+        shifted = _make_ohlcv(start=1)
+        with patch.object(TechnicalAnalysis, 'calculate_indicators', wraps=TechnicalAnalysis.calculate_indicators) as full:
+            cache.calculate('k', shifted.copy())
+        full.assert_called_once()
+
+    def test_changed_history_recomputes(self):
+        cache = IndicatorCache()
+        base = _make_ohlcv()
+        cache.calculate('k', base.copy())
+        revised = base.copy()
+        revised.loc[10, 'close'] += 1.0
+        with patch.object(TechnicalAnalysis, 'calculate_indicators', wraps=TechnicalAnalysis.calculate_indicators) as full:
+            cache.calculate('k', revised.copy())
+        full.assert_called_once()
+
+    def test_caller_mutation_does_not_leak(self):
+        cache = IndicatorCache()
+        base = _make_ohlcv()
+        cache.calculate('k', base.copy())
+        first = cache.calculate('k', _tick(base, 100.0))
+        first.loc[:, 'atr'] = 0.0
+        second = cache.calculate('k', _tick(base, 100.0))
+        assert second['atr'].iloc[-1] > 0
+
+    def test_lru_bound(self):
+        cache = IndicatorCache(maxsize=2)
+        df = _make_ohlcv()
+        for key in ('a', 'b', 'c'):
+            cache.calculate(key, df.copy())
+        assert list(cache._entries) == ['b', 'c']
+
+    @pytest.mark.parametrize('rows', [10, 0])
+    def test_short_frames_passthrough(self, rows):
+        df = _make_ohlcv(rows=max(rows, 1)).iloc[:rows]
+        out = IndicatorCache().calculate('k', df)
+        assert 'atr' not in out.columns
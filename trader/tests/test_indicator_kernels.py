@@ -0,0 +1,178 @@
+"""
+Numba 指標 kernel unit tests
+
+對照 pandas 參考實作，確認 kernel 數值一致；
+並以 subprocess 驗證 numba 缺席時的 no-op fallback 可正常運作。
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trader.indicators.kernels import adx_nb, swing_pivots_nb
+from trader.indicators.technical import _adx, TechnicalAnalysis
+from trader.config import Config
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+
+
+def _make_ohlc(rows: int = 300, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, rows))
+    high = close + rng.uniform(0.1, 2.0, rows)
+    low = close - rng.uniform(0.1, 2.0, rows)
+    return pd.DataFrame({'high': high, 'low': low, 'close': close})
+
+
+def _f32(df: pd.DataFrame, col: str) -> np.ndarray:
+    return df[col].to_numpy(dtype=np.float32)
+
+
+def _wilder_reference(df: pd.DataFrame, n: int) -> pd.Series:
+    """逐筆 Python 版 Wilder ADX（教科書定義）"""
+    h, l, c = df['high'].values, df['low'].values, df['close'].values
+    size = len(df)
+    out = np.full(size, np.nan)
+    tr_s = pdm_s = mdm_s = 0.0
+    dxs = []
+    adx = None
+    for i in range(1, size):
+        tr = max(h[i] - l[i], abs(h[i] - c[i - 1]), abs(l[i] - c[i - 1]))
+        up, down = h[i] - h[i - 1], l[i - 1] - l[i]
+        pdm = up if up > down and up > 0 else 0.0
+        mdm = down if down > up and down > 0 else 0.0
+        if i <= n:
+            tr_s += tr
+            pdm_s += pdm
+            mdm_s += mdm
+            if i < n:
+                continue
+        else:
+            tr_s = tr_s - tr_s / n + tr
+            pdm_s = pdm_s - pdm_s / n + pdm
+            mdm_s = mdm_s - mdm_s / n + mdm
+        pdi, mdi = 100 * pdm_s / tr_s, 100 * mdm_s / tr_s
+        dx = 100 * abs(pdi - mdi) / (pdi + mdi)
+        if adx is None:
+            dxs.append(dx)
+            if len(dxs) == n:
+                adx = sum(dxs) / n
+                out[i] = adx
+        else:
+            adx = (adx * (n - 1) + dx) / n
+            out[i] = adx
+    return pd.Series(out)
+
+
+class TestADXKernel:
+    """Wilder ADX kernel"""
+
+    def test_matches_reference(self):
+        df = _make_ohlc()
+        adx, _, _ = adx_nb(_f32(df, 'high'), _f32(df, 'low'), _f32(df, 'close'), 14)
+        ref = _wilder_reference(df, 14)
+        np.testing.assert_allclose(adx, ref.values, rtol=1e-4, equal_nan=True)
+
+    def test_warmup_is_nan(self):
+        df = _make_ohlc(rows=60)
+        adx, plus_di, _ = adx_nb(_f32(df, 'high'), _f32(df, 'low'), _f32(df, 'close'), 14)
+        assert np.isnan(adx[:27]).all()
+        assert not np.isnan(adx[27:]).any()
+        assert np.isnan(plus_di[:14]).all()
+
+    def test_short_input_all_nan(self):
+        df = _make_ohlc(rows=20)
+        adx, _, _ = adx_nb(_f32(df, 'high'), _f32(df, 'low'), _f32(df, 'close'), 14)
+        assert np.isnan(adx).all()
+
+    def test_float32_output(self):
+        df = _make_ohlc()
+        adx, plus_di, minus_di = adx_nb(_f32(df, 'high'), _f32(df, 'low'), _f32(df, 'close'), 14)
+        assert adx.dtype == np.float32
+        assert plus_di.dtype == np.float32 and minus_di.dtype == np.float32
+
+    def test_adx_frame_columns(self):
+        df = _make_ohlc()
+        result = _adx(df['high'], df['low'], df['close'], length=14)
+        assert list(result.columns) == ['ADX_14', 'DMP_14', 'DMN_14']
+        assert result.index.equals(df.index)
+
+    def test_extract_adx_series_in_range(self):
+        df = _make_ohlc()
+        series = TechnicalAnalysis.extract_adx_series(df).dropna()
+        assert len(series) > 0
+        assert ((series >= 0) & (series <= 100)).all()
+
+
+def _pivot_reference(values: np.ndarray, left: int, right: int, lower: bool) -> list:
+    """逐筆 Python 版 pivot（舊 find_swing_points 迴圈）"""
+    out = []
+    for i in range(left, len(values) - right):
+        neighbours = list(values[i - left:i]) + list(values[i + 1:i + right + 1])
+        if lower and all(not (x <= values[i]) for x in neighbours):
+            out.append(i)
+        if not lower and all(not (x >= values[i]) for x in neighbours):
+            out.append(i)
+    return out
+
+
+class TestSwingPivotKernel:
+    """Swing point pivot kernel"""
+
+    @pytest.mark.parametrize('left,right', [(5, 2), (7, 2), (3, 3)])
+    def test_matches_reference(self, left, right):
+        df = _make_ohlc(rows=200, seed=11)
+        high, low = df['high'].to_numpy(), df['low'].to_numpy()
+        is_low, is_high = swing_pivots_nb(high, low, left, right)
+        assert np.flatnonzero(is_low).tolist() == _pivot_reference(low, left, right, lower=True)
+        assert np.flatnonzero(is_high).tolist() == _pivot_reference(high, left, right, lower=False)
+
+    def test_equal_neighbour_not_pivot(self):
+        low = np.array([5.0, 4.0, 3.0, 3.0, 4.0, 5.0])
+        is_low, _ = swing_pivots_nb(low + 1, low, 2, 2)
+        assert not is_low.any()
+
+    def test_short_input(self):
+        is_low, is_high = swing_pivots_nb(np.ones(3), np.ones(3), 5, 2)
+        assert not is_low.any() and not is_high.any()
+
+
+def test_fallback_without_numba():
+    """numba 不可用時 kernel 以純 Python 執行，結果一致"""
+    code = (
+        "import sys; sys.modules['numba'] = None\n"
+        "import numpy as np\n"
+        "from trader.indicators import kernels\n"
+        "assert not kernels.NUMBA_AVAILABLE\n"
+        "h = np.linspace(10, 20, 60, dtype=np.float32); l = h - 1; c = h - 0.5\n"
+        "adx, _, _ = kernels.adx_nb(h, l, c, 14)\n"
+        "assert np.isfinite(adx[-1])\n"
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', code], cwd=REPO_ROOT,
+        capture_output=True, text=True, timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+
+
+class TestVolMa:
+    """vol_ma 為純 SMA：0 量區間照實為 0，不沿用前值（偵測器各自以 vol_ma > 0 防護）"""
+
+    def test_zero_volume_window_not_forward_filled(self):
+        rng = np.random.default_rng(1)
+        rows = 120
+        close = 100 + np.cumsum(rng.normal(0, 1, rows))
+        volume = rng.uniform(500, 1500, rows)
+        volume[60:90] = 0.0  # 停牌區間 → SMA 為 0
+        df = pd.DataFrame({
+            'open': close, 'high': close + 1, 'low': close - 1,
+            'close': close, 'volume': volume,
+        })
+        out = TechnicalAnalysis.calculate_indicators(df)
+        expected = pd.Series(volume).rolling(Config.VOLUME_MA_PERIOD).mean()
+        np.testing.assert_allclose(out['vol_ma'].to_numpy(), expected.to_numpy(), equal_nan=True)
+        assert out['vol_ma'].iloc[85] == 0.0
@@ -209,6 +209,21 @@ class TestFullPathNormal:
         assert 'place_stop' in actions
         assert 'close_position' in actions
 
+    def test_monitor_position_lines_single_record(self, integration_bot, caplog):
+        """各持倉的價格 / PnL 行合併成一筆 debug record"""
+        bot, engine, fi = integration_bot
+        for symbol in ('BTC/USDT', 'ETH/USDT'):
+            pm = _inject_pm_into_bot(bot, symbol=symbol)
+            pm.monitor = MagicMock(return_value={'action': 'HOLD', 'reason': 'HOLD', 'new_sl': None})
+        bot.data_provider.fetch_ohlcv = MagicMock(return_value=_make_ohlcv_df(50000.0))
+
+        with caplog.at_level('DEBUG', logger='trader.bot'):
+            bot.monitor_positions()
+
+        records = [r.getMessage() for r in caplog.records if 'PnL=' in r.getMessage()]
+        assert len(records) == 1
+        assert 'BTC/USDT' in records[0] and 'ETH/USDT' in records[0]
+
 
 # ══════════════════════════════════════════════
 # 場景 B：故障注入
@@ -0,0 +1,271 @@
+"""
+Test: TradingBotV6 主循環的排程
+
+- 循環間等待：信號框架 K 線收盤推播提前喚醒，無串流時固定間隔
+- 以 monotonic 截止時間排程，週期不隨工作耗時漂移
+- 各階段各自攔錯；掃描失敗只退避掃描（跳過輪數倍增），同步 / 監控失敗時整個循環指數退避（含上限與 jitter）
+- SIGHUP 配置熱重載於兩輪之間套用；SIGUSR1 刷新請求提前喚醒循環間等待
+"""
+
+import faulthandler
+import signal
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from trader.bot import TradingBotV6
+from trader.config import Config
+
+
+def _waited(event: MagicMock) -> float:
+    """分段等待的總秒數"""
+    return sum(call.args[0] for call in event.wait.call_args_list)
+
+
+class TestWaitNextCycle:
+
+    def test_bar_close_wakes_early(self, mock_bot, monkeypatch):
+        monkeypatch.setattr(Config, 'CHECK_INTERVAL', 30)
+        mock_bot.market_cache = MagicMock(connected=True)
+        mock_bot.market_cache.bar_closed.wait.return_value = True
+
+        mock_bot._wait_next_cycle()
+
+        mock_bot.market_cache.bar_closed.wait.assert_called_once_with(TradingBotV6._REFRESH_POLL_SECONDS)
+        mock_bot.market_cache.bar_closed.clear.assert_called_once()
+
+    def test_without_stream_sleeps_interval(self, mock_bot, monkeypatch):
+        monkeypatch.setattr(Config, 'CHECK_INTERVAL', 30)
+        mock_bot._wake = MagicMock()
+        mock_bot._wake.wait.return_value = False
+        mock_bot.market_cache = None
+
+        mock_bot._wait_next_cycle()
+
+        assert _waited(mock_bot._wake) == pytest.approx(30)
+
+
+class TestDeadlineScheduling:
+
+    def test_work_time_subtracted_from_wait(self, mock_bot, monkeypatch):
+        monkeypatch.setattr(Config, 'CHECK_INTERVAL', 30)
+        monkeypatch.setattr('trader.bot.time.monotonic', lambda: 1010.0)
+        mock_bot._wake = MagicMock()
+        mock_bot._wake.wait.return_value = False
+        mock_bot._cycle_started_at = 1000.0   # 本輪工作耗時 10 秒
+
+        mock_bot._wait_next_cycle()
+
+        assert _waited(mock_bot._wake) == pytest.approx(20.0)
+        assert mock_bot._cycle_started_at == 1030.0
+
+    def test_overrun_realigns_without_catch_up(self, mock_bot, monkeypatch):
+        monkeypatch.setattr(Config, 'CHECK_INTERVAL', 30)
+        monkeypatch.setattr('trader.bot.time.monotonic', lambda: 1100.0)
+        mock_bot._wake = MagicMock()
+        mock_bot._wake.wait.return_value = False
+        mock_bot._cycle_started_at = 1000.0   # 落後超過一個週期
+
+        mock_bot._wait_next_cycle()
+
+        mock_bot._wake.wait.assert_called_once_with(0.0)
+        assert mock_bot._cycle_started_at == 1100.0
+
+
+class TestRefreshRequest:
+
+    def test_refresh_wakes_wait_without_stream(self, mock_bot, monkeypatch):
+        monkeypatch.setattr(Config, 'CHECK_INTERVAL', 30)
+        mock_bot.market_cache = None
+        mock_bot.request_refresh()
+
+        started = time.monotonic()
+        mock_bot._wait_next_cycle()
+
+        assert time.monotonic() - started < 1.0
+        assert not mock_bot._wake.is_set()
+        assert mock_bot._refresh_requested is False
+
+    def test_refresh_wakes_stream_wait(self, mock_bot, monkeypatch):
+        monkeypatch.setattr(Config, 'CHECK_INTERVAL', 30)
+        mock_bot.market_cache = MagicMock(connected=True, bar_closed=threading.Event())
+
+        started = time.monotonic()
+        threading.Timer(0.1, mock_bot.request_refresh).start()
+        mock_bot._wait_next_cycle()
+
+        assert time.monotonic() - started < 2.0
+        assert mock_bot._refresh_requested is False
+
+    @pytest.mark.skipif(not hasattr(signal, 'SIGUSR1'), reason='平台無 SIGUSR1')
+    def test_signal_during_event_clear_does_not_deadlock(self, mock_bot, monkeypatch):
+        """SIGUSR1 在主執行緒持有 _wake 的 Condition 鎖時到達：handler 不得再取同一把鎖"""
+        monkeypatch.setattr(Config, 'CHECK_INTERVAL', 30)
+        mock_bot.market_cache = None
+
+        class _SignalDuringClear(threading.Event):
+            def clear(self):
+                with self._cond:
+                    signal.raise_signal(signal.SIGUSR1)   # handler 在此同步執行
+                    self._flag = False
+
+        mock_bot._wake = _SignalDuringClear()
+        mock_bot._wake.set()
+        handled = []
+
+        def handler(*_):
+            handled.append(True)
+            mock_bot.request_refresh()
+
+        previous = signal.signal(signal.SIGUSR1, handler)
+        faulthandler.dump_traceback_later(10, exit=True)   # 回歸成死鎖時終止而不是卡住整個測試
+        try:
+            mock_bot._wait_next_cycle()
+        finally:
+            faulthandler.cancel_dump_traceback_later()
+            signal.signal(signal.SIGUSR1, previous)
+
+        assert handled == [True]
+        assert not mock_bot._wake.is_set()
+        assert mock_bot._refresh_requested is False
+
+
+class TestBackoffWait:
+
+    def test_refresh_ends_backoff(self, mock_bot):
+        mock_bot.market_cache = None
+        mock_bot.request_refresh()
+
+        started = time.monotonic()
+        mock_bot._backoff_wait(30)
+
+        assert time.monotonic() - started < 1.0
+        assert not mock_bot._wake.is_set()
+        assert mock_bot._refresh_requested is False
+
+    def test_backoff_waits_full_delay_without_refresh(self, mock_bot):
+        mock_bot._wake = MagicMock()
+        mock_bot._wake.wait.return_value = False
+
+        mock_bot._backoff_wait(45.0)
+
+        assert _waited(mock_bot._wake) == pytest.approx(45.0)
+        mock_bot._wake.clear.assert_not_called()
+
+
+class TestPhaseContainment:
+
+    def test_run_phase_reports_failure(self, caplog):
+        def boom():
+            raise ValueError('bad frame')
+
+        assert TradingBotV6._run_phase(3, '掃描', boom) is False
+        assert TradingBotV6._run_phase(3, '監控', lambda: None) is True
+        assert 'ValueError: bad frame' in caplog.text
+
+    @staticmethod
+    def _loop_bot(mock_bot, monkeypatch, cycles: int):
+        """run() 跑 cycles 輪正常等待後以 KeyboardInterrupt 結束"""
+        monkeypatch.setattr(Config, 'USE_USER_STREAM', False)
+        monkeypatch.setattr(Config, 'USE_MARKET_STREAM', False)
+        monkeypatch.setattr(Config, 'V6_DRY_RUN', True)
+        mock_bot.startup_diagnostics = MagicMock(return_value=True)
+        mock_bot._adopt_ghost_positions = MagicMock()
+        mock_bot.telegram_handler = MagicMock()
+        mock_bot._sync_exchange_positions = MagicMock()
+        mock_bot.monitor_positions = MagicMock()
+        mock_bot._wait_next_cycle = MagicMock(side_effect=[None] * (cycles - 1) + [KeyboardInterrupt])
+        mock_bot._wake = MagicMock()
+        mock_bot._wake.wait.side_effect = KeyboardInterrupt   # 退避等待時結束循環
+        return mock_bot._wake.wait
+
+    def test_scan_failure_backs_off_scan_only(self, mock_bot, monkeypatch):
+        monkeypatch.setattr(Config, 'CHECK_INTERVAL', 60)
+        monkeypatch.setattr(Config, 'LOOP_ERROR_MAX_BACKOFF_SECONDS', 300)
+        sleep = self._loop_bot(mock_bot, monkeypatch, cycles=6)
+        mock_bot.scan_for_signals = MagicMock(side_effect=RuntimeError('scan down'))
+
+        mock_bot.run()
+
+        # 第 1 輪失敗 → 跳 1 輪；第 3 輪失敗 → 跳 2 輪；第 6 輪再掃
+        assert mock_bot.scan_for_signals.call_count == 3
+        assert mock_bot.monitor_positions.call_count == 6
+        assert mock_bot._wait_next_cycle.call_count == 6
+        sleep.assert_not_called()
+
+    def test_scan_recovery_resets_streak(self, mock_bot, monkeypatch):
+        monkeypatch.setattr(Config, 'CHECK_INTERVAL', 60)
+        self._loop_bot(mock_bot, monkeypatch, cycles=5)
+        mock_bot.scan_for_signals = MagicMock(side_effect=[RuntimeError('once'), None, None, None])
+
+        mock_bot.run()
+
+        assert mock_bot.scan_for_signals.call_count == 4   # 第 2 輪跳過，之後每輪都掃
+
+    def test_monitor_failure_backs_off_loop(self, mock_bot, monkeypatch):
+        sleep = self._loop_bot(mock_bot, monkeypatch, cycles=3)
+        mock_bot.scan_for_signals = MagicMock()
+        mock_bot.monitor_positions.side_effect = RuntimeError('exchange down')
+
+        mock_bot.run()
+
+        mock_bot._sync_exchange_positions.assert_called_once()
+        sleep.assert_called_once()
+
+    def test_scan_skip_cycles_capped(self, monkeypatch):
+        monkeypatch.setattr(Config, 'CHECK_INTERVAL', 60)
+        monkeypatch.setattr(Config, 'LOOP_ERROR_MAX_BACKOFF_SECONDS', 300)
+        assert [TradingBotV6._scan_skip_cycles(n) for n in range(5)] == [1, 2, 4, 5, 5]
+
+
+class TestErrorBackoff:
+
+    def test_doubles_and_caps_with_jitter(self, monkeypatch):
+        monkeypatch.setattr(Config, 'CHECK_INTERVAL', 60)
+        monkeypatch.setattr(Config, 'LOOP_ERROR_MAX_BACKOFF_SECONDS', 300)
+        monkeypatch.setattr('trader.bot.random.uniform', lambda a, b: 1.0)
+        assert [TradingBotV6._error_backoff(n) for n in range(5)] == [60, 120, 240, 300, 300]
+        assert TradingBotV6._error_backoff(10_000) == 300
+
+    def test_jitter_bounds(self, monkeypatch):
+        monkeypatch.setattr(Config, 'CHECK_INTERVAL', 60)
+        for _ in range(50):
+            assert 48 <= TradingBotV6._error_backoff(0) <= 72
+
+
+class TestConfigReload:
+
+    def test_reload_applied_once_between_cycles(self, mock_bot, monkeypatch):
+        load = MagicMock()
+        monkeypatch.setattr(Config, 'load_from_json', load)
+        mock_bot.request_config_reload('bot_config.json')
+
+        mock_bot._apply_config_reload()
+        mock_bot._apply_config_reload()
+
+        load.assert_called_once_with('bot_config.json', include_secrets=False)
+
+    def test_reload_cannot_turn_off_dry_run(self, mock_bot, monkeypatch):
+        monkeypatch.setattr(Config, 'V6_DRY_RUN', True)
+        monkeypatch.setattr(Config, 'load_from_json',
+                            MagicMock(side_effect=lambda *_, **__: setattr(Config, 'V6_DRY_RUN', False)))
+        mock_bot.request_config_reload('bot_config.json')
+
+        mock_bot._apply_config_reload()
+
+        Config.load_from_json.assert_called_once()
+        assert Config.V6_DRY_RUN is True
+
+    def test_reload_failure_keeps_running(self, mock_bot, monkeypatch):
+        monkeypatch.setattr(Config, 'load_from_json', MagicMock(side_effect=ValueError('bad ratio')))
+        mock_bot.request_config_reload('bot_config.json')
+
+        mock_bot._apply_config_reload()
+
+        assert mock_bot._config_reload_path is None
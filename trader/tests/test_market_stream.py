@@ -0,0 +1,189 @@
+"""
+Test: MarketDataCache（kline 推播維護的 K 線 / 最新價快取）
+
+- REST seed 後收到 seed 最後一根的推播才由快取組 DataFrame；筆數不足 / 最後一根過期 / 未連線 → miss
+- 訂閱生效前 seed 那根已收盤（第一則推播是下一根）→ 丟棄序列重新 seed
+- kline 推播：同一根覆寫、下一根追加、跳號丟棄序列
+- 最新價超過 MARKET_STREAM_PRICE_MAX_AGE_SECONDS → None
+- 斷線清空所有序列
+- MarketDataProvider 命中快取時不打 REST，miss 時 REST 結果 seed 回快取
+"""
+
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from trader.config import Config
+from trader.infrastructure.data_provider import MarketDataProvider
+from trader.infrastructure.market_stream import MarketDataCache, timeframe_to_ms
+
+HOUR_MS = 3_600_000
+
+
+def _current_hour_ms() -> int:
+    now_ms = int(time.time() * 1000)
+    return now_ms - now_ms % HOUR_MS
+
+
+def _klines(rows: int = 5):
+    """最後一根是目前這根 1H K 線"""
+    start = _current_hour_ms() - (rows - 1) * HOUR_MS
+    return [[start + i * HOUR_MS, 100.0 + i, 101.0 + i, 99.0 + i, 100.5 + i, 1000.0] for i in range(rows)]
+
+
+def _cache(connected: bool = True) -> MarketDataCache:
+    cache = MarketDataCache(sandbox=True)
+    cache._connected = connected
+    return cache
+
+
+def _kline_event(open_ms: int, close: float, symbol: str = 'BTCUSDT', tf: str = '1h') -> dict:
+    return {'e': 'kline', 's': symbol, 'k': {
+        't': open_ms, 'i': tf, 'o': '100', 'h': '110', 'l': '90', 'c': str(close), 'v': '5',
+    }}
+
+
+class TestTimeframe:
+
+    def test_conversion(self):
+        assert timeframe_to_ms('15m') == 15 * 60_000
+        assert timeframe_to_ms('4h') == 4 * HOUR_MS
+        assert timeframe_to_ms('1d') == 24 * HOUR_MS
+        assert timeframe_to_ms('1M') is None
+
+
+class TestCacheRead:
+
+    def test_seeded_series_served(self):
+        cache = _cache()
+        cache.seed('BTC/USDT', '1h', _klines(5), limit=5)
+        cache.handle_event(_kline_event(_current_hour_ms(), 104.5))   # seed 最後一根的推播 → 確認
+        df = cache.get_ohlcv('BTC/USDT', '1h', 3)
+        assert list(df.columns) == ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+        assert df['close'].tolist() == [102.5, 103.5, 104.5]
+        assert 'btcusdt@kline_1h' in cache._pending_sub
+
+    def test_unconfirmed_series_not_served(self):
+        cache = _cache()
+        cache.seed('BTC/USDT', '1h', _klines(5), limit=5)
+        assert cache.get_ohlcv('BTC/USDT', '1h', 5) is None
+
+    def test_reseed_before_confirmation_resubscribes(self):
+        cache = _cache()
+        cache.seed('BTC/USDT', '1h', _klines(5), limit=5)
+        cache._pending_sub.clear()                  # 已送出 SUBSCRIBE，但沒有推播進來
+        cache.seed('BTC/USDT', '1h', _klines(5), limit=5)
+        assert cache._pending_sub == {'btcusdt@kline_1h'}
+
+    def test_insufficient_rows_miss(self):
+        cache = _cache()
+        cache.seed('BTC/USDT', '1h', _klines(5), limit=5)
+        assert cache.get_ohlcv('BTC/USDT', '1h', 50) is None
+
+    def test_stale_last_bar_miss(self):
+        cache = _cache()
+        cache.seed('BTC/USDT', '1h', [[r[0] - HOUR_MS] + r[1:] for r in _klines(5)], limit=5)
+        assert cache.get_ohlcv('BTC/USDT', '1h', 5) is None
+
+    def test_not_connected_miss_and_no_seed(self):
+        cache = _cache(connected=False)
+        cache.seed('BTC/USDT', '1h', _klines(5), limit=5)
+        cache._connected = True
+        assert cache.get_ohlcv('BTC/USDT', '1h', 5) is None
+
+    def test_disconnect_clears(self):
+        cache = _cache()
+        cache.seed('BTC/USDT', '1h', _klines(5), limit=5)
+        cache._on_disconnect()
+        cache._connected = True
+        assert cache.get_ohlcv('BTC/USDT', '1h', 5) is None
+
+
+class TestKlineEvents:
+
+    def test_same_bar_overwritten(self):
+        cache = _cache()
+        cache.seed('BTC/USDT', '1h', _klines(5), limit=5)
+        cache.handle_event(_kline_event(_current_hour_ms(), 123.0))
+        df = cache.get_ohlcv('BTC/USDT', '1h', 5)
+        assert len(df) == 5
+        assert df['close'].iloc[-1] == 123.0
+
+    def test_next_bar_appended(self):
+        cache = _cache()
+        rows = [[r[0] - HOUR_MS] + r[1:] for r in _klines(5)]  # 最後一根是上一小時
+        cache.seed('BTC/USDT', '1h', rows, limit=5)
+        cache.handle_event(_kline_event(_current_hour_ms() - HOUR_MS, 104.5))   # 確認 seed 最後一根
+        cache.handle_event(_kline_event(_current_hour_ms(), 123.0))
+        df = cache.get_ohlcv('BTC/USDT', '1h', 5)
+        assert df['close'].iloc[-1] == 123.0
+        assert df['close'].iloc[-2] == 104.5   # maxlen=5，最舊一根被擠掉
+
+    def test_bar_closed_before_subscription_drops_series(self):
+        """seed 那根在訂閱生效前收盤：第一則推播已是下一根 → 不追加，丟棄序列重新 seed"""
+        cache = _cache()
+        rows = [[r[0] - HOUR_MS] + r[1:] for r in _klines(5)]  # REST 快照的最後一根是形成中的上一小時
+        cache.seed('BTC/USDT', '1h', rows, limit=5)
+        cache.handle_event(_kline_event(_current_hour_ms(), 123.0))
+        assert ('BTC/USDT', '1h') not in cache._series
+        assert cache.get_ohlcv('BTC/USDT', '1h', 5) is None
+
+    def test_gap_drops_series(self):
+        cache = _cache()
+        rows = [[r[0] - 2 * HOUR_MS] + r[1:] for r in _klines(5)]
+        cache.seed('BTC/USDT', '1h', rows, limit=5)
+        cache.handle_event(_kline_event(_current_hour_ms(), 123.0))
+        assert ('BTC/USDT', '1h') not in cache._series
+
+    def test_last_price(self, monkeypatch):
+        cache = _cache()
+        cache.seed('BTC/USDT', '1h', _klines(5), limit=5)
+        assert cache.last_price('BTC/USDT') is None
+        cache.handle_event(_kline_event(_current_hour_ms(), 123.0))
+        assert cache.last_price('BTC/USDT') == 123.0
+        monkeypatch.setattr(Config, 'MARKET_STREAM_PRICE_MAX_AGE_SECONDS', -1)
+        assert cache.last_price('BTC/USDT') is None
+
+    def test_idle_series_unsubscribed(self, monkeypatch):
+        cache = _cache()
+        cache.seed('BTC/USDT', '1h', _klines(5), limit=5)
+        cache._pending_sub.clear()
+        monkeypatch.setattr(Config, 'MARKET_STREAM_IDLE_SECONDS', -1)
+        cache._evict_idle()
+        assert cache._pending_unsub == {'btcusdt@kline_1h'}
+        assert cache._series == {}
+
+    def test_signal_bar_close_sets_trigger(self):
+        cache = MarketDataCache(sandbox=True, trigger_timeframe='1h')
+        cache._connected = True
+        cache.seed('BTC/USDT', '1h', _klines(5), limit=5)
+        cache.seed('BTC/USDT', '4h', _klines(5), limit=5)
+
+        cache.handle_event(_kline_event(_current_hour_ms(), 123.0))
+        assert not cache.bar_closed.is_set()        # 形成中
+        closed_4h = _kline_event(_current_hour_ms(), 123.0, tf='4h')
+        closed_4h['k']['x'] = True
+        cache.handle_event(closed_4h)
+        assert not cache.bar_closed.is_set()        # 非觸發框架
+        closed = _kline_event(_current_hour_ms(), 123.0)
+        closed['k']['x'] = True
+        cache.handle_event(closed)
+        assert cache.bar_closed.is_set()
+
+
+class TestProviderIntegration:
+
+    def test_hit_skips_rest(self):
+        exchange = MagicMock()
+        exchange.fetch_ohlcv.return_value = _klines(5)
+        provider = MarketDataProvider(exchange, max_retry=1, retry_delay=0)
+        provider.market_cache = _cache()
+
+        provider.fetch_ohlcv('BTC/USDT', '1h', limit=5)   # miss → REST → seed
+        provider.market_cache.handle_event(_kline_event(_current_hour_ms(), 104.5))  # 訂閱生效
+        df = provider.fetch_ohlcv('BTC/USDT', '1h', limit=5)
+        assert exchange.fetch_ohlcv.call_count == 1
+        assert len(df) == 5
@@ -17,7 +17,7 @@ def enable_telegram():
 
 class TestNotifierEscape:
 
-    @patch('trader.infrastructure.notifier.requests.post')
+    @patch('trader.infrastructure.notifier._TELEGRAM_SESSION.post')
     def test_notify_warning_escapes_html(self, mock_post):
         mock_post.return_value = MagicMock(ok=True)
         msg = '<script>alert("xss")</script>&param=1'
@@ -27,7 +27,7 @@ class TestNotifierEscape:
         assert '&lt;script&gt;' in text
         assert '&amp;param=1' in text
 
-    @patch('trader.infrastructure.notifier.requests.post')
+    @patch('trader.infrastructure.notifier._TELEGRAM_SESSION.post')
     def test_notify_action_escapes_details(self, mock_post):
         mock_post.return_value = MagicMock(ok=True)
         TelegramNotifier.notify_action('BTCUSDT', 'test<action>', 100.0, '<b>hack</b>')
@@ -36,7 +36,7 @@ class TestNotifierEscape:
         assert '&lt;b&gt;hack&lt;/b&gt;' in text
         assert 'test&lt;action&gt;' in text
 
-    @patch('trader.infrastructure.notifier.requests.post')
+    @patch('trader.infrastructure.notifier._TELEGRAM_SESSION.post')
     def test_notify_signal_escapes_symbol(self, mock_post):
         mock_post.return_value = MagicMock(ok=True)
         details = {
@@ -62,7 +62,7 @@ class TestNotifierEscape:
         # 策略名稱
         assert 'V6 Pyramid' in text
 
-    @patch('trader.infrastructure.notifier.requests.post')
+    @patch('trader.infrastructure.notifier._TELEGRAM_SESSION.post')
     def test_notify_exit_escapes_reason(self, mock_post):
         mock_post.return_value = MagicMock(ok=True)
         details = {
@@ -78,7 +78,7 @@ class TestNotifierEscape:
         assert 'a&amp;b&lt;c&gt;' in text
 
     @patch('trader.infrastructure.notifier.logger')
-    @patch('trader.infrastructure.notifier.requests.post')
+    @patch('trader.infrastructure.notifier._TELEGRAM_SESSION.post')
     def test_send_message_logs_error_on_bad_status(self, mock_post, mock_logger):
         mock_resp = MagicMock()
         mock_resp.ok = False
@@ -88,3 +88,39 @@ class TestNotifierEscape:
         TelegramNotifier.send_message('test')
         mock_logger.error.assert_called_once()
         assert '400' in mock_logger.error.call_args[0][0]
+
+
+class TestDispatch:
+    """dispatch：背景執行緒送出，不阻塞呼叫端"""
+
+    def test_runs_in_background_thread(self):
+        import threading
+        done = threading.Event()
+        seen = {}
+
+        def notify(symbol, price):
+            seen['thread'] = threading.current_thread().name
+            seen['args'] = (symbol, price)
+            done.set()
+
+        TelegramNotifier.dispatch(notify, 'BTCUSDT', 100.0)
+        assert done.wait(2)
+        assert seen['args'] == ('BTCUSDT', 100.0)
+        assert seen['thread'].startswith('telegram')
+
+    def test_exception_swallowed(self):
+        import threading
+        done = threading.Event()
+
+        def boom():
+            raise RuntimeError('network down')
+
+        TelegramNotifier.dispatch(boom)
+        TelegramNotifier.dispatch(done.set)  # 單一 worker 依序執行：前一個失敗不影響後續
+        assert done.wait(2)
+
+    def test_disabled_skips(self, enable_telegram):
+        enable_telegram.TELEGRAM_ENABLED = False
+        notify = MagicMock()
+        TelegramNotifier.dispatch(notify, 'x')
+        notify.assert_not_called()
@@ -0,0 +1,152 @@
+"""
+Test: OrderExecutionEngine 硬止損更新
+
+- 優先原地修改（單一 PUT），成功時不 cancel + place
+- 交易所不支援修改 → fallback cancel + place，之後不再嘗試
+- 時鐘錯誤（-1021）、價格被拒等一般 400 只讓該筆 fallback，不視為不支援
+- 槓桿每個交易對只設一次（失敗或 Config.LEVERAGE 變更時重設）
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from trader.config import Config
+from trader.execution.order_engine import OrderExecutionEngine
+from trader.infrastructure.api_client import BinanceFuturesClient
+from trader.tests.conftest import make_pm
+
+
+def _response(status_code, body):
+    return MagicMock(status_code=status_code, json=lambda: body, text=str(body))
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    monkeypatch.setattr(Config, 'USE_HARD_STOP_LOSS', True)
+    precision = MagicMock()
+    precision.format_quantity.return_value = '0.010'
+    precision.format_price.side_effect = lambda symbol, price: f"{price:.2f}"
+    eng = OrderExecutionEngine(MagicMock(), MagicMock(), precision)
+    with patch.object(BinanceFuturesClient, 'is_enabled', return_value=True):
+        yield eng
+
+
+def _pm():
+    pm = make_pm(symbol='BTC/USDT', side='LONG', entry_price=50000.0, stop_loss=48000.0)
+    pm.stop_order_id = '111'
+    return pm
+
+
+class TestUpdateHardStopLoss:
+
+    def test_modify_in_place(self, engine):
+        engine.futures_client.signed_request.return_value = _response(200, {'algoId': 111})
+        pm = _pm()
+        engine.update_hard_stop_loss(pm, 49000.0)
+
+        method, endpoint, params = engine.futures_client.signed_request.call_args[0]
+        assert (method, endpoint) == ('PUT', '/fapi/v1/algoOrder')
+        assert params['triggerPrice'] == '49000.00'
+        assert engine.futures_client.signed_request.call_count == 1
+        assert pm.stop_order_id == '111'
+
+    def test_unsupported_falls_back_and_is_remembered(self, engine):
+        engine.futures_client.signed_request.side_effect = [
+            _response(405, {}),                     # PUT 不支援
+            _response(200, {}),                     # DELETE
+            _response(200, {'algoId': 222}),        # POST
+            _response(200, {}),                     # 第二次：直接 DELETE
+            _response(200, {'algoId': 333}),        # POST
+        ]
+        pm = _pm()
+        engine.update_hard_stop_loss(pm, 49000.0)
+        assert pm.stop_order_id == '222'
+
+        engine.update_hard_stop_loss(pm, 49500.0)
+        methods = [c[0][0] for c in engine.futures_client.signed_request.call_args_list]
+        assert methods == ['PUT', 'DELETE', 'POST', 'DELETE', 'POST']
+        assert pm.stop_order_id == '333'
+
+    def test_timestamp_error_not_treated_as_unsupported(self, engine):
+        engine.futures_client.signed_request.side_effect = [
+            _response(400, {'code': -1021}),
+            _response(200, {}),
+            _response(200, {'algoId': 222}),
+        ]
+        engine.update_hard_stop_loss(_pm(), 49000.0)
+        assert engine._modify_supported is True
+
+    def test_unsupported_error_code_disables_modify(self, engine):
+        engine.futures_client.signed_request.side_effect = [
+            _response(400, {'code': -1020, 'msg': 'This operation is not supported.'}),
+            _response(200, {}),
+            _response(200, {'algoId': 222}),
+        ]
+        engine.update_hard_stop_loss(_pm(), 49000.0)
+        assert engine._modify_supported is False
+
+    def test_price_rejection_keeps_modify_enabled(self, engine):
+        engine.futures_client.signed_request.side_effect = [
+            _response(400, {'code': -2021, 'msg': 'Order would immediately trigger.'}),
+            _response(200, {}),                     # 這一筆 fallback：DELETE
+            _response(200, {'algoId': 222}),        # POST
+            _response(200, {'algoId': 222}),        # 下一次仍先 PUT
+        ]
+        pm = _pm()
+        engine.update_hard_stop_loss(pm, 49000.0)
+        assert engine._modify_supported is True
+        assert pm.stop_order_id == '222'
+
+        engine.update_hard_stop_loss(pm, 49500.0)
+        methods = [c[0][0] for c in engine.futures_client.signed_request.call_args_list]
+        assert methods == ['PUT', 'DELETE', 'POST', 'PUT']
+
+    def test_no_existing_order_places_directly(self, engine):
+        engine.futures_client.signed_request.return_value = _response(200, {'algoId': 222})
+        pm = _pm()
+        pm.stop_order_id = None
+        engine.update_hard_stop_loss(pm, 49000.0)
+
+        methods = [c[0][0] for c in engine.futures_client.signed_request.call_args_list]
+        assert methods == ['POST']
+
+
+class TestLeverageOnce:
+
+    def _leverage_calls(self, engine):
+        return [c for c in engine.futures_client.signed_request_json.call_args_list
+                if c[0][1] == '/fapi/v1/leverage']
+
+    def test_set_once_per_symbol(self, engine):
+        engine.futures_client.signed_request_json.return_value = {'orderId': 1}
+        engine.create_order('BTC/USDT', 'BUY', 0.01)
+        engine.create_order('BTC/USDT', 'BUY', 0.01)
+        engine.create_order('ETH/USDT', 'BUY', 0.01)
+        assert len(self._leverage_calls(engine)) == 2
+
+    def test_preset_symbols_skipped(self, monkeypatch):
+        client = MagicMock()
+        client.signed_request_json.return_value = {'orderId': 1}
+        eng = OrderExecutionEngine(MagicMock(), client, MagicMock(), leveraged_symbols=['BTC/USDT'])
+        eng.create_order('BTC/USDT', 'BUY', 0.01)
+        assert [c[0][1] for c in client.signed_request_json.call_args_list] == ['/fapi/v1/order']
+
+    def test_failure_retried_next_order(self, engine):
+        engine.futures_client.signed_request_json.side_effect = [
+            {'error': 'timeout'}, {'orderId': 1}, {}, {'orderId': 2},
+        ]
+        engine.create_order('BTC/USDT', 'BUY', 0.01)
+        engine.create_order('BTC/USDT', 'BUY', 0.01)
+        assert len(self._leverage_calls(engine)) == 2
+
+    def test_reapplied_when_config_changes(self, engine, monkeypatch):
+        engine.futures_client.signed_request_json.return_value = {'orderId': 1}
+        engine.create_order('BTC/USDT', 'BUY', 0.01)
+        monkeypatch.setattr(Config, 'LEVERAGE', Config.LEVERAGE + 1)
+        engine.create_order('BTC/USDT', 'BUY', 0.01)
+        assert len(self._leverage_calls(engine)) == 2
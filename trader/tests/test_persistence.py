@@ -56,6 +56,38 @@ class TestPersistence:
         assert 'A' not in loaded
         assert loaded['B']['y'] == 2
 
+    def test_non_finite_floats_roundtrip(self):
+        """NaN / inf 原樣讀回為 float，不變成 None"""
+        import math
+        pp = PositionPersistence(TEST_PATH)
+        pp.save_positions({'A': {'entry_adx': float('nan'), 'tier_score': float('inf')}})
+        loaded = pp.load_positions()
+        assert math.isnan(loaded['A']['entry_adx'])
+        assert loaded['A']['tier_score'] == float('inf')
+
+    def test_unchanged_save_skips_write(self, monkeypatch):
+        pp = PositionPersistence(TEST_PATH)
+        pp.save_positions({'A': {'x': 1}})
+        replaced = []
+        real_replace = os.replace
+        monkeypatch.setattr(os, 'replace', lambda src, dst: (replaced.append(dst), real_replace(src, dst)))
+
+        assert pp.save_positions({'A': {'x': 1}}) == True
+        assert replaced == []
+
+        assert pp.save_positions({'A': {'x': 2}}) == True
+        assert replaced == [TEST_PATH]
+        assert pp.load_positions()['A']['x'] == 2
+
+    def test_unchanged_save_rewrites_missing_file(self):
+        pp = PositionPersistence(TEST_PATH)
+        pp.save_positions({'A': {'x': 1}})
+        os.remove(TEST_PATH)
+
+        pp.save_positions({'A': {'x': 1}})
+
+        assert pp.load_positions()['A']['x'] == 1
+
     def test_clear(self):
         pp = PositionPersistence(TEST_PATH)
         pp.save_positions({'X': {'v': 1}})
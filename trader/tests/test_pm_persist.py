@@ -45,3 +45,18 @@ class TestPhase1FieldPersist:
         pm2 = PositionManager.from_dict(data)
         assert pm2.entry_adx is None
         assert pm2.fakeout_depth_atr is None
+
+
+class TestEntryMonotonic:
+
+    def test_restored_entry_time_sets_monotonic_anchor(self):
+        """from_dict 還原 entry_time 後，monotonic 持倉時間應與牆鐘一致"""
+        import time
+        from datetime import datetime, timezone, timedelta
+
+        data = _make_pm().to_dict()
+        data['entry_time'] = (datetime.now(timezone.utc) - timedelta(hours=30)).isoformat()
+        pm = PositionManager.from_dict(data)
+
+        held_hours = (time.monotonic() - pm.entry_monotonic) / 3600
+        assert held_hours == pytest.approx(30.0, abs=0.01)
@@ -0,0 +1,191 @@
+"""
+Test: PrecisionHandler exchangeInfo 快取
+
+- 一次下載填滿所有交易對
+- 進程內快取（TTL 內第二個實例不再下載）
+- 磁碟快取（重啟時直接載入）
+- 查無精度 + 快取過期 → 補抓一次
+- 每個交易對的精度常數 / formatter 只計算一次
+- 精度來源（exchangeInfo / ccxt / DEFAULT）預先合併為單一 lookup
+- 觸發價依 PRICE_FILTER.tickSize 對齊與格式化
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from trader.config import Config
+from trader.risk.manager import PrecisionHandler
+
+
+EXCHANGE_INFO = {
+    'symbols': [
+        {'symbol': 'BTCUSDT', 'baseAsset': 'BTC', 'quoteAsset': 'USDT',
+         'quantityPrecision': 3, 'pricePrecision': 1},
+        {'symbol': 'DOGEUSDT', 'baseAsset': 'DOGE', 'quoteAsset': 'USDT',
+         'quantityPrecision': 0, 'pricePrecision': 6,
+         'filters': [{'filterType': 'PRICE_FILTER', 'tickSize': '0.000010'}]},
+        {'symbol': 'HALFUSDT', 'baseAsset': 'HALF', 'quoteAsset': 'USDT',
+         'quantityPrecision': 1, 'pricePrecision': 5,
+         'filters': [{'filterType': 'LOT_SIZE', 'stepSize': '0.1'},
+                     {'filterType': 'PRICE_FILTER', 'tickSize': '0.0005'}]},
+    ]
+}
+
+
+@pytest.fixture
+def session(tmp_path, monkeypatch):
+    """隔離類別快取 + 磁碟快取路徑，回傳 mock session"""
+    monkeypatch.setattr(PrecisionHandler, '_EXINFO', {'ts': 0.0, 'url': '', 'map': {}})
+    monkeypatch.setattr(PrecisionHandler, '_exinfo_last_attempt', 0.0)
+    monkeypatch.setattr(Config, 'EXCHANGE_INFO_CACHE_PATH', str(tmp_path / 'exinfo.json'))
+
+    mock_session = MagicMock()
+    mock_session.get.return_value = MagicMock(status_code=200, json=lambda: EXCHANGE_INFO)
+    with patch('trader.risk.manager.get_futures_session', return_value=mock_session):
+        yield mock_session
+
+
+def _handler() -> PrecisionHandler:
+    exchange = MagicMock()
+    exchange.load_markets.return_value = {}
+    return PrecisionHandler(exchange)
+
+
+class TestExchangeInfoCache:
+
+    def test_single_download_populates_all(self, session):
+        ph = _handler()
+        assert ph.get_precision('BTC/USDT') == 3
+        assert ph.get_precision('DOGE/USDT') == 0
+        assert ph.get_price_precision('DOGE/USDT') == 5
+        assert session.get.call_count == 1
+
+    def test_second_instance_reuses_process_cache(self, session):
+        _handler()
+        ph2 = _handler()
+        assert ph2.get_precision('BTC/USDT') == 3
+        assert session.get.call_count == 1
+
+    def test_disk_cache_used_after_restart(self, session, monkeypatch):
+        _handler()
+        # 模擬重啟：清空進程內快取
+        monkeypatch.setattr(PrecisionHandler, '_EXINFO', {'ts': 0.0, 'url': '', 'map': {}})
+        ph = _handler()
+        assert ph.get_precision('DOGE/USDT') == 0
+        assert session.get.call_count == 1
+
+    def test_expired_disk_cache_ignored(self, session, monkeypatch):
+        _handler()
+        path = Path(Config.EXCHANGE_INFO_CACHE_PATH)
+        cached = json.loads(path.read_text())
+        cached['ts'] = time.time() - Config.EXCHANGE_INFO_TTL_SECONDS - 1
+        path.write_text(json.dumps(cached))
+        monkeypatch.setattr(PrecisionHandler, '_EXINFO', {'ts': 0.0, 'url': '', 'map': {}})
+
+        _handler()
+        assert session.get.call_count == 2
+
+    def test_miss_refreshes_when_stale(self, session, monkeypatch):
+        ph = _handler()
+        PrecisionHandler._EXINFO['ts'] = time.time() - Config.EXCHANGE_INFO_TTL_SECONDS - 1
+        Path(Config.EXCHANGE_INFO_CACHE_PATH).unlink()
+        monkeypatch.setattr(PrecisionHandler, '_exinfo_last_attempt', 0.0)
+
+        ph.get_precision('NEW/USDT')
+        assert session.get.call_count == 2
+
+    def test_miss_not_refreshed_when_fresh(self, session):
+        ph = _handler()
+        ph.get_precision('NEW/USDT')
+        assert session.get.call_count == 1
+
+
+class TestPrecisionEntryCache:
+
+    def test_entry_computed_once(self, session):
+        ph = _handler()
+        with patch.object(ph, 'get_precision', wraps=ph.get_precision) as get:
+            ph.format_quantity('BTC/USDT', 0.0123456)
+            ph.round_amount('BTC/USDT', 0.0123456)
+            ph.round_amount_up('BTC/USDT', 0.0123456, 50000.0)
+        assert get.call_count == 1
+
+    def test_rounding_and_format(self, session):
+        ph = _handler()
+        assert ph.format_quantity('BTC/USDT', 0.0123456) == '0.012'
+        assert ph.format_quantity('DOGE/USDT', 123.9) == '123'
+        assert ph.round_amount('BTC/USDT', 0.0129) == 0.012
+        assert ph.round_amount_up('BTC/USDT', 0.0121, 50000.0) == 0.013
+
+    def test_cleared_on_exchange_info_reload(self, session):
+        ph = _handler()
+        ph.format_quantity('BTC/USDT', 1.0)
+        ph._apply_exchange_info('x', {'BTC/USDT': {'quantity': 1, 'price': 1}}, time.time())
+        assert ph.format_quantity('BTC/USDT', 1.234) == '1.2'
+
+    def test_round_amount_just_below_step_rounds_down(self, session, monkeypatch):
+        ph = _handler()
+        assert ph.round_amount('DOGE/USDT', 4.9999999995) == 4.0
+        assert ph.round_amount('BTC/USDT', 0.0129999995) == 0.012
+        assert ph.round_amount('BTC/USDT', 0.013) == 0.013
+        monkeypatch.setattr(Config, 'STRICT_DECIMAL_ROUNDING', True)
+        assert ph.round_amount('DOGE/USDT', 4.9999999995) == 4.0
+
+    def test_round_amount_float_matches_decimal(self, session, monkeypatch):
+        ph = _handler()
+        amounts = [0.29, 0.0129, 1.1, 0.0005, 12.3456789, 0.3, 2.675, 1e-4, 0.0129999995, 4.9999999995]
+        fast = [ph.round_amount('BTC/USDT', a) for a in amounts]
+        monkeypatch.setattr(Config, 'STRICT_DECIMAL_ROUNDING', True)
+        strict = [ph.round_amount('BTC/USDT', a) for a in amounts]
+        assert fast == strict
+
+
+class TestPrecisionLookup:
+
+    def test_sources_merged_by_priority(self, session):
+        exchange = MagicMock()
+        exchange.load_markets.return_value = {
+            'BTC/USDT': {'precision': {'amount': 5}},      # exchangeInfo 優先 → 3
+            'XRP/USDT': {'precision': {'amount': 0.1}},    # 步長 → 1 位小數
+            'ADA/USDT': {'precision': {'amount': None}},   # 無效 → DEFAULT 0
+        }
+        ph = PrecisionHandler(exchange)
+
+        assert ph.get_precision('BTC/USDT') == 3
+        assert ph.get_precision('XRP/USDT') == 1
+        assert ph.get_precision('ADA/USDT') == 0
+        assert ph.get_precision('UNKNOWN/USDT') == 3
+
+    def test_failed_markets_keep_defaults(self, session):
+        exchange = MagicMock()
+        exchange.load_markets.side_effect = RuntimeError('down')
+        ph = PrecisionHandler(exchange)
+        assert ph.get_precision('LINK/USDT') == 2
+
+
+class TestFormatPrice:
+
+    def test_tick_size_overrides_price_precision(self, session):
+        ph = _handler()
+        assert ph.get_price_precision('DOGE/USDT') == 5
+        assert ph.get_price_precision('HALF/USDT') == 4
+
+    def test_quantized_to_tick(self, session):
+        ph = _handler()
+        assert ph.format_price('DOGE/USDT', 0.123456789) == '0.12346'
+        assert ph.format_price('HALF/USDT', 1.23471) == '1.2345'
+        assert ph.format_price('HALF/USDT', 1.23480) == '1.2350'
+
+    def test_falls_back_to_price_precision(self, session):
+        ph = _handler()
+        # exchangeInfo 沒有 PRICE_FILTER → pricePrecision
+        assert ph.format_price('BTC/USDT', 50123.456) == '50123.5'
+        # 完全未知 → 預設 2 位
+        assert ph.format_price('UNKNOWN/USDT', 1.23456) == '1.23'
@@ -228,3 +228,28 @@ class TestStage3ProportionalScaling:
         # swing_stop=3000 高於 avg_entry(~2974) → SHORT 不 in profit
         s3_size = pm.calculate_stage3_size(entry_price=2800.0, swing_stop=3000.0)
         assert s3_size > 0, "SHORT Stage 3 proportional scaling should not zero out"
+
+
+class TestTotalOpenRisk:
+    """RiskManager.total_open_risk 向量化總風險"""
+
+    def _pm(self, side, entry, sl, size):
+        from trader.tests.conftest import make_pm
+        return make_pm(symbol='BTC/USDT', side=side, entry_price=entry, stop_loss=sl, position_size=size)
+
+    def test_matches_per_position_sum(self):
+        from trader.risk.manager import RiskManager
+        positions = [
+            self._pm('LONG', 100.0, 95.0, 2.0),    # 10
+            self._pm('SHORT', 50.0, 52.0, 3.0),    # 6
+            self._pm('LONG', 100.0, 101.0, 5.0),   # 鎖利 → 0
+        ]
+        closed = self._pm('LONG', 100.0, 90.0, 10.0)
+        closed.is_closed = True
+        positions.append(closed)
+
+        assert RiskManager.total_open_risk(positions) == pytest.approx(16.0)
+
+    def test_empty(self):
+        from trader.risk.manager import RiskManager
+        assert RiskManager.total_open_risk([]) == 0.0
@@ -233,3 +233,20 @@ class TestSymbolLossCooldown:
         # VVV/USDT 不受影響
         result = db.get_last_loss_exit_time('VVV/USDT')
         assert result is None
+
+    def test_scan_logs_cooldowns_in_one_line(self, mock_bot, caplog):
+        """多個標的虧損冷卻 → 每輪只輸出一行彙總"""
+        recent = (datetime.now(timezone.utc) - timedelta(hours=2)).isoformat()
+        mock_bot.perf_db.get_last_loss_exit_time = MagicMock(return_value=recent)
+        mock_bot.data_provider.fetch_ohlcv_batch = MagicMock(return_value={})
+
+        with patch.object(Config, 'USE_SCANNER_SYMBOLS', False), \
+             patch.object(Config, 'SYMBOLS', ['ETH/USDT', 'SOL/USDT']), \
+             patch.object(Config, 'SYMBOL_LOSS_COOLDOWN_HOURS', 24), \
+             caplog.at_level('INFO', logger='trader.bot'):
+            mock_bot.scan_for_signals()
+
+        lines = [r.getMessage() for r in caplog.records if '虧損冷卻' in r.getMessage()]
+        assert len(lines) == 1
+        assert 'ETH/USDT(2.0h)' in lines[0] and 'SOL/USDT(2.0h)' in lines[0]
+        mock_bot.data_provider.fetch_ohlcv_batch.assert_not_called()
@@ -0,0 +1,132 @@
+"""
+Test: scan_for_signals 的 K 線批次預抓
+
+- 每個候選標的的 trend / signal / mtf 一次併入同一批 fetch_ohlcv_batch
+- BTC 趨勢過濾開啟時 BTC 1D 也在同一批，_check_btc_trend 使用預抓結果不再 fetch
+- 啟動診斷的各時間框架同樣併成一批，帳戶查詢在背景與之重疊
+"""
+
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from trader.bot import TradingBotV6
+from trader.config import Config
+
+
+def _batch(requests, max_concurrency=8):
+    return {req: pd.DataFrame({'close': np.linspace(90000, 100000, req[2])}) for req in requests}
+
+
+class TestPrefetchScanData:
+
+    def test_single_batch_includes_btc(self, mock_bot, monkeypatch):
+        monkeypatch.setattr(Config, 'BTC_TREND_FILTER_ENABLED', True)
+        monkeypatch.setattr(Config, 'ENABLE_MTF_CONFIRMATION', True)
+        mock_bot.data_provider.fetch_ohlcv_batch = MagicMock(side_effect=_batch)
+
+        frames, btc_df = mock_bot._prefetch_scan_data(['ETH/USDT', 'SOL/USDT'])
+
+        mock_bot.data_provider.fetch_ohlcv_batch.assert_called_once()
+        requests = mock_bot.data_provider.fetch_ohlcv_batch.call_args[0][0]
+        assert TradingBotV6._BTC_TREND_KEY in requests
+        assert len(requests) == 7
+        assert set(frames) == {'ETH/USDT', 'SOL/USDT'}
+        assert len(btc_df) == 60
+
+    def test_btc_omitted_when_filter_disabled(self, mock_bot, monkeypatch):
+        monkeypatch.setattr(Config, 'BTC_TREND_FILTER_ENABLED', False)
+        mock_bot.data_provider.fetch_ohlcv_batch = MagicMock(side_effect=_batch)
+
+        _, btc_df = mock_bot._prefetch_scan_data(['ETH/USDT'])
+
+        requests = mock_bot.data_provider.fetch_ohlcv_batch.call_args[0][0]
+        assert TradingBotV6._BTC_TREND_KEY not in requests
+        assert btc_df is None
+
+    def test_btc_trend_uses_prefetched_frame(self, mock_bot):
+        mock_bot.data_provider.fetch_ohlcv = MagicMock()
+        btc_df = pd.DataFrame({'close': np.linspace(90000, 100000, 60)})
+
+        assert mock_bot._check_btc_trend(btc_df) == 'LONG'
+        mock_bot.data_provider.fetch_ohlcv.assert_not_called()
+
+
+class TestScanRiskCheck:
+
+    def test_total_risk_checked_once_without_new_trades(self, mock_bot, monkeypatch):
+        monkeypatch.setattr(Config, 'USE_SCANNER_SYMBOLS', False)
+        monkeypatch.setattr(Config, 'SYMBOLS', ['ETH/USDT', 'SOL/USDT', 'XRP/USDT'])
+        monkeypatch.setattr(Config, 'SYMBOL_LOSS_COOLDOWN_HOURS', 0)
+        empty = {s: (pd.DataFrame(), pd.DataFrame(), pd.DataFrame()) for s in Config.SYMBOLS}
+        mock_bot._prefetch_scan_data = MagicMock(return_value=(empty, None))
+        mock_bot._check_total_risk = MagicMock(return_value=True)
+
+        mock_bot.scan_for_signals()
+
+        mock_bot._check_total_risk.assert_called_once()
+
+
+class TestSignalPriority:
+
+    def test_min_picks_highest_priority(self):
+        found = [('EMA_PULLBACK', {}), ('VOLUME_BREAKOUT', {}), ('2B', {}), ('UNKNOWN', {})]
+        assert min(found, key=TradingBotV6._signal_rank)[0] == '2B'
+        assert min(found[:2], key=TradingBotV6._signal_rank)[0] == 'VOLUME_BREAKOUT'
+        assert TradingBotV6._signal_rank(('UNKNOWN', {})) == 99
+
+
+class TestStartupDiagnostics:
+
+    def test_timeframes_fetched_in_one_batch(self, mock_bot, monkeypatch):
+        monkeypatch.setattr(Config, 'V6_DRY_RUN', True)
+        monkeypatch.setattr(Config, 'validate', classmethod(lambda cls: None))
+        mock_bot.data_provider.fetch_ohlcv_batch = MagicMock(side_effect=_batch)
+        mock_bot.data_provider.fetch_ohlcv = MagicMock()
+
+        assert mock_bot.startup_diagnostics() is True
+
+        mock_bot.data_provider.fetch_ohlcv_batch.assert_called_once()
+        mock_bot.data_provider.fetch_ohlcv.assert_not_called()
+        assert len(mock_bot.data_provider.fetch_ohlcv_batch.call_args[0][0]) == 2
+
+    def test_account_queries_overlap_ohlcv(self, mock_bot, monkeypatch):
+        monkeypatch.setattr(Config, 'V6_DRY_RUN', False)
+        monkeypatch.setattr(Config, 'validate', classmethod(lambda cls: None))
+        both_started = threading.Barrier(2, timeout=2)
+
+        def balance():
+            both_started.wait()  # K 線批次同時在途才會通過
+            return 1234.0
+
+        def batch(requests, max_concurrency=8):
+            both_started.wait()
+            return _batch(requests)
+
+        mock_bot.risk_manager.get_balance = MagicMock(side_effect=balance)
+        mock_bot.risk_manager.get_positions = MagicMock(return_value=[])
+        mock_bot.data_provider.fetch_ohlcv_batch = MagicMock(side_effect=batch)
+
+        assert mock_bot.startup_diagnostics() is True
+        assert mock_bot.initial_balance == 1234.0
+        mock_bot._prefetch_pool.shutdown(wait=True)
+        mock_bot.risk_manager.get_positions.assert_called_once()
+
+    def test_timeframes_from_config(self, mock_bot, monkeypatch):
+        monkeypatch.setattr(Config, 'V6_DRY_RUN', True)
+        monkeypatch.setattr(Config, 'validate', classmethod(lambda cls: None))
+        monkeypatch.setattr(Config, 'SYMBOLS', ['ETH/USDT'])
+        monkeypatch.setattr(Config, 'DIAGNOSTIC_TIMEFRAMES', (('15m', 50), ('4h', 20), ('1d', 10)))
+        mock_bot.data_provider.fetch_ohlcv_batch = MagicMock(side_effect=_batch)
+
+        assert mock_bot.startup_diagnostics() is True
+
+        requests = mock_bot.data_provider.fetch_ohlcv_batch.call_args[0][0]
+        assert requests == [('ETH/USDT', '15m', 50), ('ETH/USDT', '4h', 20), ('ETH/USDT', '1d', 10)]
+
@@ -0,0 +1,72 @@
+"""
+Test: Scanner JSON 載入（load_scanner_results）
+
+- 正常載入 hot_symbols
+- 檔案未變更（mtime 相同）→ 不重新解析
+- 檔案更新 → 重新解析
+- 資料過期 → fallback 到 Config.SYMBOLS
+"""
+
+import json
+import os
+import sys
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from trader.bot import TradingBotV6
+from trader.config import Config
+
+
+def _write_scanner_json(path: Path, symbols, scan_time=None, mtime_ns=None):
+    scan_time = scan_time or datetime.now(timezone.utc)
+    path.write_text(json.dumps({
+        'scan_time': scan_time.isoformat(),
+        'hot_symbols': [{'symbol': s} for s in symbols],
+    }), encoding='utf-8')
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestLoadScannerResults:
+
+    def test_loads_symbols(self, mock_bot, tmp_path, monkeypatch):
+        path = tmp_path / 'hot_symbols.json'
+        _write_scanner_json(path, ['SOL/USDT', 'ETH/USDT'])
+        monkeypatch.setattr(Config, 'SCANNER_JSON_PATH', str(path))
+
+        assert mock_bot.load_scanner_results() == ['SOL/USDT', 'ETH/USDT']
+
+    def test_unchanged_file_not_reparsed(self, mock_bot, tmp_path, monkeypatch):
+        path = tmp_path / 'hot_symbols.json'
+        _write_scanner_json(path, ['SOL/USDT'])
+        monkeypatch.setattr(Config, 'SCANNER_JSON_PATH', str(path))
+
+        with patch.object(TradingBotV6, '_parse_scanner_file',
+                          wraps=TradingBotV6._parse_scanner_file) as parse:
+            mock_bot.load_scanner_results()
+            mock_bot.load_scanner_results()
+            assert parse.call_count == 1
+
+    def test_modified_file_reparsed(self, mock_bot, tmp_path, monkeypatch):
+        path = tmp_path / 'hot_symbols.json'
+        _write_scanner_json(path, ['SOL/USDT'], mtime_ns=1_000_000_000)
+        monkeypatch.setattr(Config, 'SCANNER_JSON_PATH', str(path))
+        assert mock_bot.load_scanner_results() == ['SOL/USDT']
+
+        _write_scanner_json(path, ['ETH/USDT'], mtime_ns=2_000_000_000)
+        assert mock_bot.load_scanner_results() == ['ETH/USDT']
+
+    def test_stale_file_falls_back(self, mock_bot, tmp_path, monkeypatch):
+        path = tmp_path / 'hot_symbols.json'
+        old = datetime.now(timezone.utc) - timedelta(minutes=Config.SCANNER_MAX_AGE_MINUTES + 5)
+        _write_scanner_json(path, ['SOL/USDT'], scan_time=old)
+        monkeypatch.setattr(Config, 'SCANNER_JSON_PATH', str(path))
+
+        assert mock_bot.load_scanner_results() == Config.SYMBOLS
+
+    def test_missing_file_falls_back(self, mock_bot, tmp_path, monkeypatch):
+        monkeypatch.setattr(Config, 'SCANNER_JSON_PATH', str(tmp_path / 'nope.json'))
+        assert mock_bot.load_scanner_results() == Config.SYMBOLS
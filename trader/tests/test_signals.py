@@ -4,6 +4,7 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+import numpy as np
 import pytest
 import pandas as pd
 from trader.signals import detect_2b_with_pivots
@@ -130,6 +131,33 @@ class TestFilters:
         assert has == False
 
 
+class TestMissingVolMa:
+    """vol_ma 為 NaN（暖機）或 0 → 量比 0，不除以 0、不被分成 explosive"""
+
+    def test_nan_vol_ma_ratio_zero(self):
+        df = _make_df(BULLISH_HIGHS, BULLISH_LOWS, BULLISH_CLOSES, vol_ma_val=np.nan)
+        df['volume'] = 150.0
+        has, det = detect_2b_with_pivots(df, left_bars=5, right_bars=2, vol_minimum_threshold=0.0)
+        assert has == True
+        assert det['vol_ratio'] == 0.0
+        assert det['signal_strength'] == 'weak'
+
+    def test_zero_vol_ma_not_explosive(self):
+        df = _make_df(BULLISH_HIGHS, BULLISH_LOWS, BULLISH_CLOSES, vol_ma_val=0.0)
+        df['volume'] = 150.0
+        has, det = detect_2b_with_pivots(df, left_bars=5, right_bars=2, vol_minimum_threshold=0.0)
+        assert has == True
+        assert det['vol_ratio'] == 0.0
+        assert det['signal_strength'] == 'weak'
+
+    @pytest.mark.parametrize('vol_ma_val', [np.nan, 0.0])
+    def test_without_grading_not_rejected(self, vol_ma_val):
+        df = _make_df(BULLISH_HIGHS, BULLISH_LOWS, BULLISH_CLOSES, vol_ma_val=vol_ma_val)
+        df['volume'] = 150.0
+        has, _ = detect_2b_with_pivots(df, left_bars=5, right_bars=2, enable_volume_grading=False)
+        assert has == True
+
+
 class TestEdgeCases:
     """Edge cases"""
 
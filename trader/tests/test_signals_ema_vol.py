@@ -6,7 +6,7 @@ import pytest
 import pandas as pd
 import numpy as np
 
-from trader.signals import detect_ema_pullback, detect_volume_breakout
+from trader.signals import detect_ema_pullback, detect_volume_breakout, scan_fast_signals
 
 
 def _make_df(rows: int = 40, **overrides) -> pd.DataFrame:
@@ -187,3 +187,41 @@ class TestVolumeBreakout:
                 assert key in details, f"Missing key: {key}"
             # signal_strength 應固定為 strong
             assert details['signal_strength'] == 'strong'
+
+
+class TestScanFastSignals:
+    """EMA 回撤 + 量能突破單次評估"""
+
+    def test_01_both_signals_one_call(self):
+        """同一根 K 線同時觸發回撤與突破 → 兩者皆回傳"""
+        df = _make_df()
+        df.loc[df.index[-2], 'low'] = 100.0
+        df.loc[df.index[-1], 'open'] = 101.0
+        df.loc[df.index[-1], 'close'] = 103.0
+        df.loc[df.index[-1], 'volume'] = 3000.0
+
+        result = scan_fast_signals(df, volume_breakout_mult=2.0)
+        has_pb, pb = result['EMA_PULLBACK']
+        has_bo, bo = result['VOLUME_BREAKOUT']
+        assert has_pb is True and pb['side'] == 'LONG'
+        assert has_bo is True and bo['side'] == 'LONG'
+        assert pb['target_ref'] == pytest.approx(102.0)
+        assert bo['lowest_point'] == pytest.approx(98.0)
+        assert bo['stop_level'] == pytest.approx(98.0 - 0.5)
+
+    def test_02_include_limits_output(self):
+        """include 只組裝指定信號"""
+        df = _make_df()
+        df.loc[df.index[-1], 'open'] = 101.0
+        df.loc[df.index[-1], 'close'] = 103.0
+        df.loc[df.index[-1], 'volume'] = 3000.0
+
+        result = scan_fast_signals(df, include=('EMA_PULLBACK',))
+        assert result['VOLUME_BREAKOUT'] == (False, None)
+
+    def test_03_nan_ema_warmup_no_signal(self):
+        """EMA 暖機區為 NaN → 不出回撤信號"""
+        df = _make_df(ema_fast=[np.nan] * 40, ema_slow=[np.nan] * 40)
+        df.loc[df.index[-2], 'low'] = 100.0
+        has_signal, _ = scan_fast_signals(df)['EMA_PULLBACK']
+        assert has_signal is False
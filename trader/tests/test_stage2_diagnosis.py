@@ -5,6 +5,8 @@ Stage 2 診斷測試
 1. V6 timeout 用 V6_STAGE1_MAX_HOURS (36h) 而非 STAGE1_MAX_HOURS (24h)
 2. Stage 2 trigger 診斷 logging
 """
+import logging
+import time
 import pytest
 from datetime import datetime, timezone, timedelta
 from unittest.mock import MagicMock, patch
@@ -12,6 +14,7 @@ import pandas as pd
 
 from trader.strategies.v6_pyramid import V6PyramidStrategy
 from trader.config import ConfigV6 as Cfg
+from trader.positions import PositionManager
 
 
 def make_pm(entry_time_offset_hours: float, neckline: float = 105.0,
@@ -33,6 +36,7 @@ def make_pm(entry_time_offset_hours: float, neckline: float = 105.0,
     pm.symbol = 'TEST/USDT'
     pm.monitor_count = 0
     pm.entry_time = datetime.now(timezone.utc) - timedelta(hours=entry_time_offset_hours)
+    pm.entry_monotonic = time.monotonic() - (datetime.now(timezone.utc) - pm.entry_time).total_seconds()
     # V53 timeout 條件：not pm.is_first_partial — 需明確設為 False 才能觸發
     pm.is_first_partial = False
     pm.is_second_partial = False
@@ -156,3 +160,28 @@ class TestStage2TriggerDiagnosis:
         # 45% pullback < 55% threshold → profit_pullback 不觸發 → Stage 2 應觸發
         assert decision['action'] == 'ADD'
         assert decision['add_stage'] == 2
+
+
+class TestStage2CheckLogging:
+    """PositionManager.check_stage2_trigger 的延遲格式化診斷訊息"""
+
+    def _pm(self, neckline=105.0):
+        return PositionManager(
+            symbol='TEST/USDT', side='LONG', entry_price=100.0,
+            stop_loss=98.0, position_size=1.0, neckline=neckline,
+        )
+
+    def test_fail_reason_rendered(self, caplog):
+        pm = self._pm()
+        with caplog.at_level(logging.DEBUG, logger='trader.positions'):
+            assert pm.check_stage2_trigger(make_df_1h(close=104.0)) is False
+        assert any(
+            'Stage2Check: FAIL neckline close=$104.00 <= neckline=$105.00 (gap=$1.00)' in msg
+            for msg in caplog.messages
+        )
+
+    def test_skip_without_neckline(self, caplog):
+        pm = self._pm(neckline=None)
+        with caplog.at_level(logging.DEBUG, logger='trader.positions'):
+            assert pm.check_stage2_trigger(make_df_1h()) is False
+        assert any('SKIP stage=1 neckline=None' in msg for msg in caplog.messages)
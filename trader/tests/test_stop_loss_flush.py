@@ -0,0 +1,105 @@
+"""
+Test: monitor 週期內的硬止損更新合併
+
+- SL 更新延到本輪結束才送出（每個持倉一組 cancel + place）
+- 同輪加倉 / 減倉已重掛止損 → 不再重複送出
+- 已平倉的持倉不送出
+- 多個持倉的更新並行送出（thread pool 跨輪重用）
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from trader.tests.conftest import make_pm
+
+
+def _bot_with_pm(mock_bot):
+    mock_bot.execution_engine = MagicMock()
+    mock_bot.execution_engine.place_hard_stop_loss.return_value = 'new_stop'
+    pm = make_pm(symbol='BTC/USDT', side='LONG', entry_price=50000.0, stop_loss=48000.0)
+    pm.stop_order_id = 'old_stop'
+    mock_bot.active_trades['BTC/USDT'] = pm
+    return pm
+
+
+class TestFlushStopLossUpdates:
+
+    def test_pending_update_sent_once(self, mock_bot):
+        pm = _bot_with_pm(mock_bot)
+        mock_bot._pending_sl['BTC/USDT'] = (pm, 49000.0)
+        mock_bot._flush_stop_loss_updates()
+        mock_bot._flush_stop_loss_updates()
+
+        mock_bot.execution_engine.update_hard_stop_loss.assert_called_once_with(pm, 49000.0)
+        assert mock_bot._pending_sl == {}
+
+    def test_refresh_supersedes_pending(self, mock_bot):
+        pm = _bot_with_pm(mock_bot)
+        mock_bot._pending_sl['BTC/USDT'] = (pm, 49000.0)
+        mock_bot._refresh_stop_loss(pm, 50000.0)
+        mock_bot._flush_stop_loss_updates()
+
+        mock_bot.execution_engine.update_hard_stop_loss.assert_not_called()
+        assert mock_bot.execution_engine.place_hard_stop_loss.call_count == 1
+        assert pm.stop_order_id == 'new_stop'
+
+    def test_closed_position_skipped(self, mock_bot):
+        pm = _bot_with_pm(mock_bot)
+        pm.is_closed = True
+        mock_bot._pending_sl['BTC/USDT'] = (pm, 49000.0)
+        mock_bot._flush_stop_loss_updates()
+
+        mock_bot.execution_engine.update_hard_stop_loss.assert_not_called()
+
+    def test_failure_does_not_block_others(self, mock_bot):
+        pm = _bot_with_pm(mock_bot)
+        other = make_pm(symbol='ETH/USDT', side='LONG', entry_price=3000.0, stop_loss=2900.0)
+        mock_bot.execution_engine.update_hard_stop_loss.side_effect = [RuntimeError('api'), None]
+        mock_bot._pending_sl = {'BTC/USDT': (pm, 49000.0), 'ETH/USDT': (other, 2950.0)}
+        mock_bot._flush_stop_loss_updates()
+
+        assert mock_bot.execution_engine.update_hard_stop_loss.call_count == 2
+
+    def test_multiple_positions_updated_concurrently(self, mock_bot):
+        import threading
+        import time
+
+        mock_bot.execution_engine = MagicMock()
+        lock = threading.Lock()
+        state = {'inflight': 0, 'peak': 0}
+
+        def slow_update(pm, new_sl):
+            with lock:
+                state['inflight'] += 1
+                state['peak'] = max(state['peak'], state['inflight'])
+            time.sleep(0.02)
+            with lock:
+                state['inflight'] -= 1
+            pm.stop_order_id = f'stop@{new_sl}'
+
+        mock_bot.execution_engine.update_hard_stop_loss.side_effect = slow_update
+        pms = {
+            f'S{i}/USDT': make_pm(symbol=f'S{i}/USDT', side='LONG', entry_price=100.0, stop_loss=90.0)
+            for i in range(4)
+        }
+        mock_bot._pending_sl = {s: (pm, 95.0) for s, pm in pms.items()}
+        mock_bot._flush_stop_loss_updates()
+
+        assert state['peak'] > 1
+        assert all(pm.stop_order_id == 'stop@95.0' for pm in pms.values())
+
+    def test_pool_reused_across_flushes(self, mock_bot):
+        mock_bot.execution_engine = MagicMock()
+        pms = [make_pm(symbol=f'S{i}/USDT', side='LONG', entry_price=100.0, stop_loss=90.0) for i in range(3)]
+
+        mock_bot._pending_sl = {pm.symbol: (pm, 95.0) for pm in pms}
+        mock_bot._flush_stop_loss_updates()
+        pool = mock_bot._stop_pool
+        mock_bot._pending_sl = {pm.symbol: (pm, 96.0) for pm in pms}
+        mock_bot._flush_stop_loss_updates()
+
+        assert pool is not None and mock_bot._stop_pool is pool
+        assert mock_bot.execution_engine.update_hard_stop_loss.call_count == 6
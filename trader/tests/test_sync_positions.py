@@ -135,3 +135,20 @@ class TestPendingStopCleanup:
         # 驗證 cancel 被呼叫 2 次
         assert mock_bot.execution_engine.cancel_stop_loss_order.call_count == 2
         assert 'SOL/USDT' not in mock_bot.active_trades
+
+
+class TestPrefetchExchangePositions:
+    """掃描期間背景預抓持倉"""
+
+    def test_prefetch_runs_in_background(self, mock_bot):
+        mock_bot.risk_manager.get_positions = MagicMock(return_value=[])
+        with patch('trader.bot.Config.V6_DRY_RUN', False):
+            future = mock_bot._prefetch_exchange_positions()
+        assert future.result(timeout=2) == []
+        mock_bot.risk_manager.get_positions.assert_called_once()
+
+    def test_dry_run_skips_prefetch(self, mock_bot):
+        mock_bot.risk_manager.get_positions = MagicMock()
+        with patch('trader.bot.Config.V6_DRY_RUN', True):
+            assert mock_bot._prefetch_exchange_positions() is None
+        mock_bot.risk_manager.get_positions.assert_not_called()
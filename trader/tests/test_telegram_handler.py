@@ -1,4 +1,5 @@
 """Tests for TelegramCommandHandler"""
+import threading
 from datetime import datetime, timezone, timedelta
 from unittest.mock import patch, MagicMock, PropertyMock
 import pytest
@@ -79,8 +80,8 @@ class TestTelegramCommands:
 
 class TestTelegramSecurity:
 
-    @patch('trader.infrastructure.telegram_handler.requests.get')
-    @patch('trader.infrastructure.telegram_handler.requests.post')
+    @patch('trader.infrastructure.notifier._TELEGRAM_SESSION.get')
+    @patch('trader.infrastructure.notifier._TELEGRAM_SESSION.post')
     def test_ignores_wrong_chat_id(self, mock_post, mock_get, handler):
         """只回應 Config.TELEGRAM_CHAT_ID"""
         mock_get.return_value = MagicMock(
@@ -100,8 +101,8 @@ class TestTelegramSecurity:
             handler.poll()
         mock_post.assert_not_called()
 
-    @patch('trader.infrastructure.telegram_handler.requests.get')
-    @patch('trader.infrastructure.telegram_handler.requests.post')
+    @patch('trader.infrastructure.notifier._TELEGRAM_SESSION.get')
+    @patch('trader.infrastructure.notifier._TELEGRAM_SESSION.post')
     def test_responds_correct_chat_id(self, mock_post, mock_get, handler):
         """正確 chat_id 會回覆"""
         mock_get.return_value = MagicMock(
@@ -122,7 +123,7 @@ class TestTelegramSecurity:
             handler.poll()
         mock_post.assert_called_once()
 
-    @patch('trader.infrastructure.telegram_handler.requests.get')
+    @patch('trader.infrastructure.notifier._TELEGRAM_SESSION.get')
     def test_ignores_non_command(self, mock_get, handler):
         """非 / 開頭的訊息不處理"""
         mock_get.return_value = MagicMock(
@@ -145,7 +146,7 @@ class TestTelegramSecurity:
 
 class TestTelegramPolling:
 
-    @patch('trader.infrastructure.telegram_handler.requests.get')
+    @patch('trader.infrastructure.notifier._TELEGRAM_SESSION.get')
     def test_updates_last_update_id(self, mock_get, handler):
         """update_id 會遞增，避免重複處理"""
         mock_get.return_value = MagicMock(
@@ -169,6 +170,61 @@ class TestTelegramPolling:
         """TELEGRAM_ENABLED=False 時不 poll"""
         with patch('trader.infrastructure.telegram_handler.Config') as mock_cfg:
             mock_cfg.TELEGRAM_ENABLED = False
-            with patch('trader.infrastructure.telegram_handler.requests.get') as mock_get:
+            with patch('trader.infrastructure.notifier._TELEGRAM_SESSION.get') as mock_get:
                 handler.poll()
                 mock_get.assert_not_called()
+
+    @patch('trader.infrastructure.notifier._TELEGRAM_SESSION.get')
+    @patch('trader.infrastructure.notifier._TELEGRAM_SESSION.post')
+    def test_poll_and_notify_share_session(self, mock_post, mock_get, handler):
+        """getUpdates / 回覆 / 通知走同一個 keep-alive Session"""
+        from trader.infrastructure.notifier import TelegramNotifier
+        mock_get.return_value = MagicMock(ok=True, json=lambda: {'result': []})
+        with patch('trader.infrastructure.telegram_handler.Config') as mock_cfg, \
+             patch('trader.infrastructure.notifier.Config') as mock_notifier_cfg:
+            mock_cfg.TELEGRAM_ENABLED = True
+            mock_notifier_cfg.TELEGRAM_ENABLED = True
+            handler.poll()
+            handler._send_reply('12345', 'hi')
+            TelegramNotifier.send_message('hello')
+        mock_get.assert_called_once()
+        assert mock_post.call_count == 2
+
+
+class TestTelegramThread:
+
+    def test_start_disabled(self, handler):
+        with patch('trader.infrastructure.telegram_handler.Config') as mock_cfg:
+            mock_cfg.TELEGRAM_ENABLED = False
+            assert handler.start() is False
+        assert handler._thread is None
+
+    def test_thread_polls_until_stopped(self, handler):
+        polled = threading.Event()
+        with patch('trader.infrastructure.telegram_handler.Config') as mock_cfg, \
+             patch.object(handler, 'poll', side_effect=lambda *_: polled.set()):
+            mock_cfg.TELEGRAM_ENABLED = True
+            assert handler.start() is True
+            thread = handler._thread
+            assert polled.wait(timeout=2)
+            handler.stop()
+            thread.join(timeout=2)
+        assert not thread.is_alive()
+
+    @patch('trader.infrastructure.notifier._TELEGRAM_SESSION.get')
+    def test_long_poll_waits_server_side(self, mock_get, handler):
+        mock_get.return_value = MagicMock(ok=True, json=lambda: {'result': []})
+        with patch('trader.infrastructure.telegram_handler.Config') as mock_cfg:
+            mock_cfg.TELEGRAM_ENABLED = True
+            assert handler.poll(handler.LONG_POLL_SECONDS) is True
+        _, kwargs = mock_get.call_args
+        assert kwargs['params']['timeout'] == handler.LONG_POLL_SECONDS
+        assert kwargs['timeout'] > handler.LONG_POLL_SECONDS
+
+    @patch('trader.infrastructure.notifier._TELEGRAM_SESSION.get')
+    def test_http_error_reports_failure(self, mock_get, handler):
+        """失敗回傳 False，讓執行緒退避而不是立即重打"""
+        mock_get.return_value = MagicMock(ok=False, status_code=409)
+        with patch('trader.infrastructure.telegram_handler.Config') as mock_cfg:
+            mock_cfg.TELEGRAM_ENABLED = True
+            assert handler.poll(handler.LONG_POLL_SECONDS) is False
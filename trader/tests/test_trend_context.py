@@ -0,0 +1,62 @@
+"""
+Test: 趨勢 / MTF 判斷快取（TradingBotV6._cached_context）
+
+- 同一根 K 線、OHLC 未變的快照沿用上次結果
+- 形成中 K 線價格變動或換新 K 線 → 重算
+- K 線開盤超過 2 個週期的快取在掃描開始時移除
+"""
+
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+
+def _frame(close_last: float = 105.0, rows: int = 60, end_ms: int | None = None) -> pd.DataFrame:
+    end_ms = end_ms if end_ms is not None else int(time.time() * 1000) // 3_600_000 * 3_600_000
+    close = np.linspace(100.0, 104.0, rows)
+    close[-1] = close_last
+    return pd.DataFrame({
+        'timestamp': pd.to_datetime(end_ms - np.arange(rows)[::-1] * 3_600_000, unit='ms'),
+        'open': close, 'high': close + 1, 'low': close - 1, 'close': close,
+        'volume': np.full(rows, 1000.0),
+    })
+
+
+class TestTrendContextCache:
+
+    def test_same_snapshot_reuses_result(self, mock_bot):
+        compute = MagicMock(return_value=(True, 'ok', False))
+        for _ in range(3):
+            result = mock_bot._cached_context(('market',), 'BTC/USDT', '1h', _frame(), compute)
+        assert result == (True, 'ok', False)
+        compute.assert_called_once()
+
+    def test_forming_bar_change_recomputes(self, mock_bot):
+        compute = MagicMock(return_value=(True, 'ok', False))
+        mock_bot._cached_context(('market',), 'BTC/USDT', '1h', _frame(105.0), compute)
+        mock_bot._cached_context(('market',), 'BTC/USDT', '1h', _frame(106.0), compute)
+        assert compute.call_count == 2
+
+    def test_kind_and_symbol_are_separate(self, mock_bot):
+        compute = MagicMock(return_value=(True, 'ok'))
+        df = _frame()
+        mock_bot._cached_context(('mtf', 'LONG'), 'BTC/USDT', '1h', df, compute)
+        mock_bot._cached_context(('mtf', 'SHORT'), 'BTC/USDT', '1h', df, compute)
+        mock_bot._cached_context(('mtf', 'LONG'), 'ETH/USDT', '1h', df, compute)
+        assert compute.call_count == 3
+
+    def test_prune_drops_old_bars(self, mock_bot):
+        now_ms = int(time.time() * 1000)
+        compute = MagicMock(return_value=(True, 'ok'))
+        mock_bot._cached_context(('market',), 'OLD/USDT', '1h', _frame(end_ms=now_ms - 3 * 3_600_000), compute)
+        mock_bot._cached_context(('market',), 'NEW/USDT', '1h', _frame(end_ms=now_ms), compute)
+
+        mock_bot._prune_trend_context()
+
+        assert [key[1] for key in mock_bot._trend_context] == ['NEW/USDT']
@@ -0,0 +1,73 @@
+"""
+Test: UserDataStream 推播 → RiskManager 快取
+
+- ACCOUNT_UPDATE / 成交 → invalidate()
+- 未成交的訂單狀態更新不影響快取
+- 串流連線中放寬 TTL，斷線立即清快取並回到短 TTL
+- websocket-client 未安裝時 start() 回傳 False
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from trader.config import Config
+from trader.infrastructure import user_stream as user_stream_mod
+from trader.infrastructure.user_stream import UserDataStream
+from trader.risk.manager import RiskManager
+
+
+def _stream():
+    risk_manager = MagicMock()
+    return UserDataStream(MagicMock(), risk_manager, sandbox=True), risk_manager
+
+
+class TestHandleEvent:
+
+    def test_account_update_invalidates(self):
+        stream, rm = _stream()
+        stream.handle_event({'e': 'ACCOUNT_UPDATE', 'a': {'B': [], 'P': []}})
+        rm.invalidate.assert_called_once()
+
+    def test_fill_invalidates(self):
+        stream, rm = _stream()
+        stream.handle_event({'e': 'ORDER_TRADE_UPDATE', 'o': {'s': 'BTCUSDT', 'X': 'FILLED'}})
+        rm.invalidate.assert_called_once()
+
+    def test_new_order_ignored(self):
+        stream, rm = _stream()
+        stream.handle_event({'e': 'ORDER_TRADE_UPDATE', 'o': {'s': 'BTCUSDT', 'X': 'NEW'}})
+        rm.invalidate.assert_not_called()
+
+    def test_raw_message_parsed(self):
+        stream, rm = _stream()
+        stream._on_message(None, '{"e": "ACCOUNT_UPDATE"}')
+        stream._on_message(None, 'not json')
+        rm.invalidate.assert_called_once()
+
+    def test_start_without_websocket_client(self, monkeypatch):
+        monkeypatch.setattr(user_stream_mod, 'websocket', None)
+        stream, _ = _stream()
+        assert stream.start() is False
+
+
+class TestStreamAwareCache:
+
+    def test_ttl_extended_while_connected(self, monkeypatch):
+        monkeypatch.setattr(Config, 'ACCOUNT_CACHE_TTL_SECONDS', 0)
+        rm = RiskManager(MagicMock(), MagicMock())
+        rm.set_stream_connected(True)
+        with patch.object(rm, '_fetch_balance', return_value=1000.0) as fetch:
+            rm.get_balance()
+            rm.get_balance()
+        assert fetch.call_count == 1
+
+    def test_disconnect_invalidates(self):
+        rm = RiskManager(MagicMock(), MagicMock())
+        rm.set_stream_connected(True)
+        with patch.object(rm, '_fetch_balance', side_effect=[1000.0, 900.0]):
+            assert rm.get_balance() == 1000.0
+            rm.set_stream_connected(False)
+            assert rm.get_balance() == 900.0
@@ -90,3 +90,31 @@ class TestV53DeadzoneFix:
         # ATR trailing: highest(118) - atr(2.0) * ATR_MULT(1.5) = 115
         # 115 > current_sl(110) -> trailed
         assert pm.current_sl == pytest.approx(115.0, abs=0.5)
+
+
+class TestRLadderPrecompute:
+    """R 階梯預先換算為價位後，觸發點與新 SL 應與逐 tick 除法版本一致"""
+
+    @pytest.mark.parametrize('side,entry,sl', [('LONG', 100.0, 90.0), ('SHORT', 100.0, 110.0),
+                                               ('LONG', 0.1234, 0.1187), ('SHORT', 2.5, 2.61)])
+    def test_matches_r_multiple(self, side, entry, sl):
+        r_unit = abs(entry - sl)
+        sign = 1 if side == 'LONG' else -1
+        for k, reason, expected_sl in [(1.0, 'V53_1R_PROTECT', 0.3),
+                                       (1.5, 'V53_REDUCE_15R', 1.0),
+                                       (2.0, 'V53_REDUCE_25R', 1.5)]:
+            pm = _make_pm_v53(side=side, entry=entry, sl=sl)
+            pm.monitor_count = 0
+            price = entry + sign * r_unit * k
+            decision = pm.monitor(price, None, None)
+            assert decision['reason'] == reason
+            assert decision['new_sl'] == pytest.approx(entry + sign * r_unit * expected_sl)
+
+    def test_ladder_follows_avg_entry_change(self):
+        pm = _make_pm_v53(side='LONG', entry=100.0, sl=90.0)
+        pm.monitor(100.0, None, None)
+        pm.avg_entry = 200.0
+        pm.risk_dist = 10.0
+        pm.current_sl = 190.0
+        decision = pm.monitor(205.0, None, None)
+        assert decision['new_sl'] is None
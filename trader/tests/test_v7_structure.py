@@ -1,5 +1,6 @@
 """V7 StructureStrategy unit tests"""
 
+import time
 import pytest
 import pandas as pd
 import numpy as np
@@ -35,6 +36,7 @@ def make_pm(
     pm.strategy_name = 'v7_structure'
     pm.monitor_count = monitor_count
     pm.entry_time = entry_time or datetime.now(timezone.utc)
+    pm.entry_monotonic = time.monotonic() - (datetime.now(timezone.utc) - pm.entry_time).total_seconds()
     pm.entries = [MagicMock(price=entry_price)]
     pm.exit_reason = None
     pm.reverse_2b_depth_atr = None
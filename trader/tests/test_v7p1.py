@@ -75,7 +75,7 @@ class TestApiWeightTracking:
         mock_response = MagicMock()
         mock_response.headers = {'X-MBX-USED-WEIGHT-1M': '1900'}
 
-        with patch('requests.get', return_value=mock_response):
+        with patch.object(client.session, 'get', return_value=mock_response):
             resp = client.signed_request('GET', '/fapi/v2/account')
 
         assert client._current_weight == 1900
@@ -90,7 +90,7 @@ class TestApiWeightTracking:
         mock_response = MagicMock()
         mock_response.headers = {}
 
-        with patch('requests.get', return_value=mock_response):
+        with patch.object(client.session, 'get', return_value=mock_response):
             client.signed_request('GET', '/fapi/v2/account')
 
         assert client._current_weight == 0
@@ -104,7 +104,7 @@ class TestApiWeightTracking:
         mock_response = MagicMock()
         mock_response.headers = {'X-MBX-USED-WEIGHT-1M': 'invalid'}
 
-        with patch('requests.get', return_value=mock_response):
+        with patch.object(client.session, 'get', return_value=mock_response):
             client.signed_request('GET', '/fapi/v2/account')
 
         assert client._current_weight == 0